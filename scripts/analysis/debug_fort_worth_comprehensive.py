@@ -4,15 +4,32 @@ Comprehensive Fort Worth database debugging script for SEEK Property Platform.
 Investigates why "Fort Worth, TX" is not finding matches in the Supabase database.
 """
 
-from supabase import create_client
+import asyncio
 import os
+
 from dotenv import load_dotenv
-import json
+from supabase import create_client
+
 
-def main():
-    # Load environment variables
-    load_dotenv()
-    client = create_client(os.getenv("SUPABASE_URL"), os.getenv("SUPABASE_SERVICE_KEY"))
+def search_cities(client, pattern):
+    """Cities matching one name pattern ("Fort Worth" exactly, anything else via ILIKE)"""
+    query = client.from_("cities").select("id, name, county, state")
+    if pattern == "Fort Worth":
+        return query.eq("name", pattern).execute()
+    return query.ilike("name", pattern).execute()
+
+async def search_city_patterns(client, patterns):
+    """Run search_cities for every pattern concurrently; failures are returned, not raised"""
+    return await asyncio.gather(
+        *(asyncio.to_thread(search_cities, client, pattern) for pattern in patterns),
+        return_exceptions=True,
+    )
+
+def main(client=None):
+    # Create Supabase client unless the caller shares one
+    if client is None:
+        load_dotenv()
+        client = create_client(os.getenv("SUPABASE_URL"), os.getenv("SUPABASE_SERVICE_KEY"))
     
     print("=" * 60)
     print("SEEK Property Platform - Fort Worth Database Debug")
@@ -21,7 +38,7 @@ def main():
     # 1. Check basic database connectivity
     print("\n1. Testing Database Connectivity...")
     try:
-        test_response = client.from("cities").select("id").limit(1).execute()
+        client.from_("cities").select("id").limit(1).execute()
         print("✓ Database connection successful")
     except Exception as e:
         print(f"✗ Database connection failed: {e}")
@@ -29,8 +46,9 @@ def main():
     
     # 2. Get total city count
     print("\n2. Getting Total City Count...")
+    total_cities = None
     try:
-        count_response = client.from("cities").select("*", count="exact").limit(1).execute()
+        count_response = client.from_("cities").select("id", count="exact", head=True).execute()
         total_cities = count_response.count
         print(f"Total cities in database: {total_cities}")
     except Exception as e:
@@ -38,13 +56,16 @@ def main():
     
     # 3. Sample some cities to understand the data format
     print("\n3. Sampling Cities to Understand Data Format...")
-    try:
-        sample_cities = client.from("cities").select("id, name, county, state").limit(10).execute()
-        print(f"Sample cities (showing {len(sample_cities.data)} of {total_cities}):")
-        for city in sample_cities.data:
-            print(f"  ID: {city.get('id')} | Name: '{city.get('name')}' | County: '{city.get('county')}' | State: '{city.get('state')}'")
-    except Exception as e:
-        print(f"Error getting sample cities: {e}")
+    if total_cities == 0:
+        print("No cities in database - nothing to sample")
+    else:
+        try:
+            sample_cities = client.from_("cities").select("id, name, county, state").limit(10).execute()
+            print(f"Sample cities (showing {len(sample_cities.data)} of {total_cities}):")
+            for city in sample_cities.data:
+                print(f"  ID: {city.get('id')} | Name: '{city.get('name')}' | County: '{city.get('county')}' | State: '{city.get('state')}'")
+        except Exception as e:
+            print(f"Error getting sample cities: {e}")
     
     # 4. Search for Fort Worth with different patterns
     print("\n4. Testing Various Fort Worth Search Patterns...")
@@ -62,28 +83,24 @@ def main():
         ("With TX", "%Fort Worth%TX%"),
     ]
     
-    for description, pattern in fort_worth_patterns:
-        try:
-            if pattern == "Fort Worth":
-                # Exact match
-                response = client.from("cities").select("id, name, county, state").eq("name", pattern).execute()
-            else:
-                # ILIKE pattern match
-                response = client.from("cities").select("id, name, county, state").ilike("name", pattern).execute()
-            
-            print(f"\n  {description} ('{pattern}'): {len(response.data)} matches")
-            for city in response.data[:5]:  # Show first 5 matches
-                print(f"    - ID: {city.get('id')} | Name: '{city.get('name')}' | County: '{city.get('county')}' | State: '{city.get('state')}'")
-            if len(response.data) > 5:
-                print(f"    ... and {len(response.data) - 5} more")
-                
-        except Exception as e:
-            print(f"  {description}: Error - {e}")
+    # The pattern queries are independent, so they are issued together
+    responses = asyncio.run(search_city_patterns(client, [pattern for _, pattern in fort_worth_patterns]))
+    
+    for (description, pattern), response in zip(fort_worth_patterns, responses, strict=True):
+        if isinstance(response, Exception):
+            print(f"  {description}: Error - {response}")
+            continue
+        
+        print(f"\n  {description} ('{pattern}'): {len(response.data)} matches")
+        for city in response.data[:5]:  # Show first 5 matches
+            print(f"    - ID: {city.get('id')} | Name: '{city.get('name')}' | County: '{city.get('county')}' | State: '{city.get('state')}'")
+        if len(response.data) > 5:
+            print(f"    ... and {len(response.data) - 5} more")
     
     # 5. Check if there are cities in Tarrant County (Fort Worth's county)
     print("\n5. Checking Cities in Tarrant County...")
     try:
-        tarrant_cities = client.from("cities").select("id, name, county, state").ilike("county", "%Tarrant%").limit(10).execute()
+        tarrant_cities = client.from_("cities").select("id, name, county, state").ilike("county", "%Tarrant%").limit(10).execute()
         print(f"Cities in Tarrant County: {len(tarrant_cities.data)} found")
         for city in tarrant_cities.data:
             print(f"  - Name: '{city.get('name')}' | County: '{city.get('county')}' | State: '{city.get('state')}'")
@@ -95,7 +112,7 @@ def main():
     variations = ["Ft Worth", "Ft. Worth", "FtWorth", "Fort-Worth"]
     for variation in variations:
         try:
-            response = client.from("cities").select("id, name, county, state").ilike("name", f"%{variation}%").execute()
+            response = client.from_("cities").select("id, name, county, state").ilike("name", f"%{variation}%").execute()
             if response.data:
                 print(f"  '{variation}': {len(response.data)} matches")
                 for city in response.data:
@@ -106,7 +123,7 @@ def main():
     # 7. Search for cities that start with 'F' to see naming patterns
     print("\n7. Sample Cities Starting with 'F'...")
     try:
-        f_cities = client.from("cities").select("id, name, county, state").ilike("name", "F%").limit(10).execute()
+        f_cities = client.from_("cities").select("id, name, county, state").ilike("name", "F%").limit(10).execute()
         print(f"Cities starting with 'F': {len(f_cities.data)} found")
         for city in f_cities.data:
             print(f"  - '{city.get('name')}' | County: '{city.get('county')}' | State: '{city.get('state')}'")
@@ -117,7 +134,7 @@ def main():
     print("\n8. Checking for Fort Worth Parcels...")
     try:
         # First try to find any Fort Worth city ID
-        fort_worth_cities = client.from("cities").select("id, name").ilike("name", "%Fort Worth%").execute()
+        fort_worth_cities = client.from_("cities").select("id, name").ilike("name", "%Fort Worth%").execute()
         
         if fort_worth_cities.data:
             for city in fort_worth_cities.data:
@@ -126,7 +143,7 @@ def main():
                 print(f"  Found city: '{city_name}' (ID: {city_id})")
                 
                 # Check for parcels in this city
-                parcel_count = client.from("parcels").select("*", count="exact").eq("city_id", city_id).limit(1).execute()
+                parcel_count = client.from_("parcels").select("id", count="exact", head=True).eq("city_id", city_id).execute()
                 print(f"    Parcels in '{city_name}': {parcel_count.count}")
         else:
             print("  No Fort Worth cities found to check parcels")
@@ -137,7 +154,7 @@ def main():
     print("\n9. Checking Cities Table Schema...")
     try:
         # Get a single record to see all available columns
-        schema_check = client.from("cities").select("*").limit(1).execute()
+        schema_check = client.from_("cities").select("*").limit(1).execute()
         if schema_check.data:
             columns = list(schema_check.data[0].keys())
             print(f"Cities table columns: {columns}")
@@ -7,10 +7,12 @@ from supabase import create_client
 import os
 from dotenv import load_dotenv
 
-def main():
-    # Load environment variables
-    load_dotenv()
-    client = create_client(os.getenv("SUPABASE_URL"), os.getenv("SUPABASE_SERVICE_KEY"))
+def main(client=None):
+    """Run the quick Fort Worth diagnosis; returns False when the cities table is unreachable or empty."""
+    # Create Supabase client unless the caller shares one
+    if client is None:
+        load_dotenv()
+        client = create_client(os.getenv("SUPABASE_URL"), os.getenv("SUPABASE_SERVICE_KEY"))
     
     print("SEEK Property Platform - Fort Worth Database Debug")
     print("=" * 50)
@@ -23,7 +25,11 @@ def main():
             print(f"  - ID: {city.get('id')} | Name: '{city.get('name')}' | County ID: '{city.get('county_id')}'")
     except Exception as e:
         print(f"Error: {e}")
-        return
+        return False
+    
+    if not response.data:
+        print("No cities in database - this is a data problem, not a search problem")
+        return False
     
     # 2. Search for Fort Worth with exact match
     print("\n2. Exact 'Fort Worth' search:")
@@ -96,10 +102,12 @@ def main():
     # 8. Get total count
     print("\n8. Total cities in database:")
     try:
-        response = client.table("cities").select("*", count="exact").limit(1).execute()
+        response = client.table("cities").select("id", count="exact", head=True).execute()
         print(f"Total cities: {response.count}")
     except Exception as e:
         print(f"Error: {e}")
+    
+    return True
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
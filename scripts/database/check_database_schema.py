@@ -4,6 +4,7 @@ Database Schema Review Script for SEEK Property Platform
 Compares current Supabase schema against PROJECT_MEMORY.md specifications
 """
 
+import asyncio
 import os
 import sys
 from supabase import create_client
@@ -140,6 +141,18 @@ def check_rls_policies(supabase) -> Dict[str, List]:
         print(f"Error getting RLS policies: {e}")
         return {}
 
+def _table_readable(client, table_name: str) -> bool:
+    """True if a one-row select on the table succeeds with this client"""
+    try:
+        client.table(table_name).select('*').limit(1).execute()
+        return True
+    except Exception:
+        return False
+
+async def probe_tables_readable(client, table_names: List[str]) -> List[bool]:
+    """Run _table_readable for every table concurrently (one round-trip of latency overall)"""
+    return await asyncio.gather(*(asyncio.to_thread(_table_readable, client, table) for table in table_names))
+
 def analyze_schema():
     """Main function to analyze database schema"""
     print("🔍 SEEK Property Platform - Database Schema Review")
@@ -213,11 +226,11 @@ def analyze_schema():
             test_client = create_client(os.getenv("SUPABASE_URL"), os.getenv("SUPABASE_ANON_KEY"))
             rls_enabled = []
             
-            for table in actual_tables:
-                try:
-                    result = test_client.table(table).select('*').limit(1).execute()
+            readable = asyncio.run(probe_tables_readable(test_client, actual_tables))
+            for table, accessible in zip(actual_tables, readable, strict=True):
+                if accessible:
                     print(f"   • {table}: RLS may be disabled (accessible with anon key)")
-                except Exception:
+                else:
                     rls_enabled.append(table)
                     print(f"   • ✅ {table}: RLS appears enabled")
                     
@@ -6,15 +6,21 @@ Install and configure PostgreSQL trigram extension in Supabase for address simil
 
 import os
 import sys
+from pathlib import Path
 from dotenv import load_dotenv
 from supabase import create_client
 import logging
 
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from src.utils.retry import exec_with_retry
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-def setup_pg_trgm():
+def setup_pg_trgm(supabase=None):
     """Install and test pg_trgm extension in Supabase"""
     
     print("🎯 TASK 2.2: Setting up pg_trgm Extension for Fuzzy Matching")
@@ -27,18 +33,19 @@ def setup_pg_trgm():
     
     try:
         # Connect to Supabase with service key (required for extension installation)
-        supabase = create_client(
-            os.getenv('SUPABASE_URL'), 
-            os.getenv('SUPABASE_SERVICE_KEY')
-        )
+        if supabase is None:
+            supabase = create_client(
+                os.getenv('SUPABASE_URL'), 
+                os.getenv('SUPABASE_SERVICE_KEY')
+            )
         print("✅ Connected to Supabase database")
         
         # Step 1: Install pg_trgm extension
         print("\n📦 Installing pg_trgm extension...")
         try:
-            result = supabase.rpc('execute_sql', {
+            result = exec_with_retry(supabase.rpc('execute_sql', {
                 'sql': 'CREATE EXTENSION IF NOT EXISTS pg_trgm;'
-            }).execute()
+            }))
             print("✅ pg_trgm extension installed successfully")
         except Exception as e:
             # Try alternative approach using direct SQL execution
@@ -46,7 +53,7 @@ def setup_pg_trgm():
             print("   Attempting to check if extension already exists...")
             
             # Check if extension exists
-            check_result = supabase.table('pg_extension').select('extname').eq('extname', 'pg_trgm').execute()
+            check_result = exec_with_retry(supabase.table('pg_extension').select('extname').eq('extname', 'pg_trgm'))
             if check_result.data:
                 print("✅ pg_trgm extension already installed")
             else:
@@ -57,32 +64,24 @@ def setup_pg_trgm():
         # Step 2: Test trigram similarity functionality
         print("\n🧪 Testing trigram similarity functionality...")
         
-        # Test basic similarity function
+        # Run all similarity checks in a single round trip, one named column per test
         test_queries = [
-            {
-                'name': 'Basic similarity test',
-                'sql': "SELECT similarity('7445 E LANCASTER AVE', '7445 LANCASTER AVE') as sim_score"
-            },
-            {
-                'name': 'Address normalization test',
-                'sql': "SELECT similarity('222 W WALNUT ST STE 200', '222 W WALNUT ST') as sim_score"
-            },
-            {
-                'name': 'Street type variation test', 
-                'sql': "SELECT similarity('MAIN STREET', 'MAIN ST') as sim_score"
-            }
+            ('basic', 'Basic similarity test', "similarity('7445 E LANCASTER AVE', '7445 LANCASTER AVE')"),
+            ('addr_norm', 'Address normalization test', "similarity('222 W WALNUT ST STE 200', '222 W WALNUT ST')"),
+            ('street_type', 'Street type variation test', "similarity('MAIN STREET', 'MAIN ST')")
         ]
+        similarity_sql = "SELECT " + ", ".join(f"{expr} as {column}" for column, _, expr in test_queries)
         
-        for test in test_queries:
-            try:
-                result = supabase.rpc('execute_sql', {'sql': test['sql']}).execute()
-                if result.data:
-                    score = result.data[0].get('sim_score', 0)
-                    print(f"  {test['name']}: {score:.3f}")
+        try:
+            result = exec_with_retry(supabase.rpc('execute_sql', {'sql': similarity_sql}))
+            row = result.data[0] if result.data else {}
+            for column, name, _ in test_queries:
+                if column in row:
+                    print(f"  {name}: {row[column]:.3f}")
                 else:
-                    print(f"  {test['name']}: No result")
-            except Exception as e:
-                print(f"  {test['name']}: Error - {e}")
+                    print(f"  {name}: No result")
+        except Exception as e:
+            print(f"  Similarity tests: Error - {e}")
         
         # Step 3: Create a similarity search function for address matching
         print("\n🔧 Creating address similarity search function...")
@@ -112,7 +111,7 @@ def setup_pg_trgm():
         """
         
         try:
-            result = supabase.rpc('execute_sql', {'sql': similarity_function_sql}).execute()
+            result = exec_with_retry(supabase.rpc('execute_sql', {'sql': similarity_function_sql}))
             print("✅ Address similarity search function created")
         except Exception as e:
             print(f"⚠️  Function creation error: {e}")
@@ -127,24 +126,34 @@ def setup_pg_trgm():
             '1261 W GREEN OAKS BLVD'
         ]
         
-        for addr in test_addresses:
-            try:
-                # Test our new function
-                result = supabase.rpc('find_similar_addresses', {
-                    'target_address': addr,
-                    'similarity_threshold': 0.3,
-                    'max_results': 3
-                }).execute()
-                
+        # Fan the targets out server-side with LATERAL so every lookup shares one round trip
+        targets_sql = ", ".join("'" + addr.replace("'", "''") + "'" for addr in test_addresses)
+        batch_sql = f"""
+        WITH targets AS (
+            SELECT unnest(ARRAY[{targets_sql}]::text[]) AS target_address
+        )
+        SELECT t.target_address, sa.address, sa.similarity_score
+        FROM targets t
+        CROSS JOIN LATERAL find_similar_addresses(t.target_address, 0.3, 3) sa
+        """
+        
+        try:
+            result = exec_with_retry(supabase.rpc('execute_sql', {'sql': batch_sql}))
+            
+            matches_by_target = {addr: [] for addr in test_addresses}
+            for match in result.data or []:
+                matches_by_target.setdefault(match['target_address'], []).append(match)
+            
+            for addr, matches in matches_by_target.items():
                 print(f"\n  Testing: '{addr}'")
-                if result.data:
-                    for match in result.data:
+                if matches:
+                    for match in matches:
                         print(f"    → {match['address']} (score: {match['similarity_score']:.3f})")
                 else:
                     print(f"    → No similar addresses found")
                     
-            except Exception as e:
-                print(f"    → Function test error: {e}")
+        except Exception as e:
+            print(f"    → Function test error: {e}")
         
         # Step 5: Performance benchmark
         print("\n⚡ Performance benchmark...")
@@ -152,11 +161,11 @@ def setup_pg_trgm():
         
         try:
             start_time = time.time()
-            result = supabase.rpc('find_similar_addresses', {
+            result = exec_with_retry(supabase.rpc('find_similar_addresses', {
                 'target_address': '7445 E LANCASTER AVE',
                 'similarity_threshold': 0.2,
                 'max_results': 100
-            }).execute()
+            }))
             end_time = time.time()
             
             query_time = (end_time - start_time) * 1000  # Convert to milliseconds
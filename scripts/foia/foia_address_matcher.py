@@ -8,8 +8,7 @@ Phase 2 - Task 1.2: Multi-Tiered Address Matching System
 
 import pandas as pd
 import numpy as np
-from fuzzywuzzy import fuzz
-from fuzzywuzzy import process as fuzzprocess
+from rapidfuzz import fuzz
 import usaddress
 import re
 from typing import Dict, List, Tuple, Optional
@@ -13,16 +13,17 @@ import subprocess
 from pathlib import Path
 from datetime import datetime
 from dotenv import load_dotenv
-from supabase import create_client
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from src.utils.database import db_manager
 
 load_dotenv()
 
 def get_remaining_counties():
     """Get list of counties that still need to be imported."""
-    supabase = create_client(
-        os.getenv('SUPABASE_URL'),
-        os.getenv('SUPABASE_SERVICE_KEY')
-    )
+    supabase = db_manager.get_supabase_client()
     
     # Get counties with parcel data
     counties = supabase.table('counties').select('id, name').execute().data
@@ -163,10 +164,7 @@ def main():
     
     # Get final database status
     try:
-        supabase = create_client(
-            os.getenv('SUPABASE_URL'),
-            os.getenv('SUPABASE_SERVICE_KEY')
-        )
+        supabase = db_manager.get_supabase_client()
         final_result = supabase.table('parcels').select('id', count='exact').execute()
         
         print(f"\n🎯 FINAL DATABASE STATUS:")
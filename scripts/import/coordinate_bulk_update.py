@@ -49,7 +49,7 @@ class CoordinateBulkUpdater:
         
         # Statistics tracking
         self.stats = {
-            'start_time': datetime.now(),
+            'start_ns': time.perf_counter_ns(),  # monotonic run clock for elapsed time
             'counties_processed': 0,
             'records_updated': 0,
             'records_skipped': 0,
@@ -164,7 +164,7 @@ class CoordinateBulkUpdater:
         for attempt in range(self.max_retries):
             try:
                 # Process all updates in this batch
-                batch_start_time = time.time()
+                batch_start_ns = time.perf_counter_ns()
                 individual_success = 0
                 
                 for update in updates:
@@ -177,7 +177,7 @@ class CoordinateBulkUpdater:
                     except Exception as update_error:
                         self._log_progress(f"Failed to update parcel {update['id']}: {update_error}", "WARNING")
                 
-                batch_time = time.time() - batch_start_time
+                batch_time = (time.perf_counter_ns() - batch_start_ns) / 1e9
                 rate = individual_success / batch_time if batch_time > 0 else 0
                 
                 success_count = individual_success
@@ -258,7 +258,7 @@ class CoordinateBulkUpdater:
             
             # Progress reporting
             if batch_num % 10 == 0 or batch_num == total_batches:
-                elapsed = (datetime.now() - self.stats['start_time']).total_seconds()
+                elapsed = (time.perf_counter_ns() - self.stats['start_ns']) / 1e9
                 rate = total_success / elapsed if elapsed > 0 else 0
                 self._log_progress(f"Progress: {total_success}/{len(updates)} ({total_success/len(updates)*100:.1f}%) - Rate: {rate:.0f} updates/sec")
         
@@ -313,7 +313,7 @@ class CoordinateBulkUpdater:
     
     def print_final_summary(self, successful_counties: List[str], failed_counties: List[str]):
         """Print comprehensive final summary."""
-        elapsed = (datetime.now() - self.stats['start_time']).total_seconds()
+        elapsed = (time.perf_counter_ns() - self.stats['start_ns']) / 1e9
         
         print(f"\n{'='*80}")
         print("COORDINATE UPDATE SUMMARY")
@@ -21,6 +21,13 @@ from datetime import datetime
 import uuid
 from typing import Dict, List, Tuple, Optional
 import logging
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from src.api.property_search import invalidate_foia_statistics_cache
 
 # Setup logging
 logging.basicConfig(
@@ -309,6 +316,10 @@ class LewisvilleFOIAProcessor:
                 self.stats['failed_updates'] += 1
                 logger.error(f"  ✗ Error updating parcel {update['parcel_id']}: {e}")
 
+        # Coverage statistics are cached; drop them so the API reflects this import
+        if self.stats['successful_updates'] > 0:
+            invalidate_foia_statistics_cache()
+
     def create_audit_log(self, update: Dict):
         """
         Create audit log entry for the update
@@ -21,8 +21,8 @@ Features:
 import os
 import sys
 import csv
-import json
 import logging
+import orjson
 import pandas as pd
 import psutil
 import time
@@ -600,8 +600,14 @@ def main():
         
         # Save performance report
         report_filename = f'performance_report_{datetime.now().strftime("%Y%m%d_%H%M%S")}.json'
-        with open(report_filename, 'w') as f:
-            json.dump(performance_report, f, indent=2, default=str)
+        # Serialize once in orjson's C core, then hand the file a single buffered write
+        report_bytes = orjson.dumps(
+            performance_report,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+        )
+        with open(report_filename, 'wb', buffering=1 << 20) as f:
+            f.write(report_bytes)
         
         # Print summary
         logger.info("\n" + "=" * 60)
@@ -14,16 +14,17 @@ import subprocess
 from pathlib import Path
 from datetime import datetime
 from dotenv import load_dotenv
-from supabase import create_client
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from src.utils.database import db_manager
 
 load_dotenv()
 
 def identify_remaining_imports():
     """Identify which CSV files still need to be imported."""
-    supabase = create_client(
-        os.getenv('SUPABASE_URL'),
-        os.getenv('SUPABASE_SERVICE_KEY')
-    )
+    supabase = db_manager.get_supabase_client()
     
     print("🔍 IDENTIFYING REMAINING IMPORTS")
     print("=" * 50)
@@ -139,10 +140,7 @@ def main():
         print("\\n🎉 ALL CSV FILES ALREADY IMPORTED!")
         
         # Get final stats
-        supabase = create_client(
-            os.getenv('SUPABASE_URL'),
-            os.getenv('SUPABASE_SERVICE_KEY')
-        )
+        supabase = db_manager.get_supabase_client()
         total_parcels = supabase.table('parcels').select('id', count='exact').execute()
         print(f"Current database: {total_parcels.count:,} parcels")
         return True
@@ -219,10 +217,7 @@ def main():
     
     # Get final database status
     try:
-        supabase = create_client(
-            os.getenv('SUPABASE_URL'),
-            os.getenv('SUPABASE_SERVICE_KEY')
-        )
+        supabase = db_manager.get_supabase_client()
         final_result = supabase.table('parcels').select('id', count='exact').execute()
         final_counties = supabase.table('counties').select('id', count='exact').execute()
         
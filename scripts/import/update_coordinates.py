@@ -44,7 +44,7 @@ class CoordinateUpdater:
         
         # Statistics
         self.stats = {
-            'start_time': datetime.now(),
+            'start_ns': time.perf_counter_ns(),  # monotonic run clock for elapsed time
             'total_processed': 0,
             'coordinates_updated': 0,
             'parcels_not_found': 0,
@@ -269,14 +269,14 @@ class CoordinateUpdater:
             for county in failed:
                 print(f"  - {county}")
         
-        elapsed = (datetime.now() - self.stats['start_time']).total_seconds()
+        elapsed = (time.perf_counter_ns() - self.stats['start_ns']) / 1e9
         print(f"\nTotal time: {elapsed/60:.1f} minutes")
         print(f"Total coordinates updated: {self.stats['coordinates_updated']:,}")
         print(f"Average rate: {self.stats['coordinates_updated']/elapsed:.0f} updates/second")
     
     def print_summary(self) -> None:
         """Print final summary statistics."""
-        elapsed = (datetime.now() - self.stats['start_time']).total_seconds()
+        elapsed = (time.perf_counter_ns() - self.stats['start_ns']) / 1e9
         
         print(f"\n{'='*60}")
         print(f"📈 Coordinate Update Summary")
@@ -9,7 +9,8 @@ This script will:
 """
 
 import os
-import json
+import orjson
+from operator import itemgetter
 from typing import Dict, Any, List, Optional
 from supabase import create_client, Client
 from dotenv import load_dotenv
@@ -128,7 +129,7 @@ def sample_coordinate_data(supabase: Client, coordinate_columns: List[str],
                 numeric_columns = []
                 for col in all_columns:
                     # Check first few values to see if they're numeric
-                    values = [record.get(col) for record in sample.data[:10] if record.get(col) is not None]
+                    values = [v for v in map(itemgetter(col), sample.data[:10]) if v is not None]
                     if values:
                         try:
                             # Try to convert to float
@@ -152,7 +153,8 @@ def sample_coordinate_data(supabase: Client, coordinate_columns: List[str],
 
 def analyze_coordinate_column(data: List[Dict[str, Any]], column_name: str) -> Dict[str, Any]:
     """Analyze a specific coordinate column for data quality"""
-    values = [record.get(column_name) for record in data if record.get(column_name) is not None]
+    # Rows come from select("*"), so every record has the column; look it up once per row
+    values = [v for v in map(itemgetter(column_name), data) if v is not None]
     
     analysis = {
         'total_records': len(data),
@@ -327,8 +329,8 @@ def main():
         
         # Save detailed results to JSON file
         output_file = '/Users/davidcavise/Documents/Windsurf Projects/SEEK/coordinate_investigation_results.json'
-        with open(output_file, 'w') as f:
-            json.dump(report, f, indent=2, default=str)
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(report, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
         
         # Print summary
         print("\n📋 COORDINATE INVESTIGATION SUMMARY")
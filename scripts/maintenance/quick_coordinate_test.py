@@ -4,9 +4,16 @@ Quick test: Add coordinates to just 10 Fort Worth properties to test map display
 """
 
 import os
+import sys
+from pathlib import Path
 from supabase import create_client
 from dotenv import load_dotenv
 
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from scripts.utilities.fort_worth_city import get_fort_worth_id
+
 load_dotenv()
 client = create_client(os.getenv("SUPABASE_URL"), os.getenv("SUPABASE_SERVICE_KEY"))
 
@@ -27,17 +34,16 @@ sample_coordinates = [
 def update_sample_coordinates():
     print("🎯 Quick test: Adding coordinates to 10 Fort Worth properties...")
     
-    # Get Fort Worth city ID
-    cities = client.from("cities").select("id").ilike("name", "%Fort Worth%").execute()
-    if not cities.data:
+    # Get Fort Worth city ID (cached across runs)
+    city_id = get_fort_worth_id(client)
+    if city_id is None:
         print("❌ Fort Worth not found")
         return
     
-    city_id = cities.data[0]["id"]
     print(f"🏢 Fort Worth city ID: {city_id}")
     
     # Get 10 Fort Worth properties without coordinates
-    parcels = client.from("parcels").select("id, address").eq("city_id", city_id).is_("latitude", "null").limit(10).execute()
+    parcels = client.from_("parcels").select("id, address").eq("city_id", city_id).is_("latitude", "null").limit(10).execute()
     
     if not parcels.data:
         print("❌ No Fort Worth properties found")
@@ -51,7 +57,7 @@ def update_sample_coordinates():
         if i < len(sample_coordinates):
             lat, lng = sample_coordinates[i]
             
-            result = client.from("parcels").update({
+            result = client.from_("parcels").update({
                 "latitude": lat,
                 "longitude": lng
             }).eq("id", parcel["id"]).execute()
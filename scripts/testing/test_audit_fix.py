@@ -4,25 +4,50 @@ Test Fixed Audit Logging: Test with proper UUID formats
 """
 
 import os
+import sys
 import uuid
+from pathlib import Path
 from dotenv import load_dotenv
-from supabase import create_client
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from src.utils.database import db_manager
 
 load_dotenv()
 
-url = os.getenv('SUPABASE_URL')
-key = os.getenv('SUPABASE_SERVICE_KEY')
-supabase = create_client(url, key)
+# Process-wide client: scripts imported into the same run share its HTTP connection pool
+supabase = db_manager.get_supabase_client()
+
+# Progress output is only produced with VERBOSE set, and then written in one go;
+# errors are always written
+VERBOSE = bool(os.environ.get('VERBOSE'))
+_report_lines = []
+
+def report(message: str = ""):
+    """Queue a progress line (dropped unless VERBOSE is set)"""
+    if VERBOSE:
+        _report_lines.append(message)
+
+def report_error(message: str):
+    """Queue an error line, written whether or not VERBOSE is set"""
+    _report_lines.append(message)
+
+def flush_report():
+    """Write all queued progress lines with a single write"""
+    if _report_lines:
+        sys.stdout.write("\n".join(_report_lines) + "\n")
+        _report_lines.clear()
 
 def test_fixed_audit_logging():
     """Test audit logging with proper UUID formats"""
     
-    print("🔧 Testing Fixed Audit Logging...")
-    print("="*45)
+    report("🔧 Testing Fixed Audit Logging...")
+    report("="*45)
     
     try:
         # Test with proper UUID formats
-        print("\n1️⃣ Testing audit log insertion with proper UUIDs:")
+        report("\n1️⃣ Testing audit log insertion with proper UUIDs:")
         
         test_data = {
             'table_name': 'parcels',
@@ -35,66 +60,69 @@ def test_fixed_audit_logging():
             'session_id': str(uuid.uuid4())  # Proper UUID
         }
         
-        print(f"   📝 Inserting test audit log...")
-        print(f"   🆔 Session ID: {test_data['session_id']}")
+        report(f"   📝 Inserting test audit log...")
+        report(f"   🆔 Session ID: {test_data['session_id']}")
         
         insert_result = supabase.table('audit_logs').insert(test_data).execute()
         
         if insert_result.data:
             audit_id = insert_result.data[0]['id']
-            print(f"   ✅ Audit log created successfully!")
-            print(f"   📝 Audit Log ID: {audit_id}")
+            report(f"   ✅ Audit log created successfully!")
+            report(f"   📝 Audit Log ID: {audit_id}")
             
             # Verify the audit log was created correctly
-            verify_result = supabase.table('audit_logs').select('*').eq('id', audit_id).single().execute()
+            verify_result = supabase.table('audit_logs').select(
+                'table_name, operation, record_id, changed_fields, old_values, new_values'
+            ).eq('id', audit_id).single().execute()
             
             if verify_result.data:
                 log = verify_result.data
-                print(f"   ✅ Verification successful:")
-                print(f"      Table: {log['table_name']}")
-                print(f"      Operation: {log['operation']}")
-                print(f"      Record ID: {log['record_id']}")
-                print(f"      Changed Fields: {log['changed_fields']}")
-                print(f"      Old Values: {log['old_values']}")
-                print(f"      New Values: {log['new_values']}")
+                report(f"   ✅ Verification successful:")
+                report(f"      Table: {log['table_name']}")
+                report(f"      Operation: {log['operation']}")
+                report(f"      Record ID: {log['record_id']}")
+                report(f"      Changed Fields: {log['changed_fields']}")
+                report(f"      Old Values: {log['old_values']}")
+                report(f"      New Values: {log['new_values']}")
             
             # Clean up - delete the test record
             cleanup = supabase.table('audit_logs').delete().eq('id', audit_id).execute()
-            print(f"   🧹 Test record cleaned up")
+            report(f"   🧹 Test record cleaned up")
             
             return True
         else:
-            print(f"   ❌ Failed to create audit log")
+            report_error(f"   ❌ Failed to create audit log")
             return False
             
     except Exception as e:
-        print(f"   ❌ Error: {e}")
-        print(f"   📋 Error type: {type(e).__name__}")
+        report_error(f"   ❌ Error: {e}")
+        report(f"   📋 Error type: {type(e).__name__}")
         return False
 
 def verify_current_audit_logs():
     """Check current audit log count"""
     try:
         count_result = supabase.table('audit_logs').select('*', count='exact', head=True).execute()
-        print(f"\n2️⃣ Current audit log status:")
-        print(f"   📊 Total records: {count_result.count}")
+        report(f"\n2️⃣ Current audit log status:")
+        report(f"   📊 Total records: {count_result.count}")
         
         # Get recent logs if any
         if count_result.count > 0:
             recent = supabase.table('audit_logs').select('id, table_name, operation, timestamp').order('timestamp', desc=True).limit(3).execute()
-            print(f"   📋 Recent entries:")
+            report(f"   📋 Recent entries:")
             for log in recent.data or []:
-                print(f"      - {log['operation']} on {log['table_name']} at {log['timestamp']}")
+                report(f"      - {log['operation']} on {log['table_name']} at {log['timestamp']}")
     except Exception as e:
-        print(f"   ❌ Error checking current logs: {e}")
+        report_error(f"   ❌ Error checking current logs: {e}")
 
 if __name__ == "__main__":
     verify_current_audit_logs()
     success = test_fixed_audit_logging()
+    flush_report()
     
     if success:
-        print(f"\n🎉 Audit logging fix is working!")
-        print(f"   ✅ Ready to deploy updated PropertyUpdateService")
+        print("\n🎉 Audit logging fix is working!\n"
+              "   ✅ Ready to deploy updated PropertyUpdateService")
     else:
-        print(f"\n❌ Audit logging still has issues")
-        print(f"   🔧 May need additional debugging")
\ No newline at end of file
+        print("\n❌ Audit logging still has issues\n"
+              "   🔧 May need additional debugging")
\ No newline at end of file
@@ -4,47 +4,73 @@ Test Audit Log Simple: Direct test of audit log functionality using correct Supa
 """
 
 import os
+import sys
 import uuid
+from pathlib import Path
 from dotenv import load_dotenv
-from supabase import create_client
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from src.utils.database import db_manager
 
 load_dotenv()
 
-url = os.getenv('SUPABASE_URL')
-key = os.getenv('SUPABASE_SERVICE_KEY')
-supabase = create_client(url, key)
+# Process-wide client: scripts imported into the same run share its HTTP connection pool
+supabase = db_manager.get_supabase_client()
+
+# Progress output is only produced with VERBOSE set, and then written in one go;
+# errors are always written
+VERBOSE = bool(os.environ.get('VERBOSE'))
+_report_lines = []
+
+def report(message: str = ""):
+    """Queue a progress line (dropped unless VERBOSE is set)"""
+    if VERBOSE:
+        _report_lines.append(message)
+
+def report_error(message: str):
+    """Queue an error line, written whether or not VERBOSE is set"""
+    _report_lines.append(message)
+
+def flush_report():
+    """Write all queued progress lines with a single write"""
+    if _report_lines:
+        sys.stdout.write("\n".join(_report_lines) + "\n")
+        _report_lines.clear()
 
 def test_audit_log_complete():
     """Complete audit log test with proper Supabase syntax"""
     
-    print("🔍 Testing Audit Log Complete Workflow...")
-    print("="*50)
+    report("🔍 Testing Audit Log Complete Workflow...")
+    report("="*50)
     
     try:
         # Step 1: Check current audit log count
-        print("\n1️⃣ Current audit log count:")
+        report("\n1️⃣ Current audit log count:")
         count_result = supabase.table('audit_logs').select('id', count='exact').execute()
-        print(f"   📊 Current audit logs: {count_result.count}")
+        report(f"   📊 Current audit logs: {count_result.count}")
         
         # Step 2: Get sample property
-        print("\n2️⃣ Getting sample property:")
+        report("\n2️⃣ Getting sample property:")
         property_result = supabase.table('parcels').select('id, address, zoning_code').limit(1).execute()
         if not property_result.data:
-            print("   ❌ No properties found")
+            report_error("   ❌ No properties found")
             return False
         
         property_data = property_result.data[0]
         property_id = property_data['id']
         original_zoning = property_data['zoning_code']
-        print(f"   🏠 Property: {property_data['address']}")
-        print(f"   🆔 ID: {property_id}")
-        print(f"   📊 Original zoning: {original_zoning}")
+        report(f"   🏠 Property: {property_data['address']}")
+        report(f"   🆔 ID: {property_id}")
+        report(f"   📊 Original zoning: {original_zoning}")
         
-        # Step 3: Create test audit log entry
-        print("\n3️⃣ Creating test audit log:")
+        # Step 3: Create test audit log entry (before anything is mutated, so a
+        # failed insert leaves the parcel untouched)
+        report("\n3️⃣ Creating test audit log:")
         test_session_id = str(uuid.uuid4())
         
-        audit_data = {
+        audit_result = supabase.table('audit_logs').insert({
             'table_name': 'parcels',
             'record_id': property_id,
             'operation': 'UPDATE',
@@ -53,119 +79,107 @@ def test_audit_log_complete():
             'new_values': {'zoning_code': 'TEST-AUDIT-DIRECT'},
             'changed_fields': ['zoning_code'],
             'session_id': test_session_id
-        }
-        
-        audit_result = supabase.table('audit_logs').insert(audit_data).execute()
+        }).execute()
         if not audit_result.data:
-            print(f"   ❌ Failed to create audit log")
+            report_error(f"   ❌ Failed to create audit logs")
             return False
         
         audit_id = audit_result.data[0]['id']
-        print(f"   ✅ Audit log created: {audit_id}")
-        print(f"   🔑 Session ID: {test_session_id}")
+        report(f"   ✅ Audit log created: {audit_id}")
+        report(f"   🔑 Session ID: {test_session_id}")
         
-        # Step 4: Verify audit log
-        print("\n4️⃣ Verifying audit log:")
-        verify_result = supabase.table('audit_logs').select('*').eq('id', audit_id).execute()
+        # Step 4: Test PropertyUpdateService workflow simulation
+        report("\n4️⃣ Simulating PropertyUpdateService workflow:")
+        
+        # Read, update and audit in one transaction (sql/schema/update_parcel_with_audit.sql)
+        new_zoning = f"TEST-{uuid.uuid4().hex[:8].upper()}"
+        service_session_id = str(uuid.uuid4())
+        rpc_result = supabase.rpc('update_parcel_with_audit', {
+            'p_id': property_id,
+            'p_new': {'zoning_code': new_zoning},
+            'p_session': service_session_id
+        }).execute()
+        service_audit = rpc_result.data[0] if isinstance(rpc_result.data, list) else rpc_result.data
+        
+        if service_audit:
+            service_audit_id = service_audit['id']
+            report(f"   ✅ Property updated to: {new_zoning}")
+            report(f"   ✅ Service audit log created: {service_audit_id}")
+            report(f"   📊 Old: {service_audit['old_values']}")
+        
+        # Step 5: Verify the test audit log
+        report("\n5️⃣ Verifying audit log:")
+        verify_result = supabase.table('audit_logs').select(
+            'table_name, operation, record_id, session_id, changed_fields, old_values, new_values, timestamp'
+        ).eq('id', audit_id).execute()
         if verify_result.data:
             log = verify_result.data[0]
-            print(f"   ✅ Audit log verified:")
-            print(f"      📊 Table: {log['table_name']}")
-            print(f"      🔄 Operation: {log['operation']}")
-            print(f"      🆔 Record ID: {log['record_id']}")
-            print(f"      🔑 Session: {log['session_id']}")
-            print(f"      📝 Fields: {log['changed_fields']}")
-            print(f"      📊 Old: {log['old_values']}")
-            print(f"      📊 New: {log['new_values']}")
-            print(f"      ⏰ Time: {log['timestamp']}")
+            report(f"   ✅ Audit log verified:")
+            report(f"      📊 Table: {log['table_name']}")
+            report(f"      🔄 Operation: {log['operation']}")
+            report(f"      🆔 Record ID: {log['record_id']}")
+            report(f"      🔑 Session: {log['session_id']}")
+            report(f"      📝 Fields: {log['changed_fields']}")
+            report(f"      📊 Old: {log['old_values']}")
+            report(f"      📊 New: {log['new_values']}")
+            report(f"      ⏰ Time: {log['timestamp']}")
         else:
-            print(f"   ❌ Failed to verify audit log")
-        
-        # Step 5: Test PropertyUpdateService workflow simulation
-        print("\n5️⃣ Simulating PropertyUpdateService workflow:")
-        
-        # Get current property for audit (what PropertyUpdateService does)
-        current_result = supabase.table('parcels').select('*').eq('id', property_id).execute()
-        current_property = current_result.data[0]
-        
-        # Update property (what PropertyUpdateService does)
-        new_zoning = f"TEST-{uuid.uuid4().hex[:8].upper()}"
-        update_result = supabase.table('parcels').update({'zoning_code': new_zoning, 'updated_at': 'now()'}).eq('id', property_id).execute()
-        
-        if update_result.data:
-            print(f"   ✅ Property updated to: {new_zoning}")
-            
-            # Create audit log (what PropertyUpdateService does)
-            service_session_id = str(uuid.uuid4())
-            service_audit = {
-                'table_name': 'parcels',
-                'record_id': property_id,
-                'operation': 'UPDATE',
-                'user_id': None,
-                'old_values': current_property,
-                'new_values': {'zoning_code': new_zoning},
-                'changed_fields': ['zoning_code'],
-                'session_id': service_session_id
-            }
-            
-            service_audit_result = supabase.table('audit_logs').insert(service_audit).execute()
-            if service_audit_result.data:
-                service_audit_id = service_audit_result.data[0]['id']
-                print(f"   ✅ Service audit log created: {service_audit_id}")
+            report_error(f"   ❌ Failed to verify audit log")
         
         # Step 6: Check final audit log count
-        print("\n6️⃣ Final audit log count:")
+        report("\n6️⃣ Final audit log count:")
         final_count = supabase.table('audit_logs').select('id', count='exact').execute()
-        print(f"   📊 Final audit logs: {final_count.count}")
-        print(f"   📈 Created: {final_count.count - count_result.count} new audit logs")
+        report(f"   📊 Final audit logs: {final_count.count}")
+        report(f"   📈 Created: {final_count.count - count_result.count} new audit logs")
         
         # Step 7: Query recent audit logs
-        print("\n7️⃣ Recent audit logs:")
+        report("\n7️⃣ Recent audit logs:")
         recent_result = supabase.table('audit_logs').select('id, table_name, operation, changed_fields, timestamp').order('timestamp', desc=True).limit(5).execute()
         if recent_result.data:
             for i, log in enumerate(recent_result.data, 1):
-                print(f"   {i}. {log['operation']} on {log['table_name']} - {log['changed_fields']} at {log['timestamp']}")
+                report(f"   {i}. {log['operation']} on {log['table_name']} - {log['changed_fields']} at {log['timestamp']}")
         
         # Step 8: Clean up test data
-        print("\n8️⃣ Cleaning up test data:")
+        report("\n8️⃣ Cleaning up test data:")
         
         # Restore original zoning
         restore_result = supabase.table('parcels').update({'zoning_code': original_zoning}).eq('id', property_id).execute()
         if restore_result.data:
-            print(f"   ✅ Original zoning restored: {original_zoning}")
+            report(f"   ✅ Original zoning restored: {original_zoning}")
         
         # Delete test audit logs
         cleanup1 = supabase.table('audit_logs').delete().eq('id', audit_id).execute()
         if cleanup1.data:
-            print(f"   🧹 Test audit log 1 deleted")
+            report(f"   🧹 Test audit log 1 deleted")
         
         if 'service_audit_id' in locals():
             cleanup2 = supabase.table('audit_logs').delete().eq('id', service_audit_id).execute()
             if cleanup2.data:
-                print(f"   🧹 Test audit log 2 deleted")
+                report(f"   🧹 Test audit log 2 deleted")
         
-        print(f"\n🎉 AUDIT LOG TEST PASSED!")
-        print(f"   ✅ Audit log creation: Working")
-        print(f"   ✅ Audit log verification: Working")
-        print(f"   ✅ JSONB old_values/new_values: Working")
-        print(f"   ✅ UUID session tracking: Working")
-        print(f"   ✅ PropertyUpdateService simulation: Working")
+        report(f"\n🎉 AUDIT LOG TEST PASSED!")
+        report(f"   ✅ Audit log creation: Working")
+        report(f"   ✅ Audit log verification: Working")
+        report(f"   ✅ JSONB old_values/new_values: Working")
+        report(f"   ✅ UUID session tracking: Working")
+        report(f"   ✅ PropertyUpdateService simulation: Working")
         
         return True
         
     except Exception as e:
-        print(f"   ❌ Test failed: {e}")
+        report_error(f"   ❌ Test failed: {e}")
         import traceback
         traceback.print_exc()
         return False
 
 if __name__ == "__main__":
     success = test_audit_log_complete()
+    flush_report()
     
     if success:
-        print(f"\n🎉 ALL AUDIT LOG TESTS PASSED!")
-        print(f"   ✅ PropertyPanel audit logging is ready for production")
-        print(f"   ✅ Database persistence with audit trail is working")
+        print("\n🎉 ALL AUDIT LOG TESTS PASSED!\n"
+              "   ✅ PropertyPanel audit logging is ready for production\n"
+              "   ✅ Database persistence with audit trail is working")
     else:
-        print(f"\n❌ AUDIT LOG TESTS FAILED") 
-        print(f"   🔧 Check PropertyUpdateService implementation")
\ No newline at end of file
+        print("\n❌ AUDIT LOG TESTS FAILED\n"
+              "   🔧 Check PropertyUpdateService implementation")
\ No newline at end of file
@@ -214,8 +214,10 @@ class ProjectCleaner:
 
     def create_cleanup_report(self):
         """Generate cleanup report"""
+        # One clock reading, so the file name and the recorded timestamp always agree
+        now = datetime.now()
         report = {
-            "cleanup_timestamp": datetime.now().isoformat(),
+            "cleanup_timestamp": now.isoformat(),
             "total_moves": len(self.moves_log),
             "moves_by_category": {},
             "file_moves": self.moves_log
@@ -226,7 +228,7 @@ class ProjectCleaner:
             category = move["description"]
             report["moves_by_category"][category] = report["moves_by_category"].get(category, 0) + 1
         
-        report_path = self.project_root / "temp" / f"cleanup_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        report_path = self.project_root / "temp" / f"cleanup_report_{now:%Y%m%d_%H%M%S}.json"
         with open(report_path, 'w') as f:
             json.dump(report, f, indent=2)
         
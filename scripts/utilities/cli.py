@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+SEEK Property Platform - Utility CLI
+====================================
+
+Single entrypoint for the database utility scripts. All subcommands share
+one Supabase client (and its HTTP connection pool), so the import and
+connection setup cost is paid once per process.
+
+Usage:
+    python -m scripts.utilities.cli spot-check [PROPERTY_ID]
+    python -m scripts.utilities.cli find-test
+    python -m scripts.utilities.cli find-any
+    python -m scripts.utilities.cli fix-county-names
+    python -m scripts.utilities.cli monitor
+    python -m scripts.utilities.cli setup-pg-trgm
+    python -m scripts.utilities.cli debug-fort-worth [--full]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from scripts.analysis.debug_fort_worth_comprehensive import main as debug_fort_worth_comprehensive
+from scripts.analysis.debug_fort_worth_simple import main as debug_fort_worth_simple
+from scripts.database.setup_pg_trgm import setup_pg_trgm
+from scripts.utilities.diagnostics.spot_check_property import DEFAULT_PROPERTY_ID, spot_check_property
+from scripts.utilities.find_any_property import find_any_property
+from scripts.utilities.find_test_property import find_test_property
+from scripts.utilities.fix_county_names import fix_county_names
+from scripts.utilities.monitor_performance import main as monitor_performance
+from src.utils.database import db_manager
+
+
+def get_client():
+    """Shared Supabase client for every subcommand"""
+    return db_manager.get_supabase_client()
+
+
+def cmd_spot_check(args):
+    return spot_check_property(get_client(), args.property_id) is not None
+
+
+def cmd_find_test(args):
+    return find_test_property(get_client()) is not None
+
+
+def cmd_find_any(args):
+    return find_any_property(get_client()) is not None
+
+
+def cmd_fix_county_names(args):
+    return fix_county_names(get_client())
+
+
+def cmd_monitor(args):
+    monitor_performance(get_client())
+    return True
+
+
+def cmd_setup_pg_trgm(args):
+    return setup_pg_trgm(get_client())
+
+
+def cmd_debug_fort_worth(args):
+    client = get_client()
+    if not debug_fort_worth_simple(client):
+        # No reachable city data: the pattern investigation could only repeat the failure
+        return False
+    if args.full:
+        debug_fort_worth_comprehensive(client)
+    return True
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description='SEEK database utilities')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    spot_check = subparsers.add_parser('spot-check', help='Print key fields for one property')
+    spot_check.add_argument('property_id', nargs='?', default=DEFAULT_PROPERTY_ID, help='Parcel UUID')
+    spot_check.set_defaults(func=cmd_spot_check)
+
+    subparsers.add_parser('find-test', help='Find the UUID of the test property').set_defaults(func=cmd_find_test)
+    subparsers.add_parser('find-any', help='List a few properties for testing').set_defaults(func=cmd_find_any)
+    subparsers.add_parser(
+        'fix-county-names', help="Fold the duplicate 'Test Sample' county into Bexar"
+    ).set_defaults(func=cmd_fix_county_names)
+    subparsers.add_parser('monitor', help='Run the performance benchmark').set_defaults(func=cmd_monitor)
+    subparsers.add_parser(
+        'setup-pg-trgm', help='Install and test the pg_trgm extension'
+    ).set_defaults(func=cmd_setup_pg_trgm)
+
+    debug_fort_worth = subparsers.add_parser('debug-fort-worth', help='Diagnose Fort Worth city and parcel lookups')
+    debug_fort_worth.add_argument(
+        '--full', action='store_true', help='Also run the comprehensive search-pattern investigation'
+    )
+    debug_fort_worth.set_defaults(func=cmd_debug_fort_worth)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return 0 if args.func(args) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
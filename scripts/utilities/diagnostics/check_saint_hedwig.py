@@ -25,7 +25,8 @@ def main():
             '06ea5cac-a6fe-42b5-b0d1-ba0abfdc5f6d'   # St. Hedwig
         ]
         
-        cities_response = supabase.table('cities').select('*').in_('id', saint_hedwig_ids).execute()
+        # County names come embedded through cities.county_id, so one request covers both tables
+        cities_response = supabase.table('cities').select('*, counties!county_id(name)').in_('id', saint_hedwig_ids).execute()
         
         if cities_response.data:
             print(f"Found {len(cities_response.data)} Saint/St. Hedwig entries:")
@@ -37,23 +38,16 @@ def main():
                 print(f"  County ID: {city['county_id']}")
                 print()
             
-            # Get county info
-            county_ids = [city['county_id'] for city in cities_response.data]
-            counties_response = supabase.table('counties').select('id, name').in_('id', county_ids).execute()
-            
-            if counties_response.data:
-                counties_dict = {county['id']: county['name'] for county in counties_response.data}
-                
-                print("With county names:")
-                for city in cities_response.data:
-                    county_name = counties_dict.get(city['county_id'], 'Unknown')
-                    print(f"  {city['name']} → {county_name} County")
-                print()
+            print("With county names:")
+            for city in cities_response.data:
+                county_name = (city.get('counties') or {}).get('name', 'Unknown')
+                print(f"  {city['name']} → {county_name} County")
+            print()
                 
             # Check if there are parcels associated with these cities
             print("Checking for associated parcels...")
             for city in cities_response.data:
-                parcels_response = supabase.table('parcels').select('id', count='exact').eq('city_id', city['id']).execute()
+                parcels_response = supabase.table('parcels').select('id', count='exact', head=True).eq('city_id', city['id']).execute()
                 parcel_count = parcels_response.count or 0
                 print(f"  {city['name']}: {parcel_count:,} parcels")
                 
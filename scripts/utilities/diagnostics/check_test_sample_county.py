@@ -3,10 +3,20 @@
 Examine the Test Sample 1000 county to understand if it should be removed.
 """
 
+import asyncio
 import os
 import sys
 from supabase import create_client, Client
 
+def count_city_parcels(supabase: Client, city_id: str) -> int:
+    """Number of parcels linked to one city"""
+    parcels_response = supabase.table('parcels').select('id', count='exact', head=True).eq('city_id', city_id).execute()
+    return parcels_response.count or 0
+
+async def count_parcels_by_city(supabase: Client, city_ids: list) -> list:
+    """Parcel counts for several cities, queried concurrently"""
+    return await asyncio.gather(*(asyncio.to_thread(count_city_parcels, supabase, city_id) for city_id in city_ids))
+
 def main():
     # Supabase connection details
     url = "https://mpkprmjejiojdjbkkbmn.supabase.co"
@@ -40,9 +50,9 @@ def main():
                 
                 print("\nChecking for parcels associated with these cities...")
                 total_parcels = 0
-                for city in cities_response.data[:5]:  # Check first 5 cities
-                    parcels_response = supabase.table('parcels').select('id', count='exact').eq('city_id', city['id']).execute()
-                    parcel_count = parcels_response.count or 0
+                first_cities = cities_response.data[:5]  # Check first 5 cities
+                parcel_counts = asyncio.run(count_parcels_by_city(supabase, [city['id'] for city in first_cities]))
+                for city, parcel_count in zip(first_cities, parcel_counts, strict=True):
                     total_parcels += parcel_count
                     print(f"  {city['name']}: {parcel_count:,} parcels")
                 
@@ -1,85 +1,112 @@
 #!/usr/bin/env python3
 
 import os
+import sys
+from functools import lru_cache
 from dotenv import load_dotenv
 from supabase import create_client
 
 load_dotenv()
 
-url = os.getenv('SUPABASE_URL')
-key = os.getenv('SUPABASE_SERVICE_KEY')
-supabase = create_client(url, key)
-
-property_id = "335ebbc5-c594-4153-aca3-cca380b38ea1"
-
-print(f"🔍 Spot checking property: {property_id}")
-
-# Query the property with all key fields
-result = supabase.table('parcels').select('''
-    id,
-    parcel_number,
-    address,
-    latitude,
-    longitude,
-    lot_size,
-    owner_name,
-    property_value,
-    zoned_by_right,
-    occupancy_class,
-    fire_sprinklers,
-    parcel_sqft,
-    zoning_code,
-    zip_code,
-    created_at,
-    updated_at,
-    cities!city_id (
-        name,
-        state
-    ),
-    counties!county_id (
-        name
-    )
-''').eq('id', property_id).single().execute()
-
-try:
-    if not result.data:
+DEFAULT_PROPERTY_ID = "335ebbc5-c594-4153-aca3-cca380b38ea1"
+
+# (label, field, formatter) rows printed for a found property, in display order
+PROPERTY_FIELDS = [
+    ('📍 Address', 'address', str),
+    ('🏛️  County', 'county_name', str),
+    ('🏙️  City', 'city_name', str),
+    ('📄 Parcel #', 'parcel_number', str),
+    ('📏 Parcel SqFt', 'parcel_sqft', '{:,}'.format),
+    ('📏 Lot Size', 'lot_size', '{:,}'.format),
+    ('🏗️  Zoning Code', 'zoning_code', str),
+    ('📮 ZIP Code', 'zip_code', str),
+    ('👤 Owner', 'owner_name', str),
+    ('💰 Property Value', 'property_value', '${:,}'.format),
+    ('🧯 Fire Sprinklers', 'fire_sprinklers', str),
+    ('🏢 Occupancy Class', 'occupancy_class', str),
+    ('✅ Zoned By Right', 'zoned_by_right', str),
+    ('📍 Coordinates', 'coordinates', '{0[0]}, {0[1]}'.format),
+    ('📅 Created', 'created_at', str),
+    ('📅 Updated', 'updated_at', str),
+]
+
+ENHANCED_FIELDS = ['parcel_sqft', 'zoning_code', 'zip_code']
+
+
+def setup_supabase():
+    """Initialize Supabase client"""
+    return create_client(os.getenv('SUPABASE_URL'), os.getenv('SUPABASE_SERVICE_KEY'))
+
+
+@lru_cache(maxsize=1024)
+def get_city(supabase, city_id):
+    """Fetch a city's name/state once per process instead of embedding the join"""
+    result = supabase.table('cities').select('name,state').eq('id', city_id).maybe_single().execute()
+    return result.data if result else None
+
+
+@lru_cache(maxsize=1024)
+def get_county(supabase, county_id):
+    """Fetch a county's name once per process instead of embedding the join"""
+    result = supabase.table('counties').select('name').eq('id', county_id).maybe_single().execute()
+    return result.data if result else None
+
+
+def spot_check_property(supabase, property_id=DEFAULT_PROPERTY_ID):
+    """Print key fields and a data quality check for one property; returns None if missing"""
+    print(f"🔍 Spot checking property: {property_id}")
+
+    # Query the property with all key fields
+    result = supabase.table('parcels').select('''
+        id,
+        parcel_number,
+        address,
+        latitude,
+        longitude,
+        lot_size,
+        owner_name,
+        property_value,
+        zoned_by_right,
+        occupancy_class,
+        fire_sprinklers,
+        parcel_sqft,
+        zoning_code,
+        zip_code,
+        created_at,
+        updated_at,
+        city_id,
+        county_id
+    ''').eq('id', property_id).maybe_single().execute()
+
+    # maybe_single() returns None on a miss instead of raising, so real errors still surface
+    if result is None or result.data is None:
         print("❌ Property not found")
-    else:
-        prop = result.data
-        print(f"\n✅ Property Found:")
-        print(f"   📍 Address: {prop.get('address', 'N/A')}")
-        print(f"   🏛️  County: {prop['counties']['name'] if prop.get('counties') else 'N/A'}")
-        print(f"   🏙️  City: {prop['cities']['name'] if prop.get('cities') else 'N/A'}")
-        print(f"   📄 Parcel #: {prop.get('parcel_number', 'N/A')}")
-        print(f"   📏 Parcel SqFt: {prop.get('parcel_sqft'):,}" if prop.get('parcel_sqft') else "   📏 Parcel SqFt: N/A")
-        print(f"   📏 Lot Size: {prop.get('lot_size'):,}" if prop.get('lot_size') else "   📏 Lot Size: N/A")
-        print(f"   🏗️  Zoning Code: {prop.get('zoning_code', 'N/A')}")
-        print(f"   📮 ZIP Code: {prop.get('zip_code', 'N/A')}")
-        print(f"   👤 Owner: {prop.get('owner_name', 'N/A')}")
-        print(f"   💰 Property Value: ${prop.get('property_value'):,}" if prop.get('property_value') else "   💰 Property Value: N/A")
-        print(f"   🧯 Fire Sprinklers: {prop.get('fire_sprinklers', 'N/A')}")
-        print(f"   🏢 Occupancy Class: {prop.get('occupancy_class', 'N/A')}")
-        print(f"   ✅ Zoned By Right: {prop.get('zoned_by_right', 'N/A')}")
-        print(f"   📍 Coordinates: {prop.get('latitude', 'N/A')}, {prop.get('longitude', 'N/A')}")
-        print(f"   📅 Created: {prop.get('created_at', 'N/A')}")
-        print(f"   📅 Updated: {prop.get('updated_at', 'N/A')}")
-        
-        # Data quality check
-        print(f"\n📊 Data Quality Check:")
-        enhanced_fields = ['parcel_sqft', 'zoning_code', 'zip_code']
-        for field in enhanced_fields:
-            status = "✅ Present" if prop.get(field) else "❌ Missing"
-            print(f"   {field}: {status}")
-            
-        # Coordinates check
-        coords_valid = prop.get('latitude') and prop.get('longitude')
-        print(f"   Coordinates: {'✅ Valid' if coords_valid else '❌ Missing'}")
-        
-        # Relationship check  
-        county_valid = prop.get('counties') and prop['counties'].get('name')
-        city_valid = prop.get('cities') and prop['cities'].get('name')
-        print(f"   County Relationship: {'✅ Valid' if county_valid else '❌ Missing'}")
-        print(f"   City Relationship: {'✅ Valid' if city_valid else '❌ Missing'}")
-
-except Exception as e:
-    print(f"❌ Error: {e}")
\ No newline at end of file
+        return None
+
+    prop = result.data
+    county = get_county(supabase, prop['county_id']) if prop.get('county_id') else None
+    city = get_city(supabase, prop['city_id']) if prop.get('city_id') else None
+    prop['county_name'] = county.get('name') if county else None
+    prop['city_name'] = city.get('name') if city else None
+    if prop.get('latitude') is not None and prop.get('longitude') is not None:
+        prop['coordinates'] = (prop['latitude'], prop['longitude'])
+
+    print(f"\n✅ Property Found:")
+    for label, field, fmt in PROPERTY_FIELDS:
+        value = prop.get(field)
+        print(f"   {label}: {fmt(value) if value is not None else 'N/A'}")
+
+    # Data quality check
+    print(f"\n📊 Data Quality Check:")
+    for field in ENHANCED_FIELDS:
+        print(f"   {field}: {'✅ Present' if prop.get(field) else '❌ Missing'}")
+    print(f"   Coordinates: {'✅ Valid' if prop.get('coordinates') else '❌ Missing'}")
+    print(f"   County Relationship: {'✅ Valid' if prop['county_name'] else '❌ Missing'}")
+    print(f"   City Relationship: {'✅ Valid' if prop['city_name'] else '❌ Missing'}")
+
+    return prop
+
+
+if __name__ == "__main__":
+    if spot_check_property(setup_supabase(), *sys.argv[1:2]) is None:
+        sys.exit(1)
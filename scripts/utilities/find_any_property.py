@@ -5,27 +5,22 @@ Find Any Working Property for Testing
 """
 
 import os
-import sys
-from pathlib import Path
 from dotenv import load_dotenv
 from supabase import create_client, Client
 
-# Add project root to path
-project_root = Path(__file__).parent.parent.parent
-sys.path.append(str(project_root))
-
 # Load environment variables
 load_dotenv()
 
-def find_any_property():
+def find_any_property(supabase=None):
     """Find any property that exists in the database."""
     print("🔍 Finding Any Property for Testing...")
     
     try:
-        # Create Supabase client
-        url = os.getenv('SUPABASE_URL')
-        key = os.getenv('SUPABASE_SERVICE_KEY')
-        supabase = create_client(url, key)
+        # Create Supabase client unless the caller shares one
+        if supabase is None:
+            url = os.getenv('SUPABASE_URL')
+            key = os.getenv('SUPABASE_SERVICE_KEY')
+            supabase = create_client(url, key)
         
         # Get the first few properties
         print("📋 Getting sample properties...")
@@ -7,27 +7,22 @@ Find the UUID for our test property with parcel number 5452619.0
 """
 
 import os
-import sys
-from pathlib import Path
 from dotenv import load_dotenv
 from supabase import create_client, Client
 
-# Add project root to path
-project_root = Path(__file__).parent.parent.parent
-sys.path.append(str(project_root))
-
 # Load environment variables
 load_dotenv()
 
-def find_test_property():
+def find_test_property(supabase=None):
     """Find the UUID for our test property."""
     print("🔍 Finding Test Property UUID...")
     
     try:
-        # Create Supabase client
-        url = os.getenv('SUPABASE_URL')
-        key = os.getenv('SUPABASE_SERVICE_KEY')
-        supabase = create_client(url, key)
+        # Create Supabase client unless the caller shares one
+        if supabase is None:
+            url = os.getenv('SUPABASE_URL')
+            key = os.getenv('SUPABASE_SERVICE_KEY')
+            supabase = create_client(url, key)
         
         # Search for the test property
         print("📋 Searching for parcel number 5452619.0...")
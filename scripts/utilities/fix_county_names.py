@@ -1,56 +1,51 @@
 #!/usr/bin/env python3
 
 import os
+import sys
 from dotenv import load_dotenv
 from supabase import create_client
 
 load_dotenv()
 
-url = os.getenv('SUPABASE_URL')
-key = os.getenv('SUPABASE_SERVICE_KEY')
-supabase = create_client(url, key)
 
-print("🔧 Fixing county names...")
+def setup_supabase():
+    """Initialize Supabase client"""
+    return create_client(os.getenv('SUPABASE_URL'), os.getenv('SUPABASE_SERVICE_KEY'))
 
-# First, find the correct Bexar county ID and the Test Sample county ID
-bexar_result = supabase.table('counties').select('id, name').eq('name', 'Bexar').execute()
-test_result = supabase.table('counties').select('id, name').eq('name', 'Test Sample').execute()
 
-if not bexar_result.data:
-    print("❌ No 'Bexar' county found")
-    exit(1)
+def fix_county_names(supabase, dup_name='Test Sample', keep_name='Bexar'):
+    """
+    Fold the duplicate county into the one we keep; returns False if either is missing.
 
-if not test_result.data:
-    print("❌ No 'Test Sample' county found")
-    exit(1)
+    The lookup, counts and deletes run server-side in a single transaction
+    (see sql/utilities/merge_duplicate_county.sql).
+    """
+    print("🔧 Fixing county names...")
 
-bexar_county_id = bexar_result.data[0]['id']
-test_county_id = test_result.data[0]['id']
+    result = supabase.rpc('merge_duplicate_county', {'dup_name': dup_name, 'keep_name': keep_name}).execute()
+    counts = {row['action']: row['cnt'] for row in result.data or []}
 
-print(f"📋 Found counties:")
-print(f"   Bexar: {bexar_county_id}")
-print(f"   Test Sample: {test_county_id}")
+    if 'keep_county_missing' in counts:
+        print(f"❌ No '{keep_name}' county found")
+        return False
 
-# Check how many parcels are in each county
-test_parcels = supabase.table('parcels').select('id', count='exact', head=True).eq('county_id', test_county_id).execute()
-bexar_parcels = supabase.table('parcels').select('id', count='exact', head=True).eq('county_id', bexar_county_id).execute()
+    if 'dup_county_missing' in counts:
+        print(f"❌ No '{dup_name}' county found")
+        return False
 
-print(f"\n📊 Parcel counts:")
-print(f"   Test Sample county: {test_parcels.count} parcels") 
-print(f"   Bexar county: {bexar_parcels.count} parcels")
+    print(f"\n📊 Parcel counts:")
+    print(f"   {keep_name} county: {counts.get('keep_county_parcels', 0)} parcels")
+    print(f"✅ Deleted {counts.get('parcels_deleted', 0)} duplicate parcels in {dup_name} county")
+    print(f"✅ Deleted {dup_name} county")
 
-# Since we have duplicates, delete parcels in Test Sample county (they're duplicates)
-print(f"\n🗑️ Deleting duplicate parcels in Test Sample county...")
-delete_parcels_result = supabase.table('parcels').delete().eq('county_id', test_county_id).execute()
-print(f"✅ Deleted {len(delete_parcels_result.data) if delete_parcels_result.data else 0} duplicate parcels")
+    # Verify the fix
+    result = supabase.table('counties').select('id, name').limit(5).execute()
+    print("\n📋 Current counties:")
+    for county in result.data or []:
+        print(f"   {county['name']}")
 
-# Delete the Test Sample county (now that no parcels reference it)
-print(f"\n🗑️ Deleting Test Sample county...")
-delete_result = supabase.table('counties').delete().eq('id', test_county_id).execute()
-print(f"✅ Deleted Test Sample county")
+    return True
 
-# Verify the fix
-result = supabase.table('counties').select('id, name').limit(5).execute()
-print("\n📋 Current counties:")
-for county in result.data or []:
-    print(f"   {county['name']}")
\ No newline at end of file
+
+if __name__ == "__main__":
+    sys.exit(0 if fix_county_names(setup_supabase()) else 1)
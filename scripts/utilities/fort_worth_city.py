@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Fort Worth City Lookup
+======================
+
+Shared lookup of the Fort Worth city_id used by the Fort Worth test and debug
+scripts. The resolved id is kept in a small JSON sidecar file so repeated runs
+skip the cities ILIKE query until the cached value is older than the TTL.
+
+The sidecar lives in the user's own cache directory and is keyed on the
+Supabase project URL, so switching projects never returns another project's id.
+"""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Optional
+
+CACHE_DIR = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'seek'
+DEFAULT_TTL_SECONDS = 3600
+
+
+def cache_file(supabase_url: str) -> Path:
+    """Sidecar path for one Supabase project."""
+    url_key = hashlib.sha256(supabase_url.encode()).hexdigest()[:16]
+    return CACHE_DIR / f"fort_worth_city_{url_key}.json"
+
+
+def get_fort_worth_id(client, ttl: int = DEFAULT_TTL_SECONDS) -> Optional[str]:
+    """Return the Fort Worth city_id, from the sidecar cache when it is fresh."""
+    path = cache_file(str(client.supabase_url))
+    try:
+        cached = json.loads(path.read_text())
+        if time.time() - cached['ts'] < ttl:
+            return cached['id']
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    cities = client.table('cities').select('id').ilike('name', '%Fort Worth%').limit(1).execute()
+    if not cities.data:
+        return None
+
+    city_id = cities.data[0]['id']
+    try:
+        CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+        path.write_text(json.dumps({'id': city_id, 'ts': time.time()}))
+    except OSError:
+        pass  # Caching is best-effort; the lookup result is still valid
+    return city_id
@@ -176,12 +176,15 @@ export class PropertySearchService {
       sortOrder = 'asc'
     } = sanitizedCriteria;
 
-    // Build the base query with related city and county names
+    // Build the base query with related city and county names. With a city
+    // filter the cities embed is an inner join, so the city name match runs in
+    // the same request instead of a separate cities lookup round-trip.
+    const citiesEmbed = city ? 'cities!city_id!inner' : 'cities!city_id';
     let query = supabase
       .from('parcels')
       .select(`
         *,
-        cities!city_id (
+        ${citiesEmbed} (
           name,
           state
         ),
@@ -195,30 +198,7 @@ export class PropertySearchService {
       // Extract just the city name from formats like "Fort Worth, TX"
       const cityName = city.split(',')[0].trim();
       console.log('🔍 City search debug:', { originalCity: city, extractedCityName: cityName });
-      
-      // First, find matching city IDs from the cities table
-      const { data: matchingCities, error: cityError } = await supabase
-        .from('cities')
-        .select('id, name')
-        .ilike('name', `%${cityName}%`);
-        
-      console.log('🏙️ City query result:', { cityName, matchingCities, cityError });
-        
-      if (cityError) {
-        console.error('❌ City query error:', cityError);
-        throw cityError;
-      }
-      
-      if (matchingCities && matchingCities.length > 0) {
-        // Filter parcels by the matching city IDs
-        const cityIds = matchingCities.map(c => c.id);
-        console.log('✅ Found cities, using IDs:', cityIds);
-        query = query.in('city_id', cityIds);
-      } else {
-        // No matching cities found, return empty result by using impossible condition
-        console.warn('⚠️ No matching cities found for:', cityName);
-        query = query.eq('city_id', '00000000-0000-0000-0000-000000000000'); // Invalid UUID that won't match any records
-      }
+      query = query.ilike('cities.name', `%${cityName}%`);
     }
     if (state) {
       query = query.eq('state', state);
@@ -465,26 +445,18 @@ export class PropertySearchService {
     byOccupancyClass: Record<string, number>;
     byZonedByRight: Record<string, number>;
   }> {
-    // Build base query without FOIA filters
-    let baseQuery = supabase.from('parcels').select('*', { count: 'exact', head: true });
-
     // Apply non-FOIA filters to get relevant subset
     const { foiaFilters, ...nonFoiaFilters } = baseCriteria;
+
+    // Build base query without FOIA filters (city matched through an inner-joined
+    // cities embed, same as searchProperties)
+    let baseQuery = supabase
+      .from('parcels')
+      .select(nonFoiaFilters.city ? 'id, cities!city_id!inner(name)' : '*', { count: 'exact', head: true });
     
     if (nonFoiaFilters.city) {
-      // Same fix as searchProperties - need to use city_id instead of city column
       const cityName = nonFoiaFilters.city.split(',')[0].trim();
-      const { data: matchingCities } = await supabase
-        .from('cities')
-        .select('id')
-        .ilike('name', `%${cityName}%`);
-        
-      if (matchingCities && matchingCities.length > 0) {
-        const cityIds = matchingCities.map(c => c.id);
-        baseQuery = baseQuery.in('city_id', cityIds);
-      } else {
-        baseQuery = baseQuery.eq('city_id', '00000000-0000-0000-0000-000000000000');
-      }
+      baseQuery = baseQuery.ilike('cities.name', `%${cityName}%`);
     }
     // Removed current_occupancy filter - column doesn't exist in database
     /*
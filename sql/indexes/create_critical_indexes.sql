@@ -30,6 +30,17 @@ ON parcels(zoned_by_right) WHERE zoned_by_right IS NOT NULL;
 CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_parcels_occupancy_class 
 ON parcels(occupancy_class) WHERE occupancy_class IS NOT NULL;
 
+-- Occupancy substring search (the API matches ILIKE '%term%', which a b-tree
+-- cannot serve; a trigram GIN index can)
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_parcels_occupancy_trgm 
+ON parcels USING gin (occupancy_class gin_trgm_ops) WHERE occupancy_class IS NOT NULL;
+
+-- Fuzzy address shortlist for FOIA matching (DatabaseManager.find_similar_addresses
+-- filters on upper(address) % term, which this trigram index serves)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_parcels_address_trgm 
+ON parcels USING gin (upper(address) gin_trgm_ops) WHERE address IS NOT NULL;
+
 -- Fire sprinkler filter
 CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_parcels_fire_sprinklers 
 ON parcels(fire_sprinklers) WHERE fire_sprinklers IS NOT NULL;
@@ -42,6 +53,11 @@ ON parcels(fire_sprinklers) WHERE fire_sprinklers IS NOT NULL;
 CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_parcels_city_zoning 
 ON parcels(city_id, zoned_by_right) WHERE zoned_by_right IS NOT NULL;
 
+-- City + sprinklered (only the small fire_sprinklers = true subset is indexed;
+-- keyed like the search predicate on the denormalized city_name, ordered by id)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_parcels_city_name_sprinklers 
+ON parcels(city_name, id) WHERE fire_sprinklers = true;
+
 -- County + zoning (county-wide analysis)
 CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_parcels_county_zoning 
 ON parcels(county_id, zoned_by_right) WHERE zoned_by_right IS NOT NULL;
@@ -50,6 +66,31 @@ ON parcels(county_id, zoned_by_right) WHERE zoned_by_right IS NOT NULL;
 CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_parcels_property_value 
 ON parcels(property_value DESC) WHERE property_value IS NOT NULL;
 
+-- ========================================
+-- PRIORITY 4: Diagnostic Lookups
+-- ========================================
+
+-- Parcels with enhanced data (matches find_test_property.py predicate exactly,
+-- so the LIMIT 3 lookup is an index scan instead of a full table scan)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_parcels_enhanced 
+ON parcels(id) WHERE zoning_code IS NOT NULL AND parcel_sqft IS NOT NULL;
+
+-- City name substring search (the Fort Worth debug scripts match name ILIKE
+-- '%Fort Worth%', which needs a trigram index instead of a full scan of cities)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_cities_name_trgm 
+ON cities USING gin (name gin_trgm_ops);
+
+-- ========================================
+-- Superseded Indexes
+-- ========================================
+
+-- Search filters on the denormalized city_name/county_name columns
+-- (denormalize_location_names.sql), so these id-keyed covering copies of the
+-- search columns serve no query and only slow down writes
+DROP INDEX CONCURRENTLY IF EXISTS idx_parcels_city_cover;
+DROP INDEX CONCURRENTLY IF EXISTS idx_parcels_county_cover;
+DROP INDEX CONCURRENTLY IF EXISTS idx_parcels_city_sprinklers;
+
 -- ========================================
 -- VERIFICATION QUERIES
 -- ========================================
@@ -76,7 +117,22 @@ ON parcels(property_value DESC) WHERE property_value IS NOT NULL;
 -- FROM parcels 
 -- WHERE parcel_number = '542235';
 
--- 4. Test composite query performance
+-- 4. Test occupancy substring search (should use idx_parcels_occupancy_trgm)
+-- EXPLAIN ANALYZE
+-- SELECT id, parcel_number, address
+-- FROM parcels 
+-- WHERE occupancy_class ILIKE '%group a%'
+-- LIMIT 100;
+
+-- 5. Test fuzzy address shortlist (should use idx_parcels_address_trgm)
+-- EXPLAIN ANALYZE
+-- SELECT id, parcel_number, address, similarity(upper(address), '3909 HULEN ST') AS similarity
+-- FROM parcels 
+-- WHERE upper(address) % '3909 HULEN ST'
+-- ORDER BY similarity DESC
+-- LIMIT 20;
+
+-- 6. Test composite query performance
 -- EXPLAIN ANALYZE
 -- SELECT p.id, p.parcel_number, p.address, c.name as city_name
 -- FROM parcels p
@@ -86,6 +142,12 @@ ON parcels(property_value DESC) WHERE property_value IS NOT NULL;
 -- ORDER BY p.property_value DESC
 -- LIMIT 100;
 
+-- 7. Test city name substring search (should use idx_cities_name_trgm)
+-- EXPLAIN ANALYZE
+-- SELECT id, name
+-- FROM cities 
+-- WHERE name ILIKE '%Fort Worth%';
+
 -- ========================================
 -- INDEX MONITORING
 -- ========================================
@@ -0,0 +1,84 @@
+-- SEEK Property Platform - Denormalized City/County Names
+-- Copies cities.name / counties.name onto parcels so property search can filter
+-- and return location names from parcels alone, without a join per row.
+-- Safe to re-run.
+
+ALTER TABLE parcels
+    ADD COLUMN IF NOT EXISTS city_name TEXT,
+    ADD COLUMN IF NOT EXISTS county_name TEXT;
+
+-- ========================================
+-- Keep parcels in sync
+-- ========================================
+
+-- Fill the names whenever a parcel is created or moved to another city/county
+CREATE OR REPLACE FUNCTION parcels_set_location_names()
+RETURNS TRIGGER AS $$
+BEGIN
+    SELECT name INTO NEW.city_name FROM cities WHERE id = NEW.city_id;
+    SELECT name INTO NEW.county_name FROM counties WHERE id = NEW.county_id;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_parcels_location_names ON parcels;
+CREATE TRIGGER trg_parcels_location_names
+    BEFORE INSERT OR UPDATE OF city_id, county_id ON parcels
+    FOR EACH ROW EXECUTE FUNCTION parcels_set_location_names();
+
+-- Propagate renames (rare) to the parcels that carry the old name
+CREATE OR REPLACE FUNCTION cities_propagate_name()
+RETURNS TRIGGER AS $$
+BEGIN
+    UPDATE parcels SET city_name = NEW.name WHERE city_id = NEW.id;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_cities_propagate_name ON cities;
+CREATE TRIGGER trg_cities_propagate_name
+    AFTER UPDATE OF name ON cities
+    FOR EACH ROW WHEN (OLD.name IS DISTINCT FROM NEW.name)
+    EXECUTE FUNCTION cities_propagate_name();
+
+CREATE OR REPLACE FUNCTION counties_propagate_name()
+RETURNS TRIGGER AS $$
+BEGIN
+    UPDATE parcels SET county_name = NEW.name WHERE county_id = NEW.id;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_counties_propagate_name ON counties;
+CREATE TRIGGER trg_counties_propagate_name
+    AFTER UPDATE OF name ON counties
+    FOR EACH ROW WHEN (OLD.name IS DISTINCT FROM NEW.name)
+    EXECUTE FUNCTION counties_propagate_name();
+
+-- ========================================
+-- Backfill existing parcels
+-- ========================================
+
+UPDATE parcels p
+SET city_name = c.name
+FROM cities c
+WHERE c.id = p.city_id
+  AND p.city_name IS DISTINCT FROM c.name;
+
+UPDATE parcels p
+SET county_name = co.name
+FROM counties co
+WHERE co.id = p.county_id
+  AND p.county_name IS DISTINCT FROM co.name;
+
+-- ========================================
+-- Search indexes (name filters, ordered by id for keyset pages)
+-- ========================================
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_parcels_city_name 
+ON parcels(city_name, id);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_parcels_county_name 
+ON parcels(county_name, id);
+
+ANALYZE parcels;
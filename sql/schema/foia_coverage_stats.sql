@@ -0,0 +1,18 @@
+-- FOIA Coverage Statistics
+-- Counts total parcels and FOIA field coverage in a single scan.
+-- Called by PropertySearchAPI.get_foia_statistics via
+--   supabase.rpc('foia_coverage_stats')
+--
+-- Replaces four separate count queries (one per column) with conditional
+-- aggregation, so the API pays one round trip and one pass over parcels.
+
+CREATE OR REPLACE FUNCTION foia_coverage_stats()
+RETURNS JSON AS $$
+    SELECT json_build_object(
+        'total', count(*),
+        'fire_sprinklers', count(*) FILTER (WHERE fire_sprinklers IS NOT NULL),
+        'zoned_by_right', count(*) FILTER (WHERE zoned_by_right IS NOT NULL),
+        'occupancy_class', count(*) FILTER (WHERE occupancy_class IS NOT NULL)
+    )
+    FROM parcels
+$$ LANGUAGE sql STABLE;
@@ -0,0 +1,123 @@
+-- SEEK Property Platform - Property Search Function
+-- Non-spatial property search as a single RPC, used by
+-- PropertySearchAPI._build_property_query via supabase.rpc('search_parcels', ...).
+-- Requires denormalize_location_names.sql (parcels.city_name / county_name).
+--
+-- Only the filters actually present are added to the WHERE clause, with their
+-- values inlined as quoted literals, so each call is planned for its exact
+-- predicate instead of a generic "filter IS NULL OR ..." plan that cannot use
+-- the partial and covering indexes.
+--
+-- filters keys (all optional): city_name, county_name, fire_sprinklers,
+-- zoned_by_right, occupancy_class, min_value, max_value
+-- Returns the same row shape as search_parcels_radius.
+--
+-- search_parcels_count(filters) returns the exact number of matching rows
+-- across all pages; the API calls it only when a caller sets include_total.
+
+-- WHERE conditions for the filters present (shared by search_parcels and
+-- search_parcels_count)
+CREATE OR REPLACE FUNCTION search_parcels_conditions(filters JSONB)
+RETURNS TEXT[] AS $$
+DECLARE
+    conditions TEXT[] := ARRAY['TRUE'];
+BEGIN
+    IF filters ? 'city_name' THEN
+        conditions := conditions || format('p.city_name = %L', filters->>'city_name');
+    END IF;
+    IF filters ? 'county_name' THEN
+        conditions := conditions || format('p.county_name = %L', filters->>'county_name');
+    END IF;
+    IF filters ? 'fire_sprinklers' THEN
+        conditions := conditions || format('p.fire_sprinklers = %L::BOOLEAN', filters->>'fire_sprinklers');
+    END IF;
+    IF filters ? 'zoned_by_right' THEN
+        conditions := conditions || format('p.zoned_by_right = %L', filters->>'zoned_by_right');
+    END IF;
+    IF filters ? 'occupancy_class' THEN
+        -- LIKE wildcards in the term are escaped so it matches literally (idx_parcels_occupancy_trgm)
+        conditions := conditions || format(
+            'p.occupancy_class ILIKE %L',
+            '%' || regexp_replace(filters->>'occupancy_class', '([\\%_])', '\\\1', 'g') || '%'
+        );
+    END IF;
+    IF filters ? 'min_value' THEN
+        conditions := conditions || format('p.property_value >= %L::NUMERIC', filters->>'min_value');
+    END IF;
+    IF filters ? 'max_value' THEN
+        conditions := conditions || format('p.property_value <= %L::NUMERIC', filters->>'max_value');
+    END IF;
+
+    RETURN conditions;
+END;
+$$ LANGUAGE plpgsql IMMUTABLE;
+
+CREATE OR REPLACE FUNCTION search_parcels(
+    filters JSONB DEFAULT '{}'::jsonb,
+    lim INTEGER DEFAULT 50,
+    cur UUID DEFAULT NULL,
+    off INTEGER DEFAULT 0
+)
+RETURNS TABLE (
+    id UUID,
+    parcel_number TEXT,
+    address TEXT,
+    owner_name TEXT,
+    property_value NUMERIC,
+    lot_size NUMERIC,
+    latitude DOUBLE PRECISION,
+    longitude DOUBLE PRECISION,
+    zoned_by_right TEXT,
+    occupancy_class TEXT,
+    fire_sprinklers BOOLEAN,
+    city_name TEXT,
+    county_name TEXT
+) AS $$
+DECLARE
+    conditions TEXT[] := search_parcels_conditions(filters);
+BEGIN
+    IF cur IS NOT NULL THEN
+        conditions := conditions || 'p.id > $2'::TEXT;
+    END IF;
+
+    RETURN QUERY EXECUTE format(
+        'SELECT
+            p.id,
+            p.parcel_number::TEXT,
+            p.address::TEXT,
+            p.owner_name::TEXT,
+            p.property_value::NUMERIC,
+            p.lot_size::NUMERIC,
+            p.latitude::DOUBLE PRECISION,
+            p.longitude::DOUBLE PRECISION,
+            p.zoned_by_right::TEXT,
+            p.occupancy_class::TEXT,
+            p.fire_sprinklers,
+            p.city_name,
+            p.county_name
+        FROM parcels p
+        WHERE %s
+        ORDER BY p.id
+        LIMIT $1
+        OFFSET $3',
+        array_to_string(conditions, ' AND ')
+    ) USING lim, cur, off;
+END;
+$$ LANGUAGE plpgsql STABLE;
+
+CREATE OR REPLACE FUNCTION search_parcels_count(filters JSONB DEFAULT '{}'::jsonb)
+RETURNS BIGINT AS $$
+DECLARE
+    total BIGINT;
+BEGIN
+    EXECUTE format(
+        'SELECT count(*) FROM parcels p WHERE %s',
+        array_to_string(search_parcels_conditions(filters), ' AND ')
+    ) INTO total;
+    RETURN total;
+END;
+$$ LANGUAGE plpgsql STABLE;
+
+-- Example:
+-- SELECT search_parcels_count('{"city_name": "Austin"}'::jsonb);
+-- SELECT * FROM search_parcels('{"city_name": "Austin", "fire_sprinklers": true}'::jsonb, 50);
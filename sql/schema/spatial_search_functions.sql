@@ -0,0 +1,131 @@
+-- SEEK Property Platform - Spatial Search Functions
+-- Radius search backed by an index-sargable ST_DWithin predicate.
+-- Requires add_spatial_geometry.sql (PostGIS + parcels.geom) to have been applied.
+
+-- ST_DWithin on geography needs a GIST index on the same expression; the plain
+-- idx_parcels_geom index on geometry cannot serve the geom::geography cast.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_parcels_geog
+ON parcels USING GIST ((geom::geography));
+
+-- Bounding-box prefilter for the radius search (see below) is served by the
+-- existing idx_parcels_coordinates (latitude, longitude) index.
+
+-- Replace the earlier signature without the bounding-box arguments
+DROP FUNCTION IF EXISTS search_parcels_radius(
+    DOUBLE PRECISION, DOUBLE PRECISION, DOUBLE PRECISION, JSONB, INTEGER, UUID, INTEGER
+);
+
+-- The return type changed (denormalized city/county names), which CREATE OR
+-- REPLACE cannot do in place
+DROP FUNCTION IF EXISTS search_parcels_radius(
+    DOUBLE PRECISION, DOUBLE PRECISION, DOUBLE PRECISION, DOUBLE PRECISION,
+    DOUBLE PRECISION, DOUBLE PRECISION, DOUBLE PRECISION, JSONB, INTEGER, UUID, INTEGER
+);
+
+-- Radius search used by PropertySearchAPI._build_property_query.
+-- Returns the same columns as the PostgREST search select, including the
+-- denormalized city_name/county_name (denormalize_location_names.sql), so both
+-- code paths share one row shape.
+--
+-- filters keys (all optional): city_name, county_name, fire_sprinklers,
+-- zoned_by_right, occupancy_class, min_value, max_value
+--
+-- min_lat/max_lat/min_lng/max_lng are the degree bounding box enclosing the
+-- radius, computed by the caller; the cheap b-tree range check discards most
+-- rows before the ST_DWithin distance test runs.
+CREATE OR REPLACE FUNCTION search_parcels_radius(
+    lat DOUBLE PRECISION,
+    lng DOUBLE PRECISION,
+    radius_m DOUBLE PRECISION,
+    min_lat DOUBLE PRECISION,
+    max_lat DOUBLE PRECISION,
+    min_lng DOUBLE PRECISION,
+    max_lng DOUBLE PRECISION,
+    filters JSONB DEFAULT '{}'::jsonb,
+    lim INTEGER DEFAULT 50,
+    cur UUID DEFAULT NULL,
+    off INTEGER DEFAULT 0
+)
+RETURNS TABLE (
+    id UUID,
+    parcel_number TEXT,
+    address TEXT,
+    owner_name TEXT,
+    property_value NUMERIC,
+    lot_size NUMERIC,
+    latitude DOUBLE PRECISION,
+    longitude DOUBLE PRECISION,
+    zoned_by_right TEXT,
+    occupancy_class TEXT,
+    fire_sprinklers BOOLEAN,
+    city_name TEXT,
+    county_name TEXT
+) AS $$
+BEGIN
+    RETURN QUERY
+    SELECT
+        p.id,
+        p.parcel_number::TEXT,
+        p.address::TEXT,
+        p.owner_name::TEXT,
+        p.property_value::NUMERIC,
+        p.lot_size::NUMERIC,
+        p.latitude::DOUBLE PRECISION,
+        p.longitude::DOUBLE PRECISION,
+        p.zoned_by_right::TEXT,
+        p.occupancy_class::TEXT,
+        p.fire_sprinklers,
+        p.city_name,
+        p.county_name
+    FROM parcels p
+    WHERE p.latitude BETWEEN min_lat AND max_lat
+      AND p.longitude BETWEEN min_lng AND max_lng
+      AND ST_DWithin(p.geom::geography, ST_MakePoint(lng, lat)::geography, radius_m)
+      AND (cur IS NULL OR p.id > cur)
+      AND (NOT filters ? 'city_name' OR p.city_name = filters->>'city_name')
+      AND (NOT filters ? 'county_name' OR p.county_name = filters->>'county_name')
+      AND (NOT filters ? 'fire_sprinklers' OR p.fire_sprinklers = (filters->>'fire_sprinklers')::BOOLEAN)
+      AND (NOT filters ? 'zoned_by_right' OR p.zoned_by_right = filters->>'zoned_by_right')
+      -- LIKE wildcards in the term are escaped so it matches literally (idx_parcels_occupancy_trgm)
+      AND (NOT filters ? 'occupancy_class' OR p.occupancy_class ILIKE
+           '%' || regexp_replace(filters->>'occupancy_class', '([\\%_])', '\\\1', 'g') || '%')
+      AND (NOT filters ? 'min_value' OR p.property_value >= (filters->>'min_value')::NUMERIC)
+      AND (NOT filters ? 'max_value' OR p.property_value <= (filters->>'max_value')::NUMERIC)
+    ORDER BY p.id
+    LIMIT lim
+    OFFSET off;
+END;
+$$ LANGUAGE plpgsql STABLE;
+
+-- Exact number of parcels search_parcels_radius would return across all pages;
+-- called by the API only when a caller sets include_total
+CREATE OR REPLACE FUNCTION search_parcels_radius_count(
+    lat DOUBLE PRECISION,
+    lng DOUBLE PRECISION,
+    radius_m DOUBLE PRECISION,
+    min_lat DOUBLE PRECISION,
+    max_lat DOUBLE PRECISION,
+    min_lng DOUBLE PRECISION,
+    max_lng DOUBLE PRECISION,
+    filters JSONB DEFAULT '{}'::jsonb
+)
+RETURNS BIGINT AS $$
+    SELECT count(*)
+    FROM parcels p
+    WHERE p.latitude BETWEEN min_lat AND max_lat
+      AND p.longitude BETWEEN min_lng AND max_lng
+      AND ST_DWithin(p.geom::geography, ST_MakePoint(lng, lat)::geography, radius_m)
+      AND (NOT filters ? 'city_name' OR p.city_name = filters->>'city_name')
+      AND (NOT filters ? 'county_name' OR p.county_name = filters->>'county_name')
+      AND (NOT filters ? 'fire_sprinklers' OR p.fire_sprinklers = (filters->>'fire_sprinklers')::BOOLEAN)
+      AND (NOT filters ? 'zoned_by_right' OR p.zoned_by_right = filters->>'zoned_by_right')
+      AND (NOT filters ? 'occupancy_class' OR p.occupancy_class ILIKE
+           '%' || regexp_replace(filters->>'occupancy_class', '([\\%_])', '\\\1', 'g') || '%')
+      AND (NOT filters ? 'min_value' OR p.property_value >= (filters->>'min_value')::NUMERIC)
+      AND (NOT filters ? 'max_value' OR p.property_value <= (filters->>'max_value')::NUMERIC);
+$$ LANGUAGE sql STABLE;
+
+-- Example:
+-- SELECT * FROM search_parcels_radius(
+--     29.4241, -98.4936, 5000, 29.379, 29.469, -98.545, -98.442, '{"fire_sprinklers": true}'::jsonb, 50
+-- );
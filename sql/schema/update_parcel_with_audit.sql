@@ -0,0 +1,59 @@
+-- SEEK Property Platform - Audited Parcel Update
+-- Updates a parcel and records the change in audit_logs in one transaction.
+-- Called via supabase.rpc('update_parcel_with_audit', {...}) in place of the
+-- separate "read current row, update parcel, insert audit log" requests, so an
+-- edit costs one round trip. The row is locked while it is read, so no other
+-- writer can change it between the old_values snapshot and the update.
+--
+-- p_new holds the changed columns only, e.g. {"zoning_code": "RS-7.2"}; keys
+-- must be parcels column names (updated_at is always set to now()).
+-- old_values/new_values/changed_fields cover just those columns.
+-- Returns the inserted audit_logs row.
+
+CREATE OR REPLACE FUNCTION update_parcel_with_audit(
+    p_id UUID,
+    p_new JSONB,
+    p_session UUID DEFAULT NULL,
+    p_user UUID DEFAULT NULL
+)
+RETURNS audit_logs AS $$
+DECLARE
+    old_row parcels;
+    new_row parcels;
+    set_clause TEXT;
+    fields TEXT[];
+    audit audit_logs;
+BEGIN
+    p_new := p_new - 'id' - 'updated_at';
+
+    SELECT * INTO old_row FROM parcels WHERE id = p_id FOR UPDATE;
+    IF NOT FOUND THEN
+        RAISE EXCEPTION 'parcel % not found', p_id;
+    END IF;
+
+    SELECT array_agg(key ORDER BY key),
+           string_agg(format('%I = ($1).%I', key, key), ', ')
+    INTO fields, set_clause
+    FROM jsonb_object_keys(p_new) AS key;
+
+    IF fields IS NULL THEN
+        RAISE EXCEPTION 'no columns to update for parcel %', p_id;
+    END IF;
+
+    new_row := jsonb_populate_record(old_row, p_new);
+    EXECUTE format('UPDATE parcels SET %s, updated_at = now() WHERE id = $2', set_clause)
+    USING new_row, p_id;
+
+    INSERT INTO audit_logs (table_name, record_id, operation, user_id,
+                            old_values, new_values, changed_fields, session_id)
+    VALUES (
+        'parcels', p_id, 'UPDATE', p_user,
+        (SELECT jsonb_object_agg(f, to_jsonb(old_row) -> f) FROM unnest(fields) AS f),
+        (SELECT jsonb_object_agg(f, to_jsonb(new_row) -> f) FROM unnest(fields) AS f),
+        fields, p_session
+    )
+    RETURNING * INTO audit;
+
+    RETURN audit;
+END;
+$$ LANGUAGE plpgsql;
@@ -0,0 +1,50 @@
+-- Merge Duplicate County
+-- Removes a duplicate county and its (duplicate) parcels in one transaction.
+-- Called by scripts/utilities/fix_county_names.py via
+--   supabase.rpc('merge_duplicate_county', {'dup_name': ..., 'keep_name': ...})
+--
+-- Returns one (action, cnt) row per step so the caller can report what happened
+-- without any extra round trips. Missing counties are reported as
+-- 'keep_county_missing' / 'dup_county_missing' and nothing is deleted.
+--
+-- Runs with the caller's privileges (the script uses the service key), and
+-- EXECUTE is restricted to service_role so the function cannot be reached
+-- through PostgREST with the anon or authenticated keys.
+
+CREATE OR REPLACE FUNCTION merge_duplicate_county(dup_name TEXT, keep_name TEXT)
+RETURNS TABLE (
+    action TEXT,
+    cnt BIGINT
+) AS $$
+DECLARE
+    keep_id UUID;
+    dup_id UUID;
+BEGIN
+    SELECT c.id INTO keep_id FROM counties c WHERE c.name = keep_name LIMIT 1;
+    IF keep_id IS NULL THEN
+        RETURN QUERY SELECT 'keep_county_missing'::TEXT, 0::BIGINT;
+        RETURN;
+    END IF;
+
+    -- Lock the duplicate row so no parcels can be attached to it mid-merge
+    SELECT c.id INTO dup_id FROM counties c WHERE c.name = dup_name LIMIT 1 FOR UPDATE;
+    IF dup_id IS NULL THEN
+        RETURN QUERY SELECT 'dup_county_missing'::TEXT, 0::BIGINT;
+        RETURN;
+    END IF;
+
+    RETURN QUERY SELECT 'keep_county_parcels'::TEXT, COUNT(*) FROM parcels p WHERE p.county_id = keep_id;
+
+    RETURN QUERY
+    WITH deleted AS (
+        DELETE FROM parcels p WHERE p.county_id = dup_id RETURNING 1
+    )
+    SELECT 'parcels_deleted'::TEXT, COUNT(*) FROM deleted;
+
+    DELETE FROM counties c WHERE c.id = dup_id;
+    RETURN QUERY SELECT 'county_deleted'::TEXT, 1::BIGINT;
+END;
+$$ LANGUAGE plpgsql;
+
+REVOKE EXECUTE ON FUNCTION merge_duplicate_county(TEXT, TEXT) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION merge_duplicate_county(TEXT, TEXT) TO service_role;
@@ -5,14 +5,184 @@ RESTful API endpoints for property search with FOIA filtering capabilities.
 Handles spatial queries, city-based search, and advanced filtering.
 """
 
+import atexit
+import base64
+import binascii
+import json
 import logging
-from datetime import datetime
-from typing import Any
-
-from supabase import Client
+import math
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime
+from typing import Any, Optional
+
+import httpx
+from dotenv import load_dotenv
+from postgrest.exceptions import APIError
+from supabase import Client, ClientOptions, create_client
+
+from src.utils.cache import cached_json, invalidate
 
 logger = logging.getLogger(__name__)
 
+# OFFSET pagination scans and discards every skipped row; `page` keeps working at
+# any depth, but pages past this one log a warning pointing at `next_cursor`
+DEEP_OFFSET_PAGES = 10
+
+SPATIAL_KEYS = ("center_lat", "center_lng", "radius_km")
+
+# Approximate length of one degree of latitude
+KM_PER_DEGREE = 111.0
+
+# Non-spatial filters forwarded to the search_parcels / search_parcels_radius RPCs
+RPC_FILTER_KEYS = (
+    "city_name",
+    "county_name",
+    "fire_sprinklers",
+    "zoned_by_right",
+    "occupancy_class",
+    "min_value",
+    "max_value",
+)
+
+
+# Free-text criteria, trimmed and capped at MAX_STRING_LENGTH characters
+STRING_FIELDS = ("city_name", "county_name", "zoned_by_right", "occupancy_class")
+MAX_STRING_LENGTH = 100
+
+# (field, min, max) clamps for numeric criteria
+NUMERIC_BOUNDS = (
+    ("min_value", 0, 1000000000),
+    ("max_value", 0, 1000000000),
+    ("center_lat", 25.0, 37.0),  # Texas bounds
+    ("center_lng", -107.0, -93.0),
+    ("radius_km", 0.1, 100.0),
+)
+
+
+def encode_cursor(last_id: str) -> str:
+    """Encode the last row id of a page as an opaque pagination cursor."""
+    return base64.urlsafe_b64encode(str(last_id).encode()).decode()
+
+
+def decode_cursor(cursor: str) -> str:
+    """Decode a pagination cursor back to the row id it points after."""
+    try:
+        return base64.urlsafe_b64decode(cursor.encode()).decode()
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise ValueError("Invalid pagination cursor") from e
+
+# Shared HTTP pool for the process-wide client: enough connections for concurrent
+# requests without exceeding the Supabase connection ceiling
+HTTP_POOL_LIMITS = httpx.Limits(max_connections=60, max_keepalive_connections=40, keepalive_expiry=60)
+HTTP_TIMEOUT_SECONDS = 30
+
+# Speculative next-page fetches: how long a prefetched page stays usable and how
+# many are kept per API instance
+PREFETCH_TTL_SECONDS = 30
+PREFETCH_MAX_ENTRIES = 256
+
+PREFETCH_WORKERS = 4
+
+# FOIA coverage only changes when an import runs, which invalidates this key
+FOIA_STATS_CACHE_KEY = "foia:stats:v1"
+FOIA_STATS_TTL_SECONDS = 300
+
+# (statistic name, parcels column) pairs reported by foia_coverage_stats()
+FOIA_COVERAGE_COLUMNS = (
+    ("fire_sprinklers_coverage", "fire_sprinklers"),
+    ("zoning_coverage", "zoned_by_right"),
+    ("occupancy_coverage", "occupancy_class"),
+)
+
+_client: Optional[Client] = None
+_client_lock = threading.Lock()
+
+
+def _get_client() -> Client:
+    """Get the process-wide Supabase client, creating it and its HTTP pool on first use."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                load_dotenv()
+                supabase_url = os.getenv("SUPABASE_URL")
+                supabase_key = os.getenv("SUPABASE_SERVICE_KEY")
+
+                if not supabase_url or not supabase_key:
+                    raise ValueError("SUPABASE_URL and SUPABASE_SERVICE_KEY must be set")
+
+                http_client = httpx.Client(
+                    timeout=HTTP_TIMEOUT_SECONDS, limits=HTTP_POOL_LIMITS, follow_redirects=True, http2=True
+                )
+                _client = create_client(
+                    supabase_url,
+                    supabase_key,
+                    options=ClientOptions(postgrest_client_timeout=HTTP_TIMEOUT_SECONDS, httpx_client=http_client),
+                )
+                logger.info("Shared Supabase client initialized")
+
+    return _client
+
+
+_prefetch_executor: Optional[ThreadPoolExecutor] = None
+_prefetch_executor_lock = threading.Lock()
+
+
+def _get_prefetch_executor() -> ThreadPoolExecutor:
+    """Get the prefetch thread pool, starting it on first use and stopping it at exit."""
+    global _prefetch_executor
+    if _prefetch_executor is None:
+        with _prefetch_executor_lock:
+            if _prefetch_executor is None:
+                _prefetch_executor = ThreadPoolExecutor(max_workers=PREFETCH_WORKERS, thread_name_prefix="search-prefetch")
+                atexit.register(_prefetch_executor.shutdown, wait=False, cancel_futures=True)
+    return _prefetch_executor
+
+
+def escape_like(value: str) -> str:
+    """Escape LIKE wildcards so user input matches literally inside a %...% pattern."""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def validate_criteria_batch(df):
+    """
+    Clamp the numeric criteria columns of a pandas DataFrame to NUMERIC_BOUNDS in bulk.
+
+    Vectorized counterpart of the numeric part of _validate_search_criteria for
+    batch callers: each column is clipped with one numpy call instead of a
+    Python min/max per row. Non-numeric values become NaN. Returns a new frame.
+    """
+    import numpy as np
+    import pandas as pd
+
+    df = df.copy()
+    for field, min_val, max_val in NUMERIC_BOUNDS:
+        if field in df.columns:
+            df[field] = np.clip(pd.to_numeric(df[field], errors="coerce").astype("float64"), min_val, max_val)
+    return df
+
+
+def utc_timestamp() -> str:
+    """Current UTC time in ISO 8601."""
+    return datetime.now(UTC).isoformat()
+
+
+def bounding_box(lat: float, lng: float, radius_km: float) -> tuple[float, float, float, float]:
+    """Degree bounding box (min_lat, max_lat, min_lng, max_lng) enclosing a radius around a point."""
+    dlat = radius_km / KM_PER_DEGREE
+    dlng = radius_km / (KM_PER_DEGREE * math.cos(math.radians(lat)))
+    return lat - dlat, lat + dlat, lng - dlng, lng + dlng
+
+
+def invalidate_foia_statistics_cache() -> None:
+    """Drop cached FOIA statistics; call after a FOIA import changes parcel data."""
+    invalidate(FOIA_STATS_CACHE_KEY)
+
 
 class PropertySearchAPI:
     """
@@ -26,8 +196,15 @@ class PropertySearchAPI:
     - Performance optimization with indexes
     """
 
-    def __init__(self, supabase_client: Client):
-        self.client = supabase_client
+    def __init__(self, supabase_client: Optional[Client] = None, prefetch_next_page: bool = False):
+        # Reuse the process-wide client so requests share one warm connection pool
+        self.client = supabase_client if supabase_client is not None else _get_client()
+
+        # Interactive browsers almost always ask for next_cursor next, so its query can
+        # start in the background while the current page is rendered
+        self.prefetch_next_page = prefetch_next_page
+        self._prefetched: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._prefetch_lock = threading.Lock()
 
     def search_properties(self, criteria: dict[str, Any]) -> dict[str, Any]:
         """
@@ -45,37 +222,126 @@ class PropertySearchAPI:
                 - center_lat: float (optional) - for radius search
                 - center_lng: float (optional) - for radius search
                 - radius_km: float (optional) - search radius in km
-                - page: int (default: 1)
+                - cursor: str (optional) - `next_cursor` from the previous page
+                - page: int (default: 1; ignored when cursor is set)
                 - limit: int (default: 50, max: 1000)
+                - include_total: bool (default: False) - return the exact total_count
+
+        Pagination is keyset-based: pass the returned `next_cursor` to fetch the
+        following page in constant time regardless of depth. `page` is kept for
+        shallow jumps only, since OFFSET cost grows with the page number.
+
+        Counting every match costs a scan of the whole result set, so no count is
+        requested by default and `total_count` is None. With `include_total` the
+        total comes from a separate count query (search_parcels_count /
+        search_parcels_radius_count); clients that show a result total should set
+        it on the first page only and keep that total while following `next_cursor`.
 
         Returns:
-            Dictionary with properties, total count, and metadata
+            Dictionary with properties, total count, next_cursor, and metadata
         """
         try:
             # Validate and sanitize inputs
             validated_criteria = self._validate_search_criteria(criteria)
 
-            # Build query
-            query = self._build_property_query(validated_criteria)
+            # Execute search, using a prefetched page when one is waiting
+            result = self._take_prefetched(validated_criteria) if self.prefetch_next_page else None
+            if result is None:
+                result = self._execute_search(validated_criteria)
+
+            # A full page means there may be more rows after its last id
+            next_cursor: Optional[str] = None
+            if result.data and len(result.data) == validated_criteria["limit"]:
+                next_cursor = encode_cursor(result.data[-1]["id"])
+                if self.prefetch_next_page:
+                    self._schedule_prefetch(validated_criteria, next_cursor)
 
-            # Execute search
-            result = query.execute()
+            total_count = self._total_count(validated_criteria, result) if validated_criteria["include_total"] else None
 
             return {
                 "success": True,
                 "properties": result.data,
                 "count": len(result.data),
-                "total_count": result.count if hasattr(result, "count") else len(result.data),
-                "page": validated_criteria.get("page", 1),
+                "total_count": total_count,
+                "page": validated_criteria.get("page"),
                 "limit": validated_criteria.get("limit", 50),
+                "next_cursor": next_cursor,
                 "criteria": validated_criteria,
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": utc_timestamp(),
             }
 
         except Exception as e:
             logger.error(f"Property search failed: {e}")
             return {"success": False, "error": str(e), "properties": [], "count": 0}
 
+    def iter_properties(self, criteria: dict[str, Any]) -> Iterator[dict[str, Any]]:
+        """
+        Yield every matching property, fetching one keyset page at a time.
+
+        Takes the same criteria as search_properties (`limit` sets the page size,
+        `page` is ignored). Only one page is held in memory, so exports and other
+        bulk consumers can walk large result sets without materializing them.
+        Errors are raised rather than returned in a response envelope.
+        """
+        validated_criteria = self._validate_search_criteria({**criteria, "page": 1})
+        validated_criteria["include_total"] = False
+
+        while True:
+            rows = self._execute_search(validated_criteria).data or []
+            yield from rows
+
+            if len(rows) < validated_criteria["limit"]:
+                return
+            validated_criteria.pop("page", None)
+            validated_criteria["cursor"] = encode_cursor(rows[-1]["id"])
+
+    def _execute_search(self, criteria: dict[str, Any]):
+        """Build and run the search query for validated criteria."""
+        try:
+            return self._build_property_query(criteria).execute()
+        except APIError as e:
+            # PGRST202: function not found (search_parcels_function.sql not applied yet)
+            if e.code != "PGRST202" or all(k in criteria for k in SPATIAL_KEYS):
+                raise
+            logger.warning("search_parcels() is not deployed; using chained PostgREST filters")
+            return self._build_filter_query(criteria).execute()
+
+    @staticmethod
+    def _prefetch_key(criteria: dict[str, Any]) -> str:
+        return json.dumps(criteria, sort_keys=True, default=str)
+
+    def _schedule_prefetch(self, criteria: dict[str, Any], next_cursor: str) -> None:
+        """Start fetching the page after next_cursor in the background."""
+        next_criteria = {k: v for k, v in criteria.items() if k != "page"}
+        next_criteria["cursor"] = next_cursor
+        next_criteria["include_total"] = False  # totals are a first-page request
+        key = self._prefetch_key(next_criteria)
+
+        with self._prefetch_lock:
+            if key in self._prefetched:
+                return
+            future = _get_prefetch_executor().submit(self._execute_search, next_criteria)
+            self._prefetched[key] = (time.monotonic() + PREFETCH_TTL_SECONDS, future)
+            while len(self._prefetched) > PREFETCH_MAX_ENTRIES:
+                self._prefetched.popitem(last=False)
+
+    def _take_prefetched(self, criteria: dict[str, Any]):
+        """Return the prefetched result for criteria, or None to query live."""
+        with self._prefetch_lock:
+            entry = self._prefetched.pop(self._prefetch_key(criteria), None)
+
+        if entry is None:
+            return None
+        expires_at, future = entry
+        if time.monotonic() > expires_at:
+            future.cancel()
+            return None
+        try:
+            return future.result()
+        except Exception as e:
+            logger.warning(f"Prefetched search failed, querying live: {e}")
+            return None
+
     def search_by_city(self, city_name: str, **filters) -> dict[str, Any]:
         """Search properties by city name with optional FOIA filters."""
         criteria = {"city_name": city_name, **filters}
@@ -118,7 +384,7 @@ class PropertySearchAPI:
             )
 
             if result.data:
-                return {"success": True, "property": result.data, "timestamp": datetime.utcnow().isoformat()}
+                return {"success": True, "property": result.data, "timestamp": utc_timestamp()}
             return {"success": False, "error": "Property not found", "property": None}
 
         except Exception as e:
@@ -126,78 +392,116 @@ class PropertySearchAPI:
             return {"success": False, "error": str(e), "property": None}
 
     def get_foia_statistics(self) -> dict[str, Any]:
-        """Get FOIA data coverage statistics."""
+        """Get FOIA data coverage statistics (cached for FOIA_STATS_TTL_SECONDS)."""
         try:
-            # Get total parcels
-            total_query = getattr(self.client, "from")("parcels")
-            total_result = total_query.select("*", count="exact", head=True).execute()
-            total_parcels = total_result.count or 0
-
-            # Get FOIA coverage stats
-            stats_queries = [
-                ("fire_sprinklers_coverage", "fire_sprinklers", "not.is.null"),
-                ("zoning_coverage", "zoned_by_right", "not.is.null"),
-                ("occupancy_coverage", "occupancy_class", "not.is.null"),
-            ]
-
-            stats = {"total_parcels": total_parcels}
-
-            for stat_name, column, _condition in stats_queries:
-                query = getattr(self.client, "from")("parcels")
-                result = query.select("*", count="exact", head=True).not_(column, "is", None).execute()
-                count = result.count or 0
-                stats[stat_name] = {
-                    "count": count,
-                    "percentage": (count / total_parcels * 100) if total_parcels > 0 else 0,
-                }
-
-            return {"success": True, "statistics": stats, "timestamp": datetime.utcnow().isoformat()}
+            stats = cached_json(FOIA_STATS_CACHE_KEY, FOIA_STATS_TTL_SECONDS, self._compute_foia_statistics)
+            return {"success": True, "statistics": stats, "timestamp": utc_timestamp()}
 
         except Exception as e:
             logger.error(f"FOIA statistics fetch failed: {e}")
             return {"success": False, "error": str(e), "statistics": {}}
 
+    def _compute_foia_statistics(self) -> dict[str, Any]:
+        """Count total parcels and FOIA field coverage in one foia_coverage_stats RPC."""
+        try:
+            counts = self.client.rpc("foia_coverage_stats").execute().data or {}
+        except APIError as e:
+            # PGRST202: function not found (foia_coverage_stats.sql not applied yet)
+            if e.code != "PGRST202":
+                raise
+            logger.warning("foia_coverage_stats() is not deployed; counting coverage per column")
+            counts = self._count_foia_coverage()
+        total_parcels = counts.get("total", 0)
+
+        stats = {"total_parcels": total_parcels}
+
+        for stat_name, column in FOIA_COVERAGE_COLUMNS:
+            count = counts.get(column, 0)
+            stats[stat_name] = {
+                "count": count,
+                "percentage": (count / total_parcels * 100) if total_parcels > 0 else 0,
+            }
+
+        return stats
+
+    def _count_foia_coverage(self) -> dict[str, int]:
+        """Fallback for foia_coverage_stats(): one head-only count per column, run concurrently."""
+
+        def head_count(column: str) -> int:
+            # Selecting only the counted column (never *) keeps PostgREST from resolving
+            # the full column list and lets the planner count from the partial indexes
+            query = getattr(self.client, "from")("parcels").select(column, count="exact", head=True)
+            if column != "id":
+                query = query.not_.is_(column, "null")
+            return query.execute().count or 0
+
+        # The counts are independent, so wall-clock time is the slowest one, not the sum
+        columns = ["id"] + [column for _stat_name, column in FOIA_COVERAGE_COLUMNS]
+        with ThreadPoolExecutor(max_workers=len(columns)) as pool:
+            results = list(pool.map(head_count, columns))
+
+        return dict(zip(["total"] + columns[1:], results, strict=True))
+
     def _validate_search_criteria(self, criteria: dict[str, Any]) -> dict[str, Any]:
         """Validate and sanitize search criteria."""
         validated = {}
 
         # String fields (sanitize for SQL injection prevention)
-        string_fields = ["city_name", "county_name", "zoned_by_right", "occupancy_class"]
-        for field in string_fields:
-            if field in criteria and criteria[field]:
-                value = str(criteria[field]).strip()[:100]  # Limit length
-                if value:
-                    validated[field] = value
+        for field in STRING_FIELDS:
+            value = criteria.get(field)
+            if not value:
+                continue
+            if not isinstance(value, str):
+                value = str(value)
+            value = value.strip()
+            if len(value) > MAX_STRING_LENGTH:
+                value = value[:MAX_STRING_LENGTH]
+            if value:
+                validated[field] = value
 
         # Boolean fields
-        if "fire_sprinklers" in criteria and criteria["fire_sprinklers"] is not None:
-            validated["fire_sprinklers"] = bool(criteria["fire_sprinklers"])
+        sprinklers = criteria.get("fire_sprinklers")
+        if sprinklers is not None:
+            validated["fire_sprinklers"] = bool(sprinklers)
 
         # Numeric fields with bounds
-        numeric_bounds = {
-            "min_value": (0, 1000000000),
-            "max_value": (0, 1000000000),
-            "center_lat": (25.0, 37.0),  # Texas bounds
-            "center_lng": (-107.0, -93.0),
-            "radius_km": (0.1, 100.0),
-        }
-
-        for field, (min_val, max_val) in numeric_bounds.items():
-            if field in criteria and criteria[field] is not None:
-                try:
-                    value = float(criteria[field])
-                    validated[field] = max(min_val, min(max_val, value))
-                except (ValueError, TypeError):
-                    pass
+        for field, min_val, max_val in NUMERIC_BOUNDS:
+            value = criteria.get(field)
+            if value is None:
+                continue
+            try:
+                value = float(value)
+            except (ValueError, TypeError):
+                continue
+            validated[field] = max(min_val, min(max_val, value))
+
+        validated["include_total"] = bool(criteria.get("include_total", False))
 
         # Pagination
-        validated["page"] = max(1, int(criteria.get("page", 1)))
         validated["limit"] = max(1, min(1000, int(criteria.get("limit", 50))))
+        if criteria.get("cursor"):
+            validated["cursor"] = str(criteria["cursor"])
+            decode_cursor(validated["cursor"])  # reject malformed cursors up front
+        else:
+            validated["page"] = max(1, int(criteria.get("page", 1)))
+            if validated["page"] > DEEP_OFFSET_PAGES:
+                logger.warning(
+                    f"Offset page {validated['page']} scans every skipped row; follow next_cursor for deep pages"
+                )
 
         return validated
 
     def _build_property_query(self, criteria: dict[str, Any]):
-        """Build Supabase query from validated criteria."""
+        """Build the search RPC call from validated criteria."""
+        # Radius searches run server-side so the ST_DWithin predicate can use the spatial index
+        if all(k in criteria for k in SPATIAL_KEYS):
+            return self._build_radius_query(criteria)
+
+        # One RPC lets the planner see the whole predicate at once
+        return self.client.rpc("search_parcels", self._rpc_params(criteria))
+
+    def _build_filter_query(self, criteria: dict[str, Any]):
+        """Build the equivalent chained PostgREST query, for databases without search_parcels()."""
         # Start with base query
         query = getattr(self.client, "from")("parcels")
 
@@ -206,17 +510,17 @@ class PropertySearchAPI:
             """
             id, parcel_number, address, owner_name, property_value, lot_size,
             latitude, longitude, zoned_by_right, occupancy_class, fire_sprinklers,
-            cities!inner(name),
-            counties!inner(name)
-        """
+            city_name, county_name
+        """,
+            count=self._count_method(criteria),
         )
 
         # Apply filters
         if "city_name" in criteria:
-            query = query.eq("cities.name", criteria["city_name"])
+            query = query.eq("city_name", criteria["city_name"])
 
         if "county_name" in criteria:
-            query = query.eq("counties.name", criteria["county_name"])
+            query = query.eq("county_name", criteria["county_name"])
 
         if "fire_sprinklers" in criteria:
             query = query.eq("fire_sprinklers", criteria["fire_sprinklers"])
@@ -225,7 +529,8 @@ class PropertySearchAPI:
             query = query.eq("zoned_by_right", criteria["zoned_by_right"])
 
         if "occupancy_class" in criteria:
-            query = query.ilike("occupancy_class", f"%{criteria['occupancy_class']}%")
+            # Served by the idx_parcels_occupancy_trgm trigram index
+            query = query.ilike("occupancy_class", f"%{escape_like(criteria['occupancy_class'])}%")
 
         # Property value range
         if "min_value" in criteria:
@@ -233,14 +538,71 @@ class PropertySearchAPI:
         if "max_value" in criteria:
             query = query.lte("property_value", criteria["max_value"])
 
-        # Spatial filtering (if supported)
-        if all(k in criteria for k in ["center_lat", "center_lng", "radius_km"]):
-            # Note: This would require PostGIS functions - implementation depends on Supabase support
-            pass
-
-        # Pagination
-        offset = (criteria["page"] - 1) * criteria["limit"]
-        query = query.range(offset, offset + criteria["limit"] - 1)
+        # Pagination: keyset when a cursor is present, shallow OFFSET otherwise
+        if "cursor" in criteria:
+            query = query.gt("id", decode_cursor(criteria["cursor"])).limit(criteria["limit"])
+        else:
+            offset = (criteria["page"] - 1) * criteria["limit"]
+            query = query.range(offset, offset + criteria["limit"] - 1)
 
         # Order by (ensure consistent results)
         return query.order("id")
+
+    def _build_radius_query(self, criteria: dict[str, Any]):
+        """Build the search_parcels_radius RPC call for a spatial search."""
+        return self.client.rpc("search_parcels_radius", {**self._radius_params(criteria), **self._rpc_params(criteria)})
+
+    @staticmethod
+    def _radius_params(criteria: dict[str, Any]) -> dict[str, Any]:
+        """Circle and bounding-box arguments of the radius RPCs."""
+        lat, lng, radius_km = criteria["center_lat"], criteria["center_lng"], criteria["radius_km"]
+        min_lat, max_lat, min_lng, max_lng = bounding_box(lat, lng, radius_km)
+        return {
+            "lat": lat,
+            "lng": lng,
+            "radius_m": radius_km * 1000,
+            "min_lat": min_lat,
+            "max_lat": max_lat,
+            "min_lng": min_lng,
+            "max_lng": max_lng,
+        }
+
+    @staticmethod
+    def _rpc_params(criteria: dict[str, Any]) -> dict[str, Any]:
+        """Filter and paging arguments shared by the search RPCs."""
+        params = {"filters": {k: criteria[k] for k in RPC_FILTER_KEYS if k in criteria}, "lim": criteria["limit"]}
+        if "cursor" in criteria:
+            params["cur"] = decode_cursor(criteria["cursor"])
+        else:
+            params["off"] = (criteria["page"] - 1) * criteria["limit"]
+        return params
+
+    @staticmethod
+    def _count_method(criteria: dict[str, Any]) -> Optional[str]:
+        """Exact count on the fallback query when a total was requested; no count header otherwise."""
+        return "exact" if criteria.get("include_total") else None
+
+    def _total_count(self, criteria: dict[str, Any], result) -> Optional[int]:
+        """
+        Number of rows matching criteria across all pages.
+
+        The search RPCs apply LIMIT/OFFSET inside the function, so a PostgREST
+        count on them would only describe the page; the total comes from the
+        companion count RPC instead. The chained fallback query already carries
+        an exact count.
+        """
+        if result.count is not None:
+            return result.count
+
+        filters = {k: criteria[k] for k in RPC_FILTER_KEYS if k in criteria}
+        if all(k in criteria for k in SPATIAL_KEYS):
+            name, params = "search_parcels_radius_count", {**self._radius_params(criteria), "filters": filters}
+        else:
+            name, params = "search_parcels_count", {"filters": filters}
+        try:
+            return self.client.rpc(name, params).execute().data
+        except APIError as e:
+            if e.code != "PGRST202":
+                raise
+            logger.warning(f"{name}() is not deployed; returning no total_count")
+            return None
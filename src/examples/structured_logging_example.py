@@ -6,7 +6,7 @@ provided by the new structlog-based logging system.
 """
 
 from src.utils.logger import setup_logging, get_logger, OperationLogger, log_performance
-from src.utils.logger import log_import_start, log_import_progress, log_address_match
+from src.utils.logger import log_import_start, log_import_progress, log_address_match, progress_scale
 
 
 def main():
@@ -37,7 +37,8 @@ def main():
 
     # Using convenience functions
     log_import_start(service_logger, "data/fort_worth.csv", 1000)
-    log_import_progress(service_logger, processed=250, total=1000, success=245, errors=5)
+    inv_total = progress_scale(1000)  # once per import
+    log_import_progress(service_logger, processed=250, total=1000, success=245, errors=5, inv_total=inv_total)
 
     # Address matching example
     log_address_match(
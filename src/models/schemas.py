@@ -7,9 +7,28 @@ Pydantic models for data validation and serialization across the SEEK platform.
 import re
 from datetime import datetime
 from enum import Enum
-from typing import Any, Optional
-
-from pydantic import BaseModel, Field, root_validator, validator
+from typing import Annotated, Any, Optional
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    StringConstraints,
+    TypeAdapter,
+    ValidationInfo,
+    field_validator,
+    model_validator,
+)
+
+# Patterns compiled once at import instead of on every validated row
+_PARCEL_NUMBER_RE = re.compile(r"^[A-Z0-9\-_]+$")
+_ADDRESS_DIGIT_RE = re.compile(r"\d")
+
+# Constrained string types; pydantic compiles each pattern once per type
+Email = Annotated[str, StringConstraints(pattern=r"^[^@]+@[^@]+\.[^@]+$")]
+ImportSessionStatus = Annotated[str, StringConstraints(pattern=r"^(uploading|processing|completed|failed|rolled_back)$")]
+FOIAUpdateStatus = Annotated[str, StringConstraints(pattern=r"^(pending|applied|failed|skipped)$")]
+AssignmentStatus = Annotated[str, StringConstraints(pattern=r"^(active|completed|cancelled)$")]
 
 
 class ZonedByRightEnum(str, Enum):
@@ -47,16 +66,19 @@ class BaseParcel(BaseModel):
     property_value: Optional[float] = Field(None, ge=0)
     lot_size: Optional[float] = Field(None, ge=0)
 
-    @validator("parcel_number")
-    def validate_parcel_number(self, v):
-        if not re.match(r"^[A-Z0-9\-_]+$", v.upper()):
+    @field_validator("parcel_number")
+    @classmethod
+    def validate_parcel_number(cls, v):
+        v = v.upper()
+        if not _PARCEL_NUMBER_RE.match(v):
             raise ValueError("Parcel number must contain only alphanumeric characters, hyphens, and underscores")
-        return v.upper()
+        return v
 
-    @validator("address")
-    def validate_address(self, v):
+    @field_validator("address")
+    @classmethod
+    def validate_address(cls, v):
         # Basic address validation
-        if not re.search(r"\d", v):
+        if not _ADDRESS_DIGIT_RE.search(v):
             raise ValueError("Address must contain at least one number")
         return v.strip()
 
@@ -68,9 +90,9 @@ class GeographicLocation(BaseModel):
     longitude: Optional[float] = Field(None, ge=-180, le=180)
     geom: Optional[dict[str, Any]] = None  # PostGIS geometry
 
-    @root_validator
-    def validate_coordinates(self, values):
-        lat, lng = values.get("latitude"), values.get("longitude")
+    @model_validator(mode="after")
+    def validate_coordinates(self):
+        lat, lng = self.latitude, self.longitude
         if (lat is None) != (lng is None):
             raise ValueError("Both latitude and longitude must be provided or both must be None")
 
@@ -79,7 +101,7 @@ class GeographicLocation(BaseModel):
             if not (25.837 <= lat <= 36.501 and -106.646 <= lng <= -93.508):
                 raise ValueError("Coordinates must be within Texas boundaries")
 
-        return values
+        return self
 
 
 class FOIAData(BaseModel):
@@ -89,8 +111,9 @@ class FOIAData(BaseModel):
     occupancy_class: Optional[str] = Field(None, max_length=100)
     fire_sprinklers: Optional[bool] = None
 
-    @validator("occupancy_class")
-    def validate_occupancy_class(self, v):
+    @field_validator("occupancy_class")
+    @classmethod
+    def validate_occupancy_class(cls, v):
         if v and len(v.strip()) == 0:
             return None
         return v.strip() if v else None
@@ -108,8 +131,7 @@ class Parcel(BaseParcel, GeographicLocation, FOIAData):
     updated_at: Optional[datetime] = None
     updated_by: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ParcelCreate(BaseParcel, GeographicLocation, FOIAData):
@@ -151,37 +173,42 @@ class PropertySearchCriteria(BaseModel):
     center_lng: Optional[float] = Field(None, ge=-107.0, le=-93.0)
     radius_km: Optional[float] = Field(None, ge=0.1, le=100.0)
 
-    # Pagination
+    # Pagination: keyset `cursor` (the previous page's next_cursor) or a shallow `page`
+    cursor: Optional[str] = Field(None, min_length=1)
     page: int = Field(1, ge=1)
     limit: int = Field(50, ge=1, le=1000)
+    include_total: bool = False
 
-    @root_validator
-    def validate_value_range(self, values):
-        min_val, max_val = values.get("min_value"), values.get("max_value")
+    @model_validator(mode="after")
+    def validate_value_range(self):
+        min_val, max_val = self.min_value, self.max_value
         if min_val is not None and max_val is not None and min_val > max_val:
-            values["min_value"], values["max_value"] = max_val, min_val
-        return values
+            self.min_value, self.max_value = max_val, min_val
+        return self
 
-    @root_validator
-    def validate_spatial_search(self, values):
+    @model_validator(mode="after")
+    def validate_spatial_search(self):
         spatial_fields = ["center_lat", "center_lng", "radius_km"]
-        provided_fields = [f for f in spatial_fields if values.get(f) is not None]
+        provided_fields = [f for f in spatial_fields if getattr(self, f) is not None]
 
         if len(provided_fields) > 0 and len(provided_fields) != 3:
             raise ValueError("For spatial search, center_lat, center_lng, and radius_km must all be provided")
 
-        return values
+        return self
 
 
 class PropertySearchResult(BaseModel):
     """Property search results with metadata."""
 
     success: bool
-    properties: list[Parcel]
+    # Rows come straight from the database, so they are passed through as dicts
+    # rather than re-validated through Parcel on every read
+    properties: list[dict[str, Any]]
     count: int
     total_count: Optional[int] = None
-    page: int
+    page: Optional[int] = None
     limit: int
+    next_cursor: Optional[str] = None
     criteria: PropertySearchCriteria
     timestamp: datetime
     error: Optional[str] = None
@@ -210,13 +237,14 @@ class FOIAImportSession(BaseModel):
     processed_records: int = Field(0, ge=0)
     successful_updates: int = Field(0, ge=0)
     failed_updates: int = Field(0, ge=0)
-    status: str = Field(..., regex=r"^(uploading|processing|completed|failed|rolled_back)$")
+    status: ImportSessionStatus
     created_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
 
-    @validator("processed_records", "successful_updates", "failed_updates")
-    def validate_counts(self, v, values):
-        total = values.get("total_records", 0)
+    @field_validator("processed_records", "successful_updates", "failed_updates")
+    @classmethod
+    def validate_counts(cls, v, info: ValidationInfo):
+        total = info.data.get("total_records", 0)
         if v > total:
             raise ValueError(f"Count cannot exceed total_records ({total})")
         return v
@@ -233,18 +261,27 @@ class FOIAUpdate(BaseModel):
     match_confidence: Optional[float] = Field(None, ge=0.0, le=1.0)
     match_type: Optional[MatchTypeEnum] = None
     field_updates: dict[str, Any] = Field(default_factory=dict)
-    status: str = Field(..., regex=r"^(pending|applied|failed|skipped)$")
+    status: FOIAUpdateStatus
     error_message: Optional[str] = None
     created_at: Optional[datetime] = None
     applied_at: Optional[datetime] = None
 
 
+# Validates a whole batch of import rows in one call instead of one model per row
+foia_update_adapter = TypeAdapter(list[FOIAUpdate])
+
+
+def validate_foia_updates(rows: list[dict[str, Any]]) -> list[FOIAUpdate]:
+    """Validate a batch of FOIA update rows; raises ValidationError listing every bad row."""
+    return foia_update_adapter.validate_python(rows)
+
+
 # User Management Models
 class User(BaseModel):
     """User model."""
 
     id: Optional[str] = None
-    email: str = Field(..., regex=r"^[^@]+@[^@]+\.[^@]+$")
+    email: Email
     full_name: str = Field(..., min_length=1, max_length=100)
     role: UserRoleEnum = UserRoleEnum.USER
     active: bool = True
@@ -259,7 +296,7 @@ class UserAssignment(BaseModel):
     user_id: str
     parcel_id: str
     assigned_by: Optional[str] = None
-    status: str = Field(..., regex=r"^(active|completed|cancelled)$")
+    status: AssignmentStatus
     notes: Optional[str] = Field(None, max_length=1000)
     assigned_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
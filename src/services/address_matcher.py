@@ -5,16 +5,131 @@ Handles fuzzy address matching for FOIA data integration with confidence scoring
 Implements multi-tier matching strategy: exact -> normalized -> fuzzy.
 """
 
+import heapq
 import logging
 import re
+from functools import lru_cache
+from collections.abc import Iterator
 from typing import Optional
 
+import numpy as np
 import usaddress
-from fuzzywuzzy import fuzz
+from rapidfuzz import fuzz, process
+from rapidfuzz.utils import default_process
 
 logger = logging.getLogger(__name__)
 
 
+# Candidate addresses recur across FOIA rows and batches; caching the parsed forms
+# skips repeated regex and usaddress work for strings already seen
+NORMALIZE_CACHE_SIZE = 200_000
+
+# Normalization patterns, compiled once at import
+_WHITESPACE_RE = re.compile(r"\s+")
+_SUITE_RE = re.compile(r"\b(SUITE?|UNIT|APT|APARTMENT|STE|#)\s*[A-Z0-9-]+\b", re.IGNORECASE)
+_LEADING_NUMBER_RE = re.compile(r"^(\d+)")
+
+# Plain "<digits>[letter] <street>" addresses (the vast majority) give their number
+# without running the usaddress CRF parser
+_SIMPLE_NUMBER_RE = re.compile(r"^\s*(\d+[A-Za-z]?)(?=\s)")
+
+_STREET_TYPES = {
+    "ST": "STREET",
+    "AVE": "AVENUE",
+    "DR": "DRIVE",
+    "CT": "COURT",
+    "LN": "LANE",
+    "RD": "ROAD",
+    "BLVD": "BOULEVARD",
+    "PKWY": "PARKWAY",
+    "CIR": "CIRCLE",
+    "PL": "PLACE",
+}
+
+# Two-letter directionals come first so NE/NW/SE/SW win over N/S/E/W
+_DIRECTIONALS = {
+    "NE": "NORTHEAST",
+    "NW": "NORTHWEST",
+    "SE": "SOUTHEAST",
+    "SW": "SOUTHWEST",
+    "N": "NORTH",
+    "S": "SOUTH",
+    "E": "EAST",
+    "W": "WEST",
+}
+
+# One alternation per mapping: a single scan of the address, and a token is only
+# expanded when it stands alone (never inside words like STATION or PLAZA), so an
+# expansion can never be re-matched by a later pattern
+_TOKEN_END = r"\b(?=\s|$|[.,])"  # noqa: S105  # regex lookahead, not a credential
+_STREET_TYPE_RE = re.compile(r"\b(" + "|".join(_STREET_TYPES) + ")" + _TOKEN_END)
+_DIRECTIONAL_RE = re.compile(r"\b(" + "|".join(_DIRECTIONALS) + ")" + _TOKEN_END)
+
+# Weights of the combined similarity score (token_set is most robust for addresses)
+RATIO_WEIGHT = 0.3
+TOKEN_SORT_WEIGHT = 0.3
+TOKEN_SET_WEIGHT = 0.4
+
+# FOIA rows scored per cdist call in batch matching; bounds the uint8 score
+# matrix to CDIST_CHUNK_ROWS x candidates bytes
+CDIST_CHUNK_ROWS = 256
+
+# Indexed matching skips candidates whose character-trigram Jaccard similarity to
+# the FOIA address is below this, before any Levenshtein work
+TRIGRAM_MIN_JACCARD = 0.2
+
+
+def _score_cutoff(remaining: float, weight: float) -> float:
+    """Lowest 0-100 scorer result that can still contribute `remaining` at `weight`."""
+    # Small slack so float rounding never rejects a pair sitting exactly on the threshold
+    return max(0.0, remaining / weight * 100.0 - 1e-6)
+
+
+def _trigrams(text: str) -> frozenset[str]:
+    """Character trigrams of text (the whole string if shorter than three characters)."""
+    if len(text) < 3:
+        return frozenset((text,)) if text else frozenset()
+    return frozenset(text[i : i + 3] for i in range(len(text) - 2))
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def _normalize_address(address: str) -> str:
+    """Cached body of AddressMatcher.normalize_address."""
+    addr = address.upper().strip()
+    addr = _WHITESPACE_RE.sub(" ", addr)  # Remove extra whitespace
+
+    # Remove suite/unit information for better matching
+    addr = _SUITE_RE.sub("", addr)
+
+    # Normalize street types
+    addr = _STREET_TYPE_RE.sub(lambda m: _STREET_TYPES[m.group(1)], addr)
+
+    # Normalize directionals
+    addr = _DIRECTIONAL_RE.sub(lambda m: _DIRECTIONALS[m.group(1)], addr)
+
+    return addr.strip()
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def _extract_street_number(address: str) -> Optional[str]:
+    """Cached body of AddressMatcher.extract_street_number."""
+    match = _SIMPLE_NUMBER_RE.match(address)
+    if match:
+        return match.group(1)
+
+    try:
+        parsed = usaddress.parse(address)
+        for component, label in parsed:
+            if label == "AddressNumber":
+                return component
+    except Exception:
+        # Fallback: extract first number sequence
+        match = _LEADING_NUMBER_RE.match(address.strip())
+        if match:
+            return match.group(1)
+    return None
+
+
 class AddressMatcher:
     """
     Advanced address matching service with fuzzy logic and confidence scoring.
@@ -41,63 +156,19 @@ class AddressMatcher:
         """
         if not address or not isinstance(address, str):
             return ""
-
-        addr = address.upper().strip()
-        addr = re.sub(r"\s+", " ", addr)  # Remove extra whitespace
-
-        # Remove suite/unit information for better matching
-        addr = re.sub(r"\b(SUITE?|UNIT|APT|APARTMENT|STE|#)\s*[A-Z0-9-]+\b", "", addr, flags=re.IGNORECASE)
-
-        # Normalize street types
-        street_type_mapping = {
-            r"\bST\b": "STREET",
-            r"\bAVE\b": "AVENUE",
-            r"\bDR\b": "DRIVE",
-            r"\bCT\b": "COURT",
-            r"\bLN\b": "LANE",
-            r"\bRD\b": "ROAD",
-            r"\bBLVD\b": "BOULEVARD",
-            r"\bPKWY\b": "PARKWAY",
-            r"\bCIR\b": "CIRCLE",
-            r"\bPL\b": "PLACE",
-        }
-
-        for pattern, replacement in street_type_mapping.items():
-            addr = re.sub(pattern, replacement, addr)
-
-        # Normalize directionals
-        directional_mapping = {
-            r"\bN\b": "NORTH",
-            r"\bS\b": "SOUTH",
-            r"\bE\b": "EAST",
-            r"\bW\b": "WEST",
-            r"\bNE\b": "NORTHEAST",
-            r"\bNW\b": "NORTHWEST",
-            r"\bSE\b": "SOUTHEAST",
-            r"\bSW\b": "SOUTHWEST",
-        }
-
-        for pattern, replacement in directional_mapping.items():
-            addr = re.sub(pattern, replacement, addr)
-
-        return addr.strip()
+        return _normalize_address(address)
 
     def extract_street_number(self, address: str) -> Optional[str]:
         """Extract street number from address for validation."""
-        try:
-            parsed = usaddress.parse(address)
-            for component, label in parsed:
-                if label == "AddressNumber":
-                    return component
-        except Exception:
-            # Fallback: extract first number sequence
-            match = re.match(r"^(\d+)", address.strip())
-            if match:
-                return match.group(1)
-        return None
+        return _extract_street_number(address)
 
     def calculate_similarity(self, addr1: str, addr2: str) -> float:
-        """Calculate similarity score between two addresses."""
+        """
+        Calculate similarity score between two addresses.
+
+        Pairs that provably cannot reach confidence_threshold are rejected early and
+        score 0.0; scores at or above the threshold are unaffected.
+        """
         if not addr1 or not addr2:
             return 0.0
 
@@ -105,21 +176,57 @@ class AddressMatcher:
         if addr1 == addr2:
             return 1.0
 
-        # Use multiple fuzzy matching algorithms
-        ratio_score = fuzz.ratio(addr1, addr2) / 100.0
-        token_sort_score = fuzz.token_sort_ratio(addr1, addr2) / 100.0
-        token_set_score = fuzz.token_set_ratio(addr1, addr2) / 100.0
+        threshold = self.confidence_threshold
 
-        # Weight the scores (token_set is most robust for addresses)
-        return ratio_score * 0.3 + token_sort_score * 0.3 + token_set_score * 0.4
+        # fuzz.ratio can be no higher than 2*shorter/(combined length), and the token
+        # scorers at most 1.0 each, so very different-length pairs are rejected in O(1)
+        ratio_bound = 2 * min(len(addr1), len(addr2)) / (len(addr1) + len(addr2))
+        if ratio_bound * RATIO_WEIGHT + TOKEN_SORT_WEIGHT + TOKEN_SET_WEIGHT < threshold:
+            return 0.0
 
-    def find_address_matches(self, foia_address: str, candidate_addresses: list[dict]) -> list[dict]:
+        # Cheapest scorer first; each cutoff is the lowest score that can still reach
+        # the threshold if the remaining scorers are perfect (rapidfuzz returns 0
+        # below the cutoff and can stop early)
+        ratio_cutoff = _score_cutoff(threshold - TOKEN_SORT_WEIGHT - TOKEN_SET_WEIGHT, RATIO_WEIGHT)
+        ratio_score = fuzz.ratio(addr1, addr2, score_cutoff=ratio_cutoff) / 100.0
+        if ratio_cutoff and not ratio_score:
+            return 0.0
+
+        # Token scorers clean punctuation/case first, as fuzzywuzzy's full_process did
+        sort_cutoff = _score_cutoff(threshold - ratio_score * RATIO_WEIGHT - TOKEN_SET_WEIGHT, TOKEN_SORT_WEIGHT)
+        token_sort_score = (
+            fuzz.token_sort_ratio(addr1, addr2, processor=default_process, score_cutoff=sort_cutoff) / 100.0
+        )
+        if sort_cutoff and not token_sort_score:
+            return 0.0
+
+        set_cutoff = _score_cutoff(
+            threshold - ratio_score * RATIO_WEIGHT - token_sort_score * TOKEN_SORT_WEIGHT, TOKEN_SET_WEIGHT
+        )
+        token_set_score = fuzz.token_set_ratio(addr1, addr2, processor=default_process, score_cutoff=set_cutoff) / 100.0
+        if set_cutoff and not token_set_score:
+            return 0.0
+
+        # Weight the scores (token_set is most robust for addresses)
+        return ratio_score * RATIO_WEIGHT + token_sort_score * TOKEN_SORT_WEIGHT + token_set_score * TOKEN_SET_WEIGHT
+
+    def find_address_matches(
+        self,
+        foia_address: str,
+        candidate_addresses: list[dict],
+        candidates_normalized: Optional[list[tuple[str, Optional[str]]]] = None,
+        top_k: Optional[int] = None,
+    ) -> list[dict]:
         """
         Find matching addresses from candidate list with confidence scores.
 
         Args:
             foia_address: Address from FOIA data
             candidate_addresses: List of {'id': str, 'address': str} from database
+            candidates_normalized: Optional (normalized address, street number) per
+                candidate from prepare_candidates, to skip re-normalizing a candidate
+                list reused across many FOIA addresses
+            top_k: Optional limit; only the best top_k matches are kept
 
         Returns:
             List of matches with confidence scores, sorted by confidence
@@ -127,15 +234,75 @@ class AddressMatcher:
         if not foia_address or not candidate_addresses:
             return []
 
-        foia_normalized = self.normalize_address(foia_address)
+        if candidates_normalized is None:
+            candidates_normalized = self.prepare_candidates(candidate_addresses)
+
+        entries = [
+            (candidate, candidate_normalized, candidate_street_num)
+            for candidate, (candidate_normalized, candidate_street_num) in zip(
+                candidate_addresses, candidates_normalized, strict=True
+            )
+        ]
+        return self._score_candidates(foia_address, self.extract_street_number(foia_address), entries, top_k)
+
+    def find_matches_indexed(
+        self, foia_address: str, candidate_index: dict[Optional[str], list[tuple]], top_k: Optional[int] = None
+    ) -> list[dict]:
+        """
+        Find matching addresses using a blocking index from build_candidate_index.
+
+        Only candidates sharing the FOIA street number (plus those whose number
+        could not be parsed) are considered, instead of the whole candidate list,
+        and of those only candidates passing the trigram prefilter are scored.
+        """
+        if not foia_address or not candidate_index:
+            return []
+
         foia_street_num = self.extract_street_number(foia_address)
+        if foia_street_num:
+            entries = candidate_index.get(foia_street_num, []) + candidate_index.get(None, [])
+        else:
+            # No number to block on; every candidate is eligible
+            entries = [entry for bucket in candidate_index.values() for entry in bucket]
+
+        # Cheap trigram-overlap blocking: set intersection is far cheaper than the
+        # fuzzy scorers and rejects most unrelated candidates
+        foia_trigrams = _trigrams(self.normalize_address(foia_address))
+        entries = [
+            entry
+            for entry in entries
+            if len(foia_trigrams & entry[3]) >= TRIGRAM_MIN_JACCARD * len(foia_trigrams | entry[3])
+        ]
+
+        return self._score_candidates(foia_address, foia_street_num, entries, top_k)
+
+    def build_candidate_index(self, candidate_addresses: list[dict]) -> dict[Optional[str], list[tuple]]:
+        """
+        Build a street-number blocking index over a candidate list.
+
+        Each candidate is normalized once and stored as (candidate, normalized
+        address, street number, trigrams) under its street number; candidates
+        whose number could not be parsed are kept under None.
+        """
+        index: dict[Optional[str], list[tuple]] = {}
+        for candidate, (candidate_normalized, candidate_street_num) in zip(
+            candidate_addresses, self.prepare_candidates(candidate_addresses), strict=True
+        ):
+            index.setdefault(candidate_street_num or None, []).append(
+                (candidate, candidate_normalized, candidate_street_num, _trigrams(candidate_normalized))
+            )
+        return index
+
+    def _score_candidates(
+        self, foia_address: str, foia_street_num: Optional[str], entries: list[tuple], top_k: Optional[int] = None
+    ) -> list[dict]:
+        """Score prepared (candidate, normalized, street number, ...) entries against one FOIA address."""
+        foia_normalized = self.normalize_address(foia_address)
 
         matches = []
 
-        for candidate in candidate_addresses:
+        for candidate, candidate_normalized, candidate_street_num, *_ in entries:
             candidate_addr = candidate.get("address", "")
-            candidate_normalized = self.normalize_address(candidate_addr)
-            candidate_street_num = self.extract_street_number(candidate_addr)
 
             # Skip if different street numbers (prevents false positives)
             if foia_street_num and candidate_street_num and foia_street_num != candidate_street_num:
@@ -158,10 +325,19 @@ class AddressMatcher:
                     }
                 )
 
-        # Sort by confidence (highest first)
+        # Sort by confidence (highest first); partial selection when only the best few are wanted
+        if top_k is not None:
+            return heapq.nlargest(top_k, matches, key=lambda x: x["confidence"])
         matches.sort(key=lambda x: x["confidence"], reverse=True)
         return matches
 
+    def prepare_candidates(self, candidate_addresses: list[dict]) -> list[tuple[str, Optional[str]]]:
+        """Normalize a candidate list once for reuse across find_address_matches calls."""
+        return [
+            (self.normalize_address(addr), self.extract_street_number(addr))
+            for addr in (candidate.get("address", "") for candidate in candidate_addresses)
+        ]
+
     def _determine_match_type(self, confidence: float) -> str:
         """Determine match type based on confidence score."""
         if confidence >= 0.95:
@@ -172,43 +348,105 @@ class AddressMatcher:
             return "medium_confidence"
         return "low_confidence"
 
-    def batch_match_addresses(self, foia_addresses: list[str], database_query_func) -> dict[str, list[dict]]:
+    def batch_match_addresses(
+        self,
+        foia_addresses: list[str],
+        database_query_func=None,
+        top_k: Optional[int] = 5,
+        candidates: Optional[list[dict]] = None,
+    ) -> dict[str, list[dict]]:
         """
         Batch process multiple FOIA addresses against database.
 
         Args:
             foia_addresses: List of FOIA addresses to match
             database_query_func: Function that takes address and returns candidates
+            top_k: Best matches kept per address (None keeps all)
+            candidates: Shared candidate list matched against every address instead
+                of per-address queries; normalized once and prefiltered for the whole
+                batch with rapidfuzz.process.cdist
 
         Returns:
             Dictionary mapping FOIA address to list of matches
         """
+        if candidates is None and database_query_func is None:
+            raise ValueError("batch_match_addresses needs database_query_func or candidates")
+
+        if candidates is not None:
+            address_matches = self._match_shared_candidates(foia_addresses, candidates, top_k)
+        else:
+            # Get candidates from database
+            address_matches = (
+                (foia_addr, self.find_address_matches(foia_addr, database_query_func(foia_addr), top_k=top_k))
+                for foia_addr in foia_addresses
+            )
+
         results = {}
 
-        for foia_addr in foia_addresses:
+        for foia_addr, matches in address_matches:
             self.stats["total_processed"] += 1
+            self._record_best_match(matches)
+            results[foia_addr] = matches
 
-            # Get candidates from database
-            candidates = database_query_func(foia_addr)
+        return results
 
-            # Find matches
-            matches = self.find_address_matches(foia_addr, candidates)
+    def _match_shared_candidates(
+        self, foia_addresses: list[str], candidates: list[dict], top_k: Optional[int]
+    ) -> Iterator[tuple[str, list[dict]]]:
+        """
+        Match every FOIA address against one candidate list, yielding (address, matches).
 
-            # Update statistics
-            if not matches:
-                self.stats["no_matches"] += 1
-            else:
-                best_match = matches[0]
-                if best_match["match_type"] == "exact_match":
-                    self.stats["exact_matches"] += 1
-                elif best_match["confidence"] >= 0.85:
-                    self.stats["normalized_matches"] += 1
-                else:
-                    self.stats["fuzzy_matches"] += 1
+        token_set_ratio for whole chunks of addresses is computed by process.cdist
+        in native code across all cores; only pairs whose token_set score can still
+        reach the confidence threshold get the full weighted score and street check.
+        """
+        entries = [
+            (candidate, candidate_normalized, candidate_street_num)
+            for candidate, (candidate_normalized, candidate_street_num) in zip(
+                candidates, self.prepare_candidates(candidates), strict=True
+            )
+        ]
+        candidates_normalized = [entry[1] for entry in entries]
+
+        # Lowest token_set score that can reach the threshold with perfect ratio and
+        # token_sort scores; cdist zeroes anything below it. uint8 scores are whole
+        # numbers, so survivors are compared against the floor of the cutoff
+        set_cutoff = _score_cutoff(self.confidence_threshold - RATIO_WEIGHT - TOKEN_SORT_WEIGHT, TOKEN_SET_WEIGHT)
+        survivor_floor = int(set_cutoff)
+
+        for start in range(0, len(foia_addresses), CDIST_CHUNK_ROWS):
+            chunk = foia_addresses[start : start + CDIST_CHUNK_ROWS]
+            scores = process.cdist(
+                [self.normalize_address(foia_addr) for foia_addr in chunk],
+                candidates_normalized,
+                scorer=fuzz.token_set_ratio,
+                processor=default_process,
+                score_cutoff=set_cutoff,
+                dtype=np.uint8,
+                workers=-1,
+            )
 
-            results[foia_addr] = matches
+            for foia_addr, row in zip(chunk, scores, strict=True):
+                if not foia_addr:
+                    yield foia_addr, []
+                    continue
+                survivors = [entries[i] for i in np.flatnonzero(row >= survivor_floor)]
+                yield foia_addr, self._score_candidates(
+                    foia_addr, self.extract_street_number(foia_addr), survivors, top_k
+                )
 
-        return results
+    def _record_best_match(self, matches: list[dict]) -> None:
+        """Update match statistics from one address's ranked matches."""
+        if not matches:
+            self.stats["no_matches"] += 1
+        else:
+            best_match = matches[0]
+            if best_match["match_type"] == "exact_match":
+                self.stats["exact_matches"] += 1
+            elif best_match["confidence"] >= 0.85:
+                self.stats["normalized_matches"] += 1
+            else:
+                self.stats["fuzzy_matches"] += 1
 
     def get_matching_stats(self) -> dict:
         """Get current matching statistics."""
@@ -238,17 +476,20 @@ def match_addresses(foia_addresses: list[str], parcel_data) -> list[dict]:
     """
     matcher = AddressMatcher(confidence_threshold=0.75)
     
-    # Convert parcel data to candidate format
-    candidates = []
-    for _, row in parcel_data.iterrows():
-        candidates.append({
-            'id': row['parcel_number'],
-            'address': row['address']
-        })
+    # Convert parcel data to candidate format (straight from the column arrays, no per-row Series)
+    candidates = [
+        {'id': parcel_number, 'address': address}
+        for parcel_number, address in zip(
+            parcel_data['parcel_number'].to_numpy(), parcel_data['address'].to_numpy(), strict=True
+        )
+    ]
     
+    # The candidate list is the same for every FOIA address, so normalize it once
+    candidates_normalized = matcher.prepare_candidates(candidates)
+
     results = []
     for foia_addr in foia_addresses:
-        matches = matcher.find_address_matches(foia_addr, candidates)
+        matches = matcher.find_address_matches(foia_addr, candidates, candidates_normalized)
         if matches:
             results.extend(matches)
     
@@ -7,15 +7,20 @@ This is the production-ready coordinate import service.
 
 import logging
 import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from typing import Optional
 
 import pandas as pd
 import psycopg2
 from dotenv import load_dotenv
-from psycopg2.extras import execute_values
+
+from src.utils.database import copy_rows
 
 logger = logging.getLogger(__name__)
 
+# Texas bounding box for coordinate validation
+TEXAS_BOUNDS = {"lat_min": 25.837, "lat_max": 36.501, "lng_min": -106.646, "lng_max": -93.508}
+
 
 class CoordinateUpdater:
     """
@@ -51,31 +56,17 @@ class CoordinateUpdater:
 
     def is_valid_texas_coordinate(self, lat: float, lng: float) -> bool:
         """Validate coordinates are within Texas boundaries."""
-        texas_bounds = {"lat_min": 25.837, "lat_max": 36.501, "lng_min": -106.646, "lng_max": -93.508}
         return (
-            texas_bounds["lat_min"] <= lat <= texas_bounds["lat_max"]
-            and texas_bounds["lng_min"] <= lng <= texas_bounds["lng_max"]
+            TEXAS_BOUNDS["lat_min"] <= lat <= TEXAS_BOUNDS["lat_max"]
+            and TEXAS_BOUNDS["lng_min"] <= lng <= TEXAS_BOUNDS["lng_max"]
         )
 
     def process_csv_file(self, csv_path: str, conn) -> int:
         """Process single CSV file with bulk coordinate updates."""
-        logger.info(f"Processing: {os.path.basename(csv_path)}")
-
         try:
-            # Load and validate CSV
-            df = pd.read_csv(csv_path, dtype=str, low_memory=False)
-            self.stats["csv_records_loaded"] += len(df)
-
-            # Find coordinate columns
-            coord_cols = self._find_coordinate_columns(df)
-            if not coord_cols["parcel_num"] or not coord_cols["lat"] or not coord_cols["lng"]:
-                logger.warning(f"Missing required columns in {csv_path}")
-                return 0
-
-            # Prepare valid coordinate data
-            df_valid = self._prepare_coordinate_data(df, coord_cols)
-            if df_valid.empty:
-                logger.warning(f"No valid coordinates in {csv_path}")
+            df_valid, rows_loaded = self.prepare_csv_file(csv_path)
+            self._record_prepared(rows_loaded, df_valid)
+            if df_valid is None:
                 return 0
 
             # Bulk update using temporary tables
@@ -86,6 +77,38 @@ class CoordinateUpdater:
             self.stats["errors"] += 1
             return 0
 
+    def prepare_csv_file(self, csv_path: str) -> tuple[Optional[pd.DataFrame], int]:
+        """
+        Load and validate one CSV file (the CPU-bound stage, safe to run in a worker process).
+
+        Returns the valid coordinate rows (None if there are none) and the number of
+        rows read. Does not touch the database or self.stats.
+        """
+        logger.info(f"Processing: {os.path.basename(csv_path)}")
+
+        # Load and validate CSV
+        df = pd.read_csv(csv_path, dtype=str, low_memory=False)
+
+        # Find coordinate columns
+        coord_cols = self._find_coordinate_columns(df)
+        if not coord_cols["parcel_num"] or not coord_cols["lat"] or not coord_cols["lng"]:
+            logger.warning(f"Missing required columns in {csv_path}")
+            return None, len(df)
+
+        # Prepare valid coordinate data
+        df_valid = self._prepare_coordinate_data(df, coord_cols)
+        if df_valid.empty:
+            logger.warning(f"No valid coordinates in {csv_path}")
+            return None, len(df)
+
+        return df_valid, len(df)
+
+    def _record_prepared(self, rows_loaded: int, df_valid: Optional[pd.DataFrame]) -> None:
+        """Add one prepared file's row counts to the import statistics."""
+        self.stats["csv_records_loaded"] += rows_loaded
+        if df_valid is not None:
+            self.stats["valid_coordinates"] += len(df_valid)
+
     def _find_coordinate_columns(self, df: pd.DataFrame) -> dict[str, Optional[str]]:
         """Identify parcel number and coordinate columns."""
         cols = df.columns.str.lower()
@@ -119,10 +142,14 @@ class CoordinateUpdater:
         # Remove invalid coordinates
         df_clean = df_clean.dropna(subset=[coord_cols["lat"], coord_cols["lng"]])
 
-        # Validate Texas boundaries
-        mask = df_clean.apply(
-            lambda row: self.is_valid_texas_coordinate(float(row[coord_cols["lat"]]), float(row[coord_cols["lng"]])),
-            axis=1,
+        # Validate Texas boundaries (vectorized over the whole column)
+        lat = df_clean[coord_cols["lat"]].to_numpy()
+        lng = df_clean[coord_cols["lng"]].to_numpy()
+        mask = (
+            (lat >= TEXAS_BOUNDS["lat_min"])
+            & (lat <= TEXAS_BOUNDS["lat_max"])
+            & (lng >= TEXAS_BOUNDS["lng_min"])
+            & (lng <= TEXAS_BOUNDS["lng_max"])
         )
         df_valid = df_clean[mask].copy()
 
@@ -135,7 +162,6 @@ class CoordinateUpdater:
             }
         )
 
-        self.stats["valid_coordinates"] += len(df_valid)
         return df_valid[["parcel_number", "latitude", "longitude"]]
 
     def _bulk_update_coordinates(self, df_valid: pd.DataFrame, conn) -> int:
@@ -157,17 +183,11 @@ class CoordinateUpdater:
                 """
                 )
 
-                # Bulk insert coordinate data
-                coordinate_data = [
-                    (row["parcel_number"], row["latitude"], row["longitude"]) for _, row in df_valid.iterrows()
-                ]
-
-                execute_values(
-                    cur,
-                    "INSERT INTO coord_updates (parcel_number, latitude, longitude) VALUES %s",
-                    coordinate_data,
-                    page_size=10000,
+                # Bulk load coordinate data with COPY, streaming rows straight from the columns
+                coordinate_data = zip(
+                    df_valid["parcel_number"], df_valid["latitude"], df_valid["longitude"], strict=True
                 )
+                copy_rows(cur, "coord_updates", ("parcel_number", "latitude", "longitude"), coordinate_data)
 
                 # Bulk update parcels table
                 cur.execute(
@@ -195,8 +215,14 @@ class CoordinateUpdater:
             self.stats["errors"] += 1
             return 0
 
-    def run_coordinate_import(self, csv_dir: str = "data/CleanedCsv") -> dict:
-        """Run complete coordinate import process."""
+    def run_coordinate_import(self, csv_dir: str = "data/CleanedCsv", max_workers: Optional[int] = None) -> dict:
+        """
+        Run complete coordinate import process.
+
+        CSV parsing and validation run in parallel worker processes (max_workers,
+        default one per CPU); the main process holds the single database connection
+        and applies each file's updates as its worker finishes.
+        """
         logger.info("Starting coordinate import process")
 
         csv_files = []
@@ -207,10 +233,22 @@ class CoordinateUpdater:
             logger.error(f"No CSV files found in {csv_dir}")
             return self.stats
 
-        with self.get_database_connection() as conn:
-            for csv_file in csv_files:
-                csv_path = os.path.join(csv_dir, csv_file)
-                self.process_csv_file(csv_path, conn)
+        csv_paths = [os.path.join(csv_dir, csv_file) for csv_file in csv_files]
+
+        with self.get_database_connection() as conn, ProcessPoolExecutor(max_workers=max_workers) as pool:
+            futures = {pool.submit(_prepare_csv_in_worker, csv_path): csv_path for csv_path in csv_paths}
+
+            for future in as_completed(futures):
+                try:
+                    df_valid, rows_loaded = future.result()
+                except Exception as e:
+                    logger.error(f"Error processing {futures[future]}: {e}")
+                    self.stats["errors"] += 1
+                else:
+                    self._record_prepared(rows_loaded, df_valid)
+                    if df_valid is not None:
+                        self._bulk_update_coordinates(df_valid, conn)
+
                 self.stats["files_processed"] += 1
 
                 if self.stats["files_processed"] % 10 == 0:
@@ -218,3 +256,8 @@ class CoordinateUpdater:
 
         logger.info("Coordinate import completed")
         return self.stats
+
+
+def _prepare_csv_in_worker(csv_path: str) -> tuple[Optional[pd.DataFrame], int]:
+    """Process-pool entry point; only the path is pickled, not the updater and its state."""
+    return CoordinateUpdater().prepare_csv_file(csv_path)
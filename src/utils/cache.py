@@ -0,0 +1,117 @@
+"""
+Cache Utilities
+
+Optional Redis-backed caching for slow-changing aggregates such as FOIA coverage
+statistics. Caching is skipped (every call recomputes) when REDIS_URL is unset,
+the redis package is not installed, or Redis is unreachable.
+"""
+
+import json
+import logging
+import os
+import secrets
+import time
+from typing import Any, Callable, Optional
+
+try:
+    import redis
+except ImportError:  # pragma: no cover - optional dependency
+    redis = None
+
+logger = logging.getLogger(__name__)
+
+# How long a recompute may hold the stampede lock before it expires on its own
+LOCK_TIMEOUT_MS = 5000
+
+# How long other callers wait for the lock holder's result before computing themselves
+LOCK_WAIT_SECONDS = 2.0
+LOCK_POLL_SECONDS = 0.05
+
+# Delete the lock only if it still holds our token, so a holder whose lock expired
+# mid-compute cannot release a lock another caller has since acquired
+_RELEASE_LOCK_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+_redis_client = None
+
+
+def get_redis():
+    """Get the shared Redis client, or None when caching is unavailable."""
+    global _redis_client
+    if _redis_client is None and redis is not None:
+        redis_url = os.getenv("REDIS_URL")
+        if redis_url:
+            _redis_client = redis.Redis.from_url(redis_url)
+            logger.info("Redis cache client initialized")
+    return _redis_client
+
+
+def cached_json(key: str, ttl_seconds: int, compute: Callable[[], Any]) -> Any:
+    """
+    Return the JSON value cached under key, computing and storing it on a miss.
+
+    A short SET NX lock ensures only one caller recomputes an expired entry; the
+    others poll briefly for its result instead of stampeding the database.
+    """
+    client = get_redis()
+    if client is None:
+        return compute()
+
+    try:
+        cached = client.get(key)
+        if cached is not None:
+            return json.loads(cached)
+
+        lock_key = f"{key}:lock"
+        token = secrets.token_hex(16)
+        if client.set(lock_key, token, nx=True, px=LOCK_TIMEOUT_MS):
+            try:
+                value = compute()
+                _store(client, key, ttl_seconds, value)
+                return value
+            finally:
+                _release_lock(client, lock_key, token)
+
+        deadline = time.monotonic() + LOCK_WAIT_SECONDS
+        while time.monotonic() < deadline:
+            time.sleep(LOCK_POLL_SECONDS)
+            cached = client.get(key)
+            if cached is not None:
+                return json.loads(cached)
+
+    except redis.RedisError as e:
+        logger.warning(f"Cache unavailable for {key}: {e}")
+
+    return compute()
+
+
+def _store(client, key: str, ttl_seconds: int, value: Any) -> None:
+    """Cache a computed value; a failed write only costs the next caller a recompute."""
+    try:
+        client.setex(key, ttl_seconds, json.dumps(value))
+    except redis.RedisError as e:
+        logger.warning(f"Failed to cache {key}: {e}")
+
+
+def _release_lock(client, lock_key: str, token: str) -> None:
+    """Release the stampede lock if this caller still owns it."""
+    try:
+        client.eval(_RELEASE_LOCK_SCRIPT, 1, lock_key, token)
+    except redis.RedisError as e:
+        logger.warning(f"Failed to release cache lock {lock_key}: {e}")
+
+
+def invalidate(key: str) -> None:
+    """Drop a cached value so the next read recomputes it."""
+    client: Optional[Any] = get_redis()
+    if client is None:
+        return
+
+    try:
+        client.delete(key)
+    except redis.RedisError as e:
+        logger.warning(f"Failed to invalidate cache key {key}: {e}")
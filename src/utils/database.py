@@ -4,18 +4,47 @@ Database Utilities
 Common database operations and connection management for the SEEK platform.
 """
 
+import hashlib
+import io
 import logging
 import os
-import time
+import threading
+from collections.abc import Iterable, Iterator, Sequence
+from contextlib import contextmanager
 from typing import Any, Optional
 
+import httpx
 import yaml
 from dotenv import load_dotenv
+from psycopg2 import sql
+from psycopg2.extras import RealDictCursor
 from psycopg2.pool import ThreadedConnectionPool
-from supabase import Client, create_client
+from supabase import Client, ClientOptions, create_client
 
 logger = logging.getLogger(__name__)
 
+# One keep-alive HTTP/2 pool for all Supabase requests made through db_manager, so
+# consecutive queries reuse an open TLS connection instead of handshaking again
+SUPABASE_HTTP_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=20, keepalive_expiry=60)
+SUPABASE_HTTP_TIMEOUT_SECONDS = 30
+
+
+def _copy_text_value(value: Any) -> str:
+    """Render one value for COPY ... FROM STDIN in text format."""
+    if value is None:
+        return "\\N"
+    return str(value).replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n").replace("\r", "\\r")
+
+
+def copy_rows(cur, table: str, columns: Sequence[str], rows: Iterable[Sequence[Any]]) -> None:
+    """Stream rows into table with COPY FROM STDIN, the fastest Postgres load path."""
+    buf = io.StringIO()
+    for row in rows:
+        buf.write("\t".join(_copy_text_value(value) for value in row))
+        buf.write("\n")
+    buf.seek(0)
+    cur.copy_expert(f"COPY {table} ({', '.join(columns)}) FROM STDIN", buf)
+
 
 class DatabaseManager:
     """
@@ -29,6 +58,7 @@ class DatabaseManager:
         self.config = self._load_config(config_path)
         self._supabase_client: Optional[Client] = None
         self._pg_pool: Optional[ThreadedConnectionPool] = None
+        self._tls = threading.local()
 
     def _load_config(self, config_path: Optional[str]) -> dict[str, Any]:
         """Load database configuration from YAML file or environment."""
@@ -53,23 +83,63 @@ class DatabaseManager:
             if not supabase_url or not supabase_key:
                 raise ValueError("SUPABASE_URL and SUPABASE_SERVICE_KEY must be set")
 
-            self._supabase_client = create_client(supabase_url, supabase_key)
+            http_client = httpx.Client(
+                timeout=SUPABASE_HTTP_TIMEOUT_SECONDS, limits=SUPABASE_HTTP_LIMITS, follow_redirects=True, http2=True
+            )
+            self._supabase_client = create_client(
+                supabase_url,
+                supabase_key,
+                options=ClientOptions(postgrest_client_timeout=SUPABASE_HTTP_TIMEOUT_SECONDS, httpx_client=http_client),
+            )
             logger.info("Supabase client initialized")
 
         return self._supabase_client
 
     def get_postgres_connection(self):
-        """Get direct PostgreSQL connection from pool."""
+        """Get direct PostgreSQL connection from pool (or this thread's pinned session connection)."""
+        pinned = getattr(self._tls, "conn", None)
+        if pinned is not None:
+            return pinned
+
         if self._pg_pool is None:
             self._initialize_pg_pool()
 
         return self._pg_pool.getconn()
 
     def return_postgres_connection(self, conn):
-        """Return PostgreSQL connection to pool."""
+        """Return PostgreSQL connection to pool; a pinned session connection stays checked out."""
+        if conn is getattr(self._tls, "conn", None):
+            return
         if self._pg_pool:
             self._pg_pool.putconn(conn)
 
+    @contextmanager
+    def session(self) -> Iterator[Any]:
+        """
+        Pin one pooled connection to the current thread for the duration of the block.
+
+        Every execute_query/bulk_* call inside reuses it instead of taking the pool
+        lock for a getconn/putconn pair per statement. Nested sessions share the
+        outer connection.
+
+        A session is not a transaction: calls stay autocommit-per-call, exactly as
+        outside a session. execute_query(fetch=False) and bulk_* commit their own
+        work, and a failing call rolls back the connection, discarding anything
+        still uncommitted (e.g. an INSERT ... RETURNING run with fetch=True).
+        Commit such work yourself, via the yielded connection, before the next call.
+        """
+        if getattr(self._tls, "conn", None) is not None:
+            yield self._tls.conn
+            return
+
+        conn = self.get_postgres_connection()
+        self._tls.conn = conn
+        try:
+            yield conn
+        finally:
+            self._tls.conn = None
+            self.return_postgres_connection(conn)
+
     def _initialize_pg_pool(self):
         """Initialize PostgreSQL connection pool."""
         try:
@@ -92,13 +162,12 @@ class DatabaseManager:
         conn = None
         try:
             conn = self.get_postgres_connection()
-            with conn.cursor() as cur:
+            # RealDictCursor builds each row's dict as it reads, no Python-side zip
+            with conn.cursor(cursor_factory=RealDictCursor) as cur:
                 cur.execute(query, params)
 
                 if fetch and cur.description:
-                    columns = [desc[0] for desc in cur.description]
-                    rows = cur.fetchall()
-                    return [dict(zip(columns, row)) for row in rows]
+                    return cur.fetchall()
                 if not fetch:
                     conn.commit()
                     return [{"rowcount": cur.rowcount}]
@@ -121,24 +190,18 @@ class DatabaseManager:
         try:
             conn = self.get_postgres_connection()
 
-            # Create temp table
-            temp_table = f"temp_{table}_{int(time.time())}"
-            columns_def = ", ".join([f"{col} TEXT" for col in columns])
-
             with conn.cursor() as cur:
-                cur.execute(f"CREATE TEMP TABLE {temp_table} ({columns_def})")
+                stage_table = self._bulk_stage_table(cur, table, columns)
 
-                # Bulk insert to temp table
-                from psycopg2.extras import execute_values
+                # Bulk load the staging table with COPY
+                copy_rows(cur, stage_table, columns, data)
 
-                execute_values(cur, f"INSERT INTO {temp_table} ({', '.join(columns)}) VALUES %s", data, page_size=10000)
-
-                # Insert from temp table to main table
+                # Insert from staging table to main table
                 columns_str = ", ".join(columns)
                 cur.execute(
                     f"""
                     INSERT INTO {table} ({columns_str})
-                    SELECT {columns_str} FROM {temp_table}
+                    SELECT {columns_str} FROM {stage_table}
                     ON CONFLICT DO {on_conflict}
                 """
                 )
@@ -158,6 +221,69 @@ class DatabaseManager:
             if conn:
                 self.return_postgres_connection(conn)
 
+    @staticmethod
+    def _bulk_stage_table(cur, table: str, columns: list) -> str:
+        """
+        Create the temp staging table for one bulk insert of these columns into table.
+
+        Created inside the load's own transaction and dropped at its commit, so it
+        works through Supabase's transaction-mode pooler (port 6543), where a
+        session temp table would not outlive the transaction. It lives in the
+        temp schema, out of PostgREST's reach, and leaves no parcel data behind.
+        """
+        column_key = hashlib.md5(",".join(columns).encode(), usedforsecurity=False).hexdigest()[:8]
+        stage_table = f"_bulk_stage_{table}_{column_key}"
+        columns_def = ", ".join([f"{col} TEXT" for col in columns])
+        cur.execute(f"CREATE TEMP TABLE IF NOT EXISTS {stage_table} ({columns_def}) ON COMMIT DROP")
+        return stage_table
+
+    def bulk_delete(self, table: str, column: str, values: list, batch_size: int = 10000) -> int:
+        """Delete every row whose column matches one of values, one statement per batch."""
+        if not values:
+            return 0
+
+        conn = None
+        try:
+            conn = self.get_postgres_connection()
+            query = sql.SQL("DELETE FROM {} WHERE {} = ANY(%s)").format(sql.Identifier(table), sql.Identifier(column))
+
+            rows_deleted = 0
+            with conn.cursor() as cur:
+                for start in range(0, len(values), batch_size):
+                    cur.execute(query, (list(values[start : start + batch_size]),))
+                    rows_deleted += cur.rowcount
+                conn.commit()
+
+            logger.info(f"Bulk deleted {rows_deleted} rows from {table}")
+            return rows_deleted
+
+        except Exception as e:
+            if conn:
+                conn.rollback()
+            logger.error(f"Bulk delete failed: {e}")
+            raise
+        finally:
+            if conn:
+                self.return_postgres_connection(conn)
+
+    def find_similar_addresses(self, address: str, limit: int = 20) -> list[dict[str, Any]]:
+        """
+        Shortlist parcels whose address is trigram-similar to address, best first.
+
+        Ranking runs in the database on the pg_trgm % operator (idx_parcels_address_trgm),
+        so only the top candidates come back for fine-grained scoring. Usable directly
+        as AddressMatcher.batch_match_addresses' database_query_func.
+        """
+        query = """
+            SELECT id, parcel_number, address, similarity(upper(address), %s) AS similarity
+            FROM parcels
+            WHERE upper(address) %% %s
+            ORDER BY similarity DESC
+            LIMIT %s
+        """
+        term = address.upper()
+        return self.execute_query(query, (term, term, limit)) or []
+
     def get_table_stats(self, table_name: str) -> dict[str, Any]:
         """Get table statistics."""
         query = """
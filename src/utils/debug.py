@@ -1,40 +1,53 @@
 # src/utils/debug.py
 import functools
+import os
 import time
 from typing import Any, Callable
 import traceback
-import json
 from pathlib import Path
 import logging
 
+import orjson
+
 # Set up logger for this module
 logger = logging.getLogger(__name__)
 
+# @timer only wraps functions when SEEK_TIMING=1; otherwise it returns them
+# untouched so decorated hot paths pay nothing in production
+_DEBUG_TIMING = os.getenv("SEEK_TIMING") == "1"
+
 def timer(func: Callable) -> Callable:
-    """Decorator to time function execution"""
+    """Decorator to time function execution (enabled with SEEK_TIMING=1)"""
+    if not _DEBUG_TIMING:
+        return func
+
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        start = time.perf_counter()
+        start = time.perf_counter_ns()
         try:
             result = func(*args, **kwargs)
-            elapsed = time.perf_counter() - start
-            logger.info(f"{func.__name__} took {elapsed:.3f}s")
-            return result
         except Exception as e:
-            elapsed = time.perf_counter() - start
+            elapsed = (time.perf_counter_ns() - start) / 1e9
             logger.error(f"{func.__name__} failed after {elapsed:.3f}s: {e}")
             raise
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"{func.__name__} took {(time.perf_counter_ns() - start) / 1e9:.3f}s")
+        return result
     return wrapper
 
-def debug_dump(data: Any, filename: str):
-    """Dump data to JSON for debugging"""
+def debug_dump(data: Any, filename: str, pretty: bool = False):
+    """Dump data to JSON for debugging (compact unless pretty=True)"""
     debug_dir = Path("debug_output")
     debug_dir.mkdir(exist_ok=True)
     
     filepath = debug_dir / f"{filename}_{time.strftime('%Y%m%d_%H%M%S')}.json"
     
-    with open(filepath, 'w') as f:
-        json.dump(data, f, indent=2, default=str)
+    # orjson serializes numpy arrays, datetimes and non-str dict keys natively;
+    # anything else falls back to str()
+    options = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    if pretty:
+        options |= orjson.OPT_INDENT_2
+    filepath.write_bytes(orjson.dumps(data, option=options, default=str))
     
     logger.debug(f"Debug data saved to {filepath}")
 
@@ -66,7 +79,7 @@ class DebugContext:
                 'error': str(exc_val),
                 'traceback': traceback.format_exc()
             }, f"error_{self.operation}")
-        else:
+        elif logger.isEnabledFor(logging.INFO):
             logger.info(f"{self.operation} completed in {elapsed:.3f}s")
 
 # Usage example
@@ -4,74 +4,399 @@ Logging Utilities
 Centralized structured logging configuration for the SEEK platform using structlog.
 """
 
+import atexit
+import io
 import logging
+import os
+import queue
+import socket
 import sys
+import threading
+import time
+from collections import ChainMap
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
+from time import perf_counter_ns, time_ns
 from typing import Optional
+
+import orjson
 import structlog
 
+# Log file writes are coalesced in a user-space buffer and flushed at most this often
+# (or when the buffer fills, or the writer thread goes idle)
+LOG_BUFFER_SIZE = 65536
+LOG_FLUSH_SECONDS = 0.1
+
+
+class BytesRotatingFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler over a buffered binary stream.
+
+    Accepts pre-rendered structlog lines as bytes via write_line (no LogRecord),
+    while stdlib records are formatted and encoded as usual. Lines are buffered
+    and flushed every LOG_FLUSH_SECONDS rather than once per record.
+    """
+
+    def __init__(self, filename: str, max_bytes: int = 0, backup_count: int = 0):
+        # RotatingFileHandler forces text mode 'a' when rotating, so open lazily
+        # and switch to binary append before the first write
+        super().__init__(filename, maxBytes=max_bytes, backupCount=backup_count, delay=True)
+        self.mode = "ab"
+        self.encoding = None
+        self.flush_seconds = LOG_FLUSH_SECONDS
+        self._last_flush = time.monotonic()
+
+    def _open(self):
+        return io.BufferedWriter(open(self.baseFilename, "ab", buffering=0), buffer_size=LOG_BUFFER_SIZE)
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            self.write_line(self.format(record).encode("utf-8"))
+        except Exception:
+            self.handleError(record)
+
+    def write_line(self, line: bytes):
+        """Append one line, rotating first if it would overflow maxBytes."""
+        self.acquire()
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            if self.maxBytes > 0 and self.stream.tell() + len(line) + 1 >= self.maxBytes:
+                self.doRollover()
+                if self.stream is None:  # delay=True makes doRollover leave it closed
+                    self.stream = self._open()
+            self.stream.write(line)
+            self.stream.write(b"\n")
+
+            now = time.monotonic()
+            if now - self._last_flush >= self.flush_seconds:
+                self.stream.flush()
+                self._last_flush = now
+        finally:
+            self.release()
+
+
+class _LogFileListener(QueueListener):
+    """
+    QueueListener owning the log file handler.
 
-def setup_logging(name: str = "seek", level: str = "INFO"):
+    Besides stdlib records it accepts pre-rendered structlog lines (bytes), which
+    are appended to the file as-is.
+    """
+
+    def __init__(self, log_queue: queue.Queue, file_handler: BytesRotatingFileHandler):
+        super().__init__(log_queue, file_handler, respect_handler_level=True)
+        self.file_handler = file_handler
+
+    def dequeue(self, block):
+        # Flush buffered lines whenever the queue has been idle for a flush interval
+        while True:
+            try:
+                return self.queue.get(block, timeout=LOG_FLUSH_SECONDS)
+            except queue.Empty:
+                if not block:
+                    raise
+                self.file_handler.flush()
+
+    def handle(self, record):
+        if isinstance(record, bytes):
+            self.file_handler.write_line(record)
+        else:
+            super().handle(record)
+
+
+class _StructlogSink:
+    """
+    Binary file target for structlog's BytesLogger.
+
+    Rendered JSON lines go to stdout and onto the log file queue (or, in a
+    forked child, straight to file_handler). One sink lives for the process, so
+    loggers cached before a later setup_logging call follow the new queue.
+    """
+
+    def __init__(self):
+        self.file_queue: Optional[queue.Queue] = None
+        self.file_handler: Optional[BytesRotatingFileHandler] = None
+
+    def write(self, data: bytes):
+        console = getattr(sys.stdout, "buffer", None)
+        if console is not None:
+            console.write(data)
+        else:
+            sys.stdout.write(data.decode("utf-8"))
+        if self.file_queue is not None:
+            self.file_queue.put_nowait(data.rstrip(b"\n"))
+        elif self.file_handler is not None:
+            self.file_handler.write_line(data.rstrip(b"\n"))
+
+    def flush(self):
+        sys.stdout.flush()
+
+
+_sink = _StructlogSink()
+
+# Background thread writing the log file (see setup_logging)
+_file_listener: Optional[_LogFileListener] = None
+
+
+def shutdown_logging():
+    """Drain queued log lines to the file and stop the writer thread."""
+    global _file_listener
+    if _file_listener is not None:
+        _file_listener.stop()
+        _file_listener.file_handler.close()
+        _file_listener = None
+    _sink.file_queue = None
+    if _sink.file_handler is not None:
+        _sink.file_handler.close()
+        _sink.file_handler = None
+
+
+atexit.register(shutdown_logging)
+
+# Process context added to every event, looked up once instead of per log call
+_PID = os.getpid()
+_HOSTNAME = socket.gethostname()
+
+
+def _refresh_pid():
+    global _PID
+    _PID = os.getpid()
+
+
+def _flush_before_fork():
+    """Empty the file buffer so a forked child does not inherit (and rewrite) pending lines."""
+    if _file_listener is not None:
+        _file_listener.file_handler.acquire()
+        _file_listener.file_handler.flush()
+
+
+def _release_after_fork():
+    if _file_listener is not None:
+        _file_listener.file_handler.release()
+
+
+def _log_directly_in_child():
+    """
+    Write the child's log lines straight to the file.
+
+    The writer thread does not survive fork, so anything put on the inherited
+    queue would never be written. The child drops the queue, points the root
+    logger and the structlog sink at the (already flushed) file handler, and
+    flushes every line since workers may exit without running atexit.
+    """
+    global _file_listener
+    _refresh_pid()
+    if _file_listener is None:
+        return
+    file_handler = _file_listener.file_handler
+    _file_listener = None
+    file_handler.flush_seconds = 0
+
+    root_logger = logging.getLogger()
+    root_logger.handlers[:] = [
+        file_handler if isinstance(handler, QueueHandler) else handler for handler in root_logger.handlers
+    ]
+    _sink.file_queue = None
+    _sink.file_handler = file_handler
+
+
+# Worker processes (e.g. the coordinate import pool) must not report the parent's
+# pid or log into the parent's writer queue
+os.register_at_fork(
+    before=_flush_before_fork, after_in_parent=_release_after_fork, after_in_child=_log_directly_in_child
+)
+
+
+def add_process_info(logger, method_name: str, event_dict: dict) -> dict:
+    """structlog processor adding the cached pid and hostname."""
+    event_dict["pid"] = _PID
+    event_dict["hostname"] = _HOSTNAME
+    return event_dict
+
+
+# Last rendered timestamp; records logged within the same millisecond reuse it
+_LAST_MS = -1
+_LAST_STR = ""
+
+
+def cached_timestamper(logger, method_name: str, event_dict: dict) -> dict:
+    """structlog processor adding a UTC ISO-8601 timestamp with millisecond precision."""
+    global _LAST_MS, _LAST_STR
+    now_ms = time_ns() // 1_000_000
+    if now_ms != _LAST_MS:
+        seconds, millis = divmod(now_ms, 1000)
+        _LAST_STR = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds)) + f".{millis:03d}Z"
+        _LAST_MS = now_ms
+    event_dict["timestamp"] = _LAST_STR
+    return event_dict
+
+
+# Level set by setup_logging/set_level; every logger compares against it at call
+# time before building any event, so filtered calls cost one integer comparison
+# and loggers created before a later setup_logging follow the new level
+_CURRENT_LEVEL = logging.INFO
+
+
+def _gated_method(method_name: str, level: int):
+    def log_method(self, event: str, *args, **kw):
+        if _CURRENT_LEVEL > level:
+            return None
+        return self._proxy_to_logger(method_name, event % args if args else event, **kw)
+
+    log_method.__name__ = method_name
+    return log_method
+
+
+class LevelGatedBoundLogger(structlog.BoundLoggerBase):
+    """
+    structlog wrapper class filtering against the module-level _CURRENT_LEVEL.
+
+    Unlike make_filtering_bound_logger, the level is not baked into the class, so
+    loggers cached on first use keep honouring later setup_logging/set_level calls.
+    """
+
+    debug = _gated_method("debug", logging.DEBUG)
+    info = _gated_method("info", logging.INFO)
+    warning = _gated_method("warning", logging.WARNING)
+    warn = warning
+    error = _gated_method("error", logging.ERROR)
+    critical = _gated_method("critical", logging.CRITICAL)
+    fatal = critical
+
+    def exception(self, event: str, *args, **kw):
+        kw.setdefault("exc_info", True)
+        return self.error(event, *args, **kw)
+
+    def is_enabled_for(self, level: int) -> bool:
+        return level >= _CURRENT_LEVEL
+
+    def get_effective_level(self) -> int:
+        return _CURRENT_LEVEL
+
+
+# Whether setup_logging installed the root logger's handlers (and so manages its level)
+_owns_root = False
+
+
+def set_level(level: str):
+    """
+    Change the logging level (e.g. "DEBUG"), up or down.
+
+    Applies to every structlog logger, including ones obtained earlier, and to
+    stdlib loggers through the root logger when setup_logging configured it
+    (its handlers do not filter by level).
+    """
+    global _CURRENT_LEVEL
+    _CURRENT_LEVEL = getattr(logging, level.upper())
+    if _owns_root:
+        logging.getLogger().setLevel(_CURRENT_LEVEL)
+
+
+def setup_logging(name: str = "seek", level: str = "INFO", configure_root: bool = True):
     """
     Set up structured logging with console and file output.
     
+    structlog events skip the stdlib logging machinery entirely: the level is
+    filtered by LevelGatedBoundLogger itself and events are rendered to JSON
+    bytes with orjson. Plain stdlib loggers keep using the root handlers.
+    Calling this again (e.g. with a new level) also applies to loggers obtained
+    before the call.
+    
+    File writes (and rotation) happen on a QueueListener thread, so logging
+    callers only enqueue; shutdown_logging (run at exit) drains the queue.
+    
     Args:
         name: Logger name (used for log file naming)
         level: Logging level (DEBUG, INFO, WARNING, ERROR)
+        configure_root: Replace the root logger's handlers and level; when False
+            stdlib logging is left as the host application configured it
     """
+    global _file_listener, _configured, _owns_root
+    
     # Create logs directory
     Path("logs").mkdir(exist_ok=True)
+    _owns_root = configure_root
+    set_level(level)
     
     # Configure structlog
     structlog.configure(
         processors=[
-            structlog.stdlib.filter_by_level,
-            structlog.stdlib.add_logger_name,
-            structlog.stdlib.add_log_level,
-            structlog.stdlib.PositionalArgumentsFormatter(),
-            structlog.processors.TimeStamper(fmt="iso"),
+            structlog.processors.add_log_level,
+            add_process_info,
+            cached_timestamper,
             structlog.processors.StackInfoRenderer(),
             structlog.processors.format_exc_info,
-            structlog.processors.UnicodeDecoder(),
-            structlog.dev.ConsoleRenderer()
+            structlog.processors.JSONRenderer(serializer=orjson.dumps),
         ],
+        wrapper_class=LevelGatedBoundLogger,
         context_class=dict,
-        logger_factory=structlog.stdlib.LoggerFactory(),
+        logger_factory=structlog.BytesLoggerFactory(file=_sink),
         cache_logger_on_first_use=True,
     )
     
-    # Set up standard logging for file output
+    # Set up standard logging for file output (set_level above set the root level)
     root_logger = logging.getLogger()
-    root_logger.setLevel(getattr(logging, level.upper()))
-    
-    # Remove any existing handlers
-    root_logger.handlers.clear()
     
-    # Console handler (handled by structlog)
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(getattr(logging, level.upper()))
-    root_logger.addHandler(console_handler)
+    if configure_root:
+        # Remove any existing handlers
+        root_logger.handlers.clear()
+        
+        # Console handler for stdlib loggers
+        console_handler = logging.StreamHandler(sys.stdout)
+        root_logger.addHandler(console_handler)
     
-    # File handler with rotation
-    file_handler = RotatingFileHandler(
+    # File handler with rotation, shared by stdlib records and structlog lines;
+    # owned by a background listener so callers never block on write() or rollover
+    shutdown_logging()
+    file_handler = BytesRotatingFileHandler(
         f"logs/{name}.log",
-        maxBytes=10_000_000,  # 10MB
-        backupCount=5
+        max_bytes=10_000_000,  # 10MB
+        backup_count=5
     )
     file_handler.setFormatter(logging.Formatter(
         '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     ))
-    file_handler.setLevel(getattr(logging, level.upper()))
-    root_logger.addHandler(file_handler)
+    
+    log_queue = queue.Queue(-1)
+    if configure_root:
+        root_logger.addHandler(QueueHandler(log_queue))
+    _sink.file_queue = log_queue
+    
+    _file_listener = _LogFileListener(log_queue, file_handler)
+    _file_listener.start()
+    _configured = True
     
     # Return structured logger
-    return structlog.get_logger(name)
+    return structlog.get_logger().bind(logger=name)
+
 
+# Default logging is configured on first use rather than at import, so importing
+# this module creates no logs/ directory, file or handlers
+_default_logger = None
+_configured = False
+_configure_lock = threading.Lock()
+
+
+def _lazy_default():
+    """
+    Run the default setup_logging() once, unless logging is already configured.
 
-def get_logger(name: str) -> structlog.stdlib.BoundLogger:
+    Root handlers the host application installed are left in place; the root
+    logger is only set up when it has no handlers yet.
+    """
+    global _default_logger
+    if _configured:
+        return
+    with _configure_lock:
+        if not _configured:
+            _default_logger = setup_logging(configure_root=not logging.getLogger().handlers)
+
+
+def get_logger(name: str) -> LevelGatedBoundLogger:
     """Get structured logger instance with consistent naming."""
-    return structlog.get_logger(f"seek.{name}")
+    _lazy_default()
+    return structlog.get_logger().bind(logger=f"seek.{name}")
 
 
 class OperationLogger:
@@ -85,25 +410,46 @@ class OperationLogger:
     def __init__(self, logger_name: str, **initial_context):
         self.logger_name = logger_name
         self.logger = get_logger(logger_name)
-        self.context = initial_context
-        self.bound_logger = self.logger.bind(**self.context)
+        self.context = ChainMap(initial_context)
+        self._bound_logger = None
+    
+    @classmethod
+    def _with_chain(cls, logger_name: str, logger, context: ChainMap) -> 'OperationLogger':
+        """Build an instance sharing an existing logger and context chain."""
+        instance = cls.__new__(cls)
+        instance.logger_name = logger_name
+        instance.logger = logger
+        instance.context = context
+        instance._bound_logger = None
+        return instance
+    
+    @property
+    def bound_logger(self):
+        """structlog logger bound to the flattened context, built on the first enabled log call."""
+        if self._bound_logger is None:
+            self._bound_logger = self.logger.bind(**self.context)
+        return self._bound_logger
     
     def bind(self, **kwargs) -> 'OperationLogger':
-        """Create new logger instance with additional context."""
-        new_context = {**self.context, **kwargs}
-        new_logger = OperationLogger(self.logger_name, **new_context)
-        return new_logger
+        """Create new logger instance with additional context (O(1): pushes a ChainMap layer)."""
+        return OperationLogger._with_chain(self.logger_name, self.logger, self.context.new_child(kwargs))
     
     def debug(self, event: str, **kwargs):
         """Log debug event with structured data."""
+        if _CURRENT_LEVEL > logging.DEBUG:
+            return
         self.bound_logger.debug(event, **kwargs)
     
     def info(self, event: str, **kwargs):
         """Log info event with structured data."""
+        if _CURRENT_LEVEL > logging.INFO:
+            return
         self.bound_logger.info(event, **kwargs)
     
     def warning(self, event: str, **kwargs):
         """Log warning event with structured data."""
+        if _CURRENT_LEVEL > logging.WARNING:
+            return
         self.bound_logger.warning(event, **kwargs)
     
     def error(self, event: str, **kwargs):
@@ -118,27 +464,26 @@ class OperationLogger:
 def log_performance(logger_name: str):
     """Decorator to log function execution time with structured data."""
     def decorator(func):
+        # Resolved once per decorated function, not on every call
+        logger = get_logger(logger_name)
+        function_name = func.__name__
+        
         def wrapper(*args, **kwargs):
-            import time
-            logger = get_logger(logger_name)
-            
-            start_time = time.time()
+            start_ns = perf_counter_ns()
             try:
                 result = func(*args, **kwargs)
-                execution_time = time.time() - start_time
                 logger.info(
                     "function_completed",
-                    function=func.__name__,
-                    execution_time_seconds=round(execution_time, 3),
+                    function=function_name,
+                    execution_time_ms=(perf_counter_ns() - start_ns) // 1_000_000,
                     success=True
                 )
                 return result
             except Exception as e:
-                execution_time = time.time() - start_time
                 logger.error(
                     "function_failed", 
-                    function=func.__name__,
-                    execution_time_seconds=round(execution_time, 3),
+                    function=function_name,
+                    execution_time_ms=(perf_counter_ns() - start_ns) // 1_000_000,
                     error=str(e),
                     success=False
                 )
@@ -147,12 +492,8 @@ def log_performance(logger_name: str):
     return decorator
 
 
-# Initialize default logging
-_default_logger = setup_logging()
-
-
 # Convenience functions for common logging patterns
-def log_import_start(logger: structlog.stdlib.BoundLogger, file_path: str, total_records: int):
+def log_import_start(logger: structlog.typing.FilteringBoundLogger, file_path: str, total_records: int):
     """Log start of data import operation."""
     logger.info(
         "import_started",
@@ -162,20 +503,34 @@ def log_import_start(logger: structlog.stdlib.BoundLogger, file_path: str, total
     )
 
 
-def log_import_progress(logger: structlog.stdlib.BoundLogger, processed: int, total: int, success: int, errors: int):
-    """Log import progress with statistics."""
+def progress_scale(total: int) -> float:
+    """Factor turning a processed count into a percentage of total (0 when total is 0)."""
+    return 100.0 / total if total > 0 else 0.0
+
+
+def log_import_progress(logger: structlog.typing.FilteringBoundLogger, processed: int, total: int, success: int, errors: int,
+                        inv_total: Optional[float] = None):
+    """
+    Log import progress with statistics.
+    
+    Callers logging many progress records for one import can pass
+    inv_total=progress_scale(total), computed once at import start, so each
+    call multiplies instead of dividing.
+    """
+    if inv_total is None:
+        inv_total = progress_scale(total)
     logger.info(
         "import_progress",
         processed_records=processed,
         total_records=total,
         successful_records=success,
         error_records=errors,
-        progress_percent=round((processed / total) * 100, 1) if total > 0 else 0,
+        progress_percent=round(processed * inv_total, 1),
         operation="data_import"
     )
 
 
-def log_import_complete(logger: structlog.stdlib.BoundLogger, total_processed: int, success_rate: float, duration: float):
+def log_import_complete(logger: structlog.typing.FilteringBoundLogger, total_processed: int, success_rate: float, duration: float):
     """Log completion of import operation."""
     logger.info(
         "import_completed",
@@ -187,7 +542,7 @@ def log_import_complete(logger: structlog.stdlib.BoundLogger, total_processed: i
     )
 
 
-def log_address_match(logger: structlog.stdlib.BoundLogger, foia_address: str, 
+def log_address_match(logger: structlog.typing.FilteringBoundLogger, foia_address: str, 
                      db_address: str, confidence: float, match_type: str):
     """Log address matching result."""
     logger.info(
@@ -200,7 +555,7 @@ def log_address_match(logger: structlog.stdlib.BoundLogger, foia_address: str,
     )
 
 
-def log_database_operation(logger: structlog.stdlib.BoundLogger, operation: str, 
+def log_database_operation(logger: structlog.typing.FilteringBoundLogger, operation: str, 
                           table: str, affected_rows: int, duration: float):
     """Log database operation with performance metrics."""
     logger.info(
@@ -0,0 +1,99 @@
+"""
+Retry Utilities
+
+Exponential-backoff retry helpers for Supabase/PostgREST calls.
+"""
+
+import asyncio
+import functools
+import logging
+import random
+import time
+from typing import Any, Callable, Optional
+
+import httpx
+from postgrest.exceptions import APIError
+
+logger = logging.getLogger(__name__)
+
+# HTTP statuses worth retrying: timeouts, rate limiting and transient gateway errors
+RETRYABLE_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+
+# Postgres SQLSTATEs for transient conditions (serialization failure, deadlock, too many connections)
+RETRYABLE_SQLSTATES = frozenset({"40001", "40P01", "53300"})
+
+
+def is_retryable_error(exc: BaseException) -> bool:
+    """Return True if the exception looks like a transient network/server failure."""
+    if isinstance(exc, httpx.TransportError):
+        return True
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code in RETRYABLE_STATUS_CODES
+    if isinstance(exc, APIError):
+        code = str(exc.code) if exc.code is not None else ""
+        # Non-JSON error bodies carry the HTTP status as the code
+        if code.isdigit():
+            return int(code) in RETRYABLE_STATUS_CODES
+        return code in RETRYABLE_SQLSTATES or code.startswith("08")
+    return False
+
+
+def backoff_delay(attempt: int, base: float = 0.2, cap: float = 5.0) -> float:
+    """Exponential backoff with jitter for the given zero-based retry attempt."""
+    return min(cap, base * 2**attempt) + random.uniform(0, 0.25 * base)  # noqa: S311
+
+
+def retry_db(
+    fn: Optional[Callable] = None, *, max_retries: int = 3, base: float = 0.2, cap: float = 5.0
+) -> Callable:
+    """
+    Decorator that retries transient Supabase/PostgREST failures with exponential backoff.
+
+    Usable bare (``@retry_db``) or with options (``@retry_db(max_retries=5)``).
+    Non-retryable errors are raised immediately.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            attempt = 0
+            while True:
+                try:
+                    return func(*args, **kwargs)
+                except Exception as e:
+                    if attempt >= max_retries or not is_retryable_error(e):
+                        raise
+                    delay = backoff_delay(attempt, base, cap)
+                    logger.warning(
+                        f"{func.__name__} failed ({e}); retry {attempt + 1}/{max_retries} in {delay:.2f}s"
+                    )
+                    time.sleep(delay)
+                    attempt += 1
+
+        return wrapper
+
+    if fn is not None:
+        return decorator(fn)
+    return decorator
+
+
+def exec_with_retry(query_builder: Any, *, max_retries: int = 3, base: float = 0.2, cap: float = 5.0) -> Any:
+    """Execute a PostgREST query/RPC builder, retrying transient failures."""
+    return retry_db(query_builder.execute, max_retries=max_retries, base=base, cap=cap)()
+
+
+async def aexec_with_retry(
+    query_builder: Any, *, max_retries: int = 3, base: float = 0.2, cap: float = 5.0
+) -> Any:
+    """Async variant of exec_with_retry for builders from the async Supabase client."""
+    attempt = 0
+    while True:
+        try:
+            return await query_builder.execute()
+        except Exception as e:
+            if attempt >= max_retries or not is_retryable_error(e):
+                raise
+            delay = backoff_delay(attempt, base, cap)
+            logger.warning(f"async query failed ({e}); retry {attempt + 1}/{max_retries} in {delay:.2f}s")
+            await asyncio.sleep(delay)
+            attempt += 1
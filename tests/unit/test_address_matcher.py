@@ -1,7 +1,127 @@
 # tests/unit/test_address_matcher.py
+import pytest
+
+
 def test_address_matching(sample_parcels, fort_worth_addresses):
     from src.services.address_matcher import match_addresses
     
     results = match_addresses(fort_worth_addresses, sample_parcels)
     assert len(results) > 0
-    assert results[0]['confidence'] > 0.8
\ No newline at end of file
+    assert results[0]['confidence'] > 0.8
+
+def test_prepared_candidates_match_like_raw_candidates():
+    from src.services.address_matcher import AddressMatcher
+
+    matcher = AddressMatcher()
+    candidates = [{'id': 'a', 'address': '3909 Hulen St'}, {'id': 'b', 'address': '6824 Kirk Dr'}]
+    prepared = matcher.prepare_candidates(candidates)
+
+    assert prepared[0] == ('3909 HULEN STREET', '3909')
+    assert matcher.find_address_matches('3909 HULEN ST', candidates, prepared) == \
+        matcher.find_address_matches('3909 HULEN ST', candidates)
+
+
+def test_normalize_expands_standalone_tokens_only():
+    from src.services.address_matcher import AddressMatcher
+
+    normalize = AddressMatcher().normalize_address
+
+    assert normalize('123 n main st') == '123 NORTH MAIN STREET'
+    assert normalize('9 NE Loop 820, Ste 4') == '9 NORTHEAST LOOP 820,'
+    assert normalize('500 Station Way') == '500 STATION WAY'
+    assert normalize('12 Plaza Blvd') == '12 PLAZA BOULEVARD'
+    assert normalize('77 Stream Ct') == '77 STREAM COURT'
+
+
+def test_similarity_early_exit_keeps_passing_scores():
+    from rapidfuzz import fuzz
+    from rapidfuzz.utils import default_process
+
+    from src.services.address_matcher import AddressMatcher
+
+    matcher = AddressMatcher()
+    a, b = '3909 HULEN STREET', '3909 HULEN STREET FORT WORTH TX 76107'
+    full = (
+        fuzz.ratio(a, b) * 0.3
+        + fuzz.token_sort_ratio(a, b, processor=default_process) * 0.3
+        + fuzz.token_set_ratio(a, b, processor=default_process) * 0.4
+    ) / 100.0
+
+    assert full >= matcher.confidence_threshold
+    assert matcher.calculate_similarity(a, b) == pytest.approx(full)
+    assert matcher.calculate_similarity('12 A ST', '4500 SOUTH HULEN STREET FORT WORTH') == 0.0
+
+
+def test_indexed_matches_equal_full_scan():
+    from src.services.address_matcher import AddressMatcher
+
+    matcher = AddressMatcher()
+    candidates = [
+        {'id': 'a', 'address': '3909 Hulen St'},
+        {'id': 'b', 'address': '3909 Hulen Street'},
+        {'id': 'c', 'address': '6824 Kirk Dr'},
+        {'id': 'd', 'address': 'Hulen St'},
+    ]
+    index = matcher.build_candidate_index(candidates)
+
+    assert set(index) == {'3909', '6824', None}
+    for foia_addr in ('3909 HULEN ST', 'HULEN STREET', '6824 KIRK DRIVE'):
+        assert matcher.find_matches_indexed(foia_addr, index) == matcher.find_address_matches(foia_addr, candidates)
+
+
+def test_top_k_keeps_best_matches_in_order():
+    from src.services.address_matcher import AddressMatcher
+
+    matcher = AddressMatcher()
+    candidates = [
+        {'id': 'a', 'address': '3909 Hulen Street Fort Worth'},
+        {'id': 'b', 'address': '3909 Hulen St'},
+        {'id': 'c', 'address': '3909 S Hulen St'},
+    ]
+
+    full = matcher.find_address_matches('3909 HULEN ST', candidates)
+    assert matcher.find_address_matches('3909 HULEN ST', candidates, top_k=2) == full[:2]
+
+
+def test_batch_with_shared_candidates_matches_query_func():
+    from src.services.address_matcher import AddressMatcher
+
+    candidates = [{'id': 'a', 'address': '3909 Hulen St'}, {'id': 'b', 'address': '6824 Kirk Dr'}]
+    foia = ['3909 HULEN STREET', '6824 KIRK DRIVE', '100 NOWHERE LN']
+
+    shared = AddressMatcher()
+    queried = AddressMatcher()
+
+    assert shared.batch_match_addresses(foia, candidates=candidates) == \
+        queried.batch_match_addresses(foia, lambda _: candidates)
+    assert shared.stats == queried.stats
+    assert shared.stats['no_matches'] == 1
+
+
+def test_extract_street_number_fast_path_agrees_with_usaddress():
+    import usaddress
+
+    from src.services.address_matcher import AddressMatcher
+
+    extract = AddressMatcher().extract_street_number
+    for address in ('3909 Hulen St', '12B Oak Ln', '  500 N Main St Fort Worth TX'):
+        expected = next(component for component, label in usaddress.parse(address) if label == 'AddressNumber')
+        assert extract(address) == expected
+
+    assert extract('12-14 Main St') == '12-14'
+
+
+def test_indexed_trigram_prefilter_skips_unrelated_candidates(monkeypatch):
+    from src.services.address_matcher import AddressMatcher
+
+    matcher = AddressMatcher()
+    candidates = [{'id': 'a', 'address': '3909 Hulen St'}, {'id': 'b', 'address': '3909 Camp Bowie Blvd'}]
+    index = matcher.build_candidate_index(candidates)
+
+    scored = []
+    original = matcher.calculate_similarity
+    monkeypatch.setattr(matcher, 'calculate_similarity', lambda a, b: scored.append(b) or original(a, b))
+
+    matches = matcher.find_matches_indexed('3909 HULEN STREET', index)
+    assert [m['parcel_id'] for m in matches] == ['a']
+    assert scored == ['3909 HULEN STREET']
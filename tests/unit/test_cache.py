@@ -0,0 +1,133 @@
+# tests/unit/test_cache.py
+import json
+
+import pytest
+
+
+class FakeRedis:
+    """In-memory stand-in for the redis-py calls the cache uses"""
+
+    def __init__(self):
+        self.store = {}
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def set(self, key, value, nx=False, px=None):
+        if nx and key in self.store:
+            return None
+        self.store[key] = value
+        return True
+
+    def setex(self, key, ttl, value):
+        self.store[key] = value
+
+    def delete(self, key):
+        self.store.pop(key, None)
+
+    def eval(self, script, numkeys, key, token):
+        if self.store.get(key) == token:
+            self.delete(key)
+            return 1
+        return 0
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    redis = FakeRedis()
+    monkeypatch.setattr("src.utils.cache.get_redis", lambda: redis)
+    monkeypatch.setattr("src.utils.cache.time.sleep", lambda _: None)
+    return redis
+
+
+def test_cached_json_computes_once(fake_redis):
+    """A miss computes and stores the value; later reads hit the cache"""
+    from src.utils.cache import cached_json
+
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return {"total": 3}
+
+    assert cached_json("k", 300, compute) == {"total": 3}
+    assert cached_json("k", 300, compute) == {"total": 3}
+    assert len(calls) == 1
+    assert "k:lock" not in fake_redis.store
+
+
+def test_cached_json_waits_for_lock_holder(fake_redis, monkeypatch):
+    """While another caller holds the lock, its result is used instead of recomputing"""
+    from src.utils.cache import cached_json
+
+    fake_redis.store["k:lock"] = "1"
+    original_get = fake_redis.get
+    reads = []
+
+    def get(key):
+        reads.append(key)
+        if len(reads) > 1:
+            fake_redis.store["k"] = json.dumps({"total": 7})
+        return original_get(key)
+
+    monkeypatch.setattr(fake_redis, "get", get)
+
+    assert cached_json("k", 300, lambda: pytest.fail("should not recompute")) == {"total": 7}
+
+
+def test_cached_json_keeps_value_when_store_fails(fake_redis, monkeypatch):
+    """A failed cache write returns the computed value without computing it again"""
+    from types import SimpleNamespace
+
+    from src.utils.cache import cached_json
+
+    class RedisError(Exception):
+        pass
+
+    monkeypatch.setattr("src.utils.cache.redis", SimpleNamespace(RedisError=RedisError))
+
+    def setex(key, ttl, value):
+        raise RedisError("down")
+
+    monkeypatch.setattr(fake_redis, "setex", setex)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return {"total": 5}
+
+    assert cached_json("k", 300, compute) == {"total": 5}
+    assert len(calls) == 1
+    assert "k:lock" not in fake_redis.store
+
+
+def test_cached_json_leaves_lock_taken_over_by_another_caller(fake_redis):
+    """A holder whose lock expired mid-compute does not delete the new holder's lock"""
+    from src.utils.cache import cached_json
+
+    def compute():
+        fake_redis.store["k:lock"] = "other-token"
+        return {"total": 1}
+
+    assert cached_json("k", 300, compute) == {"total": 1}
+    assert fake_redis.store["k:lock"] == "other-token"
+
+
+def test_foia_statistics_cached_and_invalidated(fake_redis, monkeypatch):
+    """FOIA statistics are served from cache until the import hook invalidates them"""
+    from src.api.property_search import PropertySearchAPI, invalidate_foia_statistics_cache
+
+    api = PropertySearchAPI(supabase_client=object())
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return {"total_parcels": len(calls)}
+
+    monkeypatch.setattr(api, "_compute_foia_statistics", compute)
+
+    assert api.get_foia_statistics()["statistics"] == {"total_parcels": 1}
+    assert api.get_foia_statistics()["statistics"] == {"total_parcels": 1}
+
+    invalidate_foia_statistics_cache()
+    assert api.get_foia_statistics()["statistics"] == {"total_parcels": 2}
@@ -0,0 +1,40 @@
+# tests/unit/test_coordinate_updater.py
+import pandas as pd
+
+
+def test_prepare_coordinate_data_keeps_only_texas_coordinates():
+    from src.services.coordinate_updater import CoordinateUpdater
+
+    df = pd.DataFrame({
+        'PARCEL_ID': ['A1', 'B2', 'C3', 'D4', None],
+        'LAT': ['30.27', '45.0', 'bad', '29.42', '31.0'],
+        'LON': ['-97.74', '-97.74', '-97.74', '-98.49', '-97.0'],
+    })
+    updater = CoordinateUpdater(test_mode=True)
+    coord_cols = updater._find_coordinate_columns(df)
+
+    result = updater._prepare_coordinate_data(df, coord_cols)
+
+    assert result['parcel_number'].tolist() == ['A1', 'D4']
+    assert list(result.columns) == ['parcel_number', 'latitude', 'longitude']
+
+
+def test_run_coordinate_import_prepares_files_in_workers(tmp_path, monkeypatch):
+    from contextlib import nullcontext
+
+    from src.services.coordinate_updater import CoordinateUpdater
+
+    pd.DataFrame({'parcel_number': ['A1', 'A2'], 'latitude': ['30.1', '30.2'], 'longitude': ['-97.1', '-97.2']}) \
+        .to_csv(tmp_path / 'one.csv', index=False)
+    pd.DataFrame({'parcel_number': ['B1'], 'latitude': ['99'], 'longitude': ['-97.1']}) \
+        .to_csv(tmp_path / 'two.csv', index=False)
+
+    updater = CoordinateUpdater(test_mode=True)
+    monkeypatch.setattr(updater, 'get_database_connection', lambda: nullcontext())
+
+    stats = updater.run_coordinate_import(str(tmp_path), max_workers=2)
+
+    assert stats['files_processed'] == 2
+    assert stats['csv_records_loaded'] == 3
+    assert stats['valid_coordinates'] == 2
+    assert stats['errors'] == 0
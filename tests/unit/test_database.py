@@ -0,0 +1,169 @@
+# tests/unit/test_database.py
+import pytest
+
+
+class FakeCursor:
+    def __init__(self):
+        self.executed = []
+        self.rowcount = 0
+        self.description = None
+        self.rows = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, query, params=None):
+        self.executed.append((query, params))
+        self.rowcount = len(params[0]) if params else 0
+
+    def fetchall(self):
+        return self.rows
+
+    def copy_expert(self, query, file):
+        self.executed.append((query, file.read()))
+
+
+class FakeConnection:
+    def __init__(self):
+        self.cursor_obj = FakeCursor()
+        self.committed = False
+        self.rolled_back = False
+
+    def cursor(self, cursor_factory=None):
+        self.cursor_factory = cursor_factory
+        return self.cursor_obj
+
+    def commit(self):
+        self.committed = True
+
+    def rollback(self):
+        self.rolled_back = True
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    """DatabaseManager wired to a fake pooled connection"""
+    from src.utils.database import DatabaseManager
+
+    manager = DatabaseManager()
+    conn = FakeConnection()
+    monkeypatch.setattr(manager, "get_postgres_connection", lambda: conn)
+    monkeypatch.setattr(manager, "return_postgres_connection", lambda _: None)
+    manager.fake_conn = conn
+    return manager
+
+
+def test_bulk_delete_batches_values(manager):
+    """bulk_delete issues one ANY(...) statement per batch and commits once"""
+    deleted = manager.bulk_delete("parcels", "id", ["a", "b", "c", "d", "e"], batch_size=2)
+
+    cursor = manager.fake_conn.cursor_obj
+    assert deleted == 5
+    assert [params for _, params in cursor.executed] == [(["a", "b"],), (["c", "d"],), (["e"],)]
+    assert manager.fake_conn.committed
+
+
+def test_bulk_delete_empty_values_is_noop(manager):
+    """No statement is sent when there is nothing to delete"""
+    assert manager.bulk_delete("parcels", "id", []) == 0
+    assert manager.fake_conn.cursor_obj.executed == []
+
+
+def test_bulk_insert_loads_staging_table_with_copy(manager):
+    """Rows are streamed through COPY in text format, escaping NULLs and tabs"""
+    manager.bulk_insert("parcels", [("A1", None), ("B\t2", "x")], ["parcel_number", "owner_name"])
+
+    copy_query, payload = next(entry for entry in manager.fake_conn.cursor_obj.executed if entry[0].startswith("COPY"))
+    assert copy_query.startswith("COPY _bulk_stage_parcels_")
+    assert copy_query.endswith("(parcel_number, owner_name) FROM STDIN")
+    assert payload == "A1\t\\N\nB\\t2\tx\n"
+    assert manager.fake_conn.committed
+
+
+def test_bulk_insert_creates_staging_table_per_transaction(manager):
+    """Every load creates its temp stage in the same transaction, dropped again at commit"""
+    manager.bulk_insert("parcels", [("A1",)], ["parcel_number"])
+    manager.bulk_insert("parcels", [("B2",)], ["parcel_number"])
+
+    executed = manager.fake_conn.cursor_obj.executed
+    statements = [query.strip().split()[0] for query, _ in executed]
+    assert statements == ["CREATE", "COPY", "INSERT", "CREATE", "COPY", "INSERT"]
+    assert executed[0][0].startswith("CREATE TEMP TABLE IF NOT EXISTS _bulk_stage_parcels_")
+    assert executed[0][0].endswith("ON COMMIT DROP")
+
+
+def test_find_similar_addresses_ranks_in_database(manager, monkeypatch):
+    """The trigram shortlist is one ranked query with the upper-cased term"""
+    calls = []
+    rows = [{"id": "p1", "parcel_number": "A1", "address": "3909 Hulen St", "similarity": 0.8}]
+    monkeypatch.setattr(manager, "execute_query", lambda query, params: calls.append((query, params)) or rows)
+
+    assert manager.find_similar_addresses("3909 hulen st", limit=5) == rows
+
+    query, params = calls[0]
+    assert "upper(address) %% %s" in query
+    assert "ORDER BY similarity DESC" in query
+    assert params == ("3909 HULEN ST", "3909 HULEN ST", 5)
+
+
+def test_execute_query_returns_dict_rows_from_cursor(manager):
+    """Rows come straight from a RealDictCursor instead of being zipped in Python"""
+    from psycopg2.extras import RealDictCursor
+
+    cursor = manager.fake_conn.cursor_obj
+    cursor.description = [("test",)]
+    cursor.rows = [{"test": 1}]
+
+    assert manager.execute_query("SELECT 1 as test") == [{"test": 1}]
+    assert manager.fake_conn.cursor_factory is RealDictCursor
+
+
+def test_session_pins_one_connection_per_thread(monkeypatch):
+    """Inside a session every statement reuses one checkout, returned once on exit"""
+    from src.utils.database import DatabaseManager
+
+    class FakePool:
+        def __init__(self):
+            self.checked_out = 0
+            self.returned = []
+
+        def getconn(self):
+            self.checked_out += 1
+            return FakeConnection()
+
+        def putconn(self, conn):
+            self.returned.append(conn)
+
+    manager = DatabaseManager()
+    pool = manager._pg_pool = FakePool()
+
+    with manager.session() as conn:
+        manager.bulk_delete("parcels", "id", ["a"])
+        manager.bulk_delete("parcels", "id", ["b"])
+        with manager.session() as inner:
+            assert inner is conn
+        assert pool.returned == []
+
+    assert pool.checked_out == 1
+    assert pool.returned == [conn]
+    assert len(conn.cursor_obj.executed) == 2
+
+
+def test_supabase_client_shares_http2_pool(monkeypatch):
+    """The Supabase client is created once, on a shared HTTP/2 httpx client"""
+    import src.utils.database as database
+
+    created = []
+    monkeypatch.setenv("SUPABASE_URL", "https://example.supabase.co")
+    monkeypatch.setenv("SUPABASE_SERVICE_KEY", "service-key")
+    monkeypatch.setattr(database, "create_client", lambda url, key, options: created.append(options) or object())
+
+    manager = database.DatabaseManager()
+    assert manager.get_supabase_client() is manager.get_supabase_client()
+
+    assert len(created) == 1
+    assert created[0].httpx_client is not None
+    created[0].httpx_client.close()
@@ -32,6 +32,37 @@ def test_timer_decorator_with_exception():
         failing_function()
 
 
+def test_timer_disabled_returns_function_unwrapped(monkeypatch):
+    """Without SEEK_TIMING=1 the decorator adds no wrapper at all"""
+    import src.utils.debug as debug
+
+    monkeypatch.setattr(debug, "_DEBUG_TIMING", False)
+
+    def plain():
+        return "success"
+
+    assert debug.timer(plain) is plain
+
+
+def test_timer_enabled_logs_elapsed(monkeypatch, caplog):
+    """With SEEK_TIMING=1 the decorated call is timed and logged"""
+    import logging
+
+    import src.utils.debug as debug
+
+    monkeypatch.setattr(debug, "_DEBUG_TIMING", True)
+
+    @debug.timer
+    def timed():
+        return "success"
+
+    with caplog.at_level(logging.INFO, logger="src.utils.debug"):
+        assert timed() == "success"
+
+    assert timed.__name__ == "timed"
+    assert "timed took" in caplog.text
+
+
 def test_debug_dump():
     """Test debug data dumping functionality"""
     from src.utils.debug import debug_dump
@@ -61,6 +92,21 @@ def test_debug_dump():
     assert loaded_data == test_data
 
 
+def test_debug_dump_handles_numpy_and_non_str_keys():
+    """Numpy values, non-string keys and unknown objects serialize without errors"""
+    import numpy as np
+
+    from src.utils.debug import debug_dump
+
+    debug_dump({'scores': np.array([1, 2]), 3: 'three', 'path': Path('a/b')}, "test_dump_numpy", pretty=True)
+
+    json_files = list(Path("debug_output").glob("test_dump_numpy_*.json"))
+    with open(json_files[-1]) as f:
+        loaded_data = json.load(f)
+
+    assert loaded_data == {'scores': [1, 2], '3': 'three', 'path': 'a/b'}
+
+
 def test_debug_context_success():
     """Test DebugContext for successful operations"""
     from src.utils.debug import DebugContext
@@ -0,0 +1,251 @@
+# tests/unit/test_logger.py
+import json
+import logging
+import os
+
+import pytest
+
+
+@pytest.fixture
+def logger_module(tmp_path, monkeypatch):
+    """src.utils.logger set up inside a temp directory, root logging restored afterwards"""
+    monkeypatch.chdir(tmp_path)
+    root = logging.getLogger()
+    saved_handlers, saved_level = list(root.handlers), root.level
+
+    import src.utils.logger as logger_module
+
+    logger_module.setup_logging("test", level="INFO")
+    yield logger_module
+
+    logger_module.shutdown_logging()
+    root.handlers[:] = saved_handlers
+    root.setLevel(saved_level)
+
+
+def read_log_lines(logger_module, tmp_path):
+    logger_module.shutdown_logging()
+    return [json.loads(line) for line in (tmp_path / "logs" / "test.log").read_text().splitlines()]
+
+
+def test_structlog_events_written_as_json_lines(logger_module, tmp_path):
+    """Events are rendered to JSON by orjson and filtered by level before any work"""
+    log = logger_module.get_logger("unit")
+    log.info("import_started", total_records=3)
+    log.debug("too_verbose")
+
+    lines = read_log_lines(logger_module, tmp_path)
+    assert len(lines) == 1
+    assert lines[0]["event"] == "import_started"
+    assert lines[0]["logger"] == "seek.unit"
+    assert lines[0]["level"] == "info"
+    assert lines[0]["total_records"] == 3
+
+
+def test_operation_logger_skips_filtered_levels(logger_module, tmp_path, monkeypatch):
+    """Calls below the current level return before reaching the bound logger"""
+    calls = []
+
+    class SpyLogger:
+        def info(self, event, **kwargs):
+            calls.append(event)
+
+    op_logger = logger_module.OperationLogger("unit", session_id="s1")
+    monkeypatch.setattr(op_logger, "_bound_logger", SpyLogger())
+
+    logger_module.set_level("WARNING")
+    op_logger.info("filtered")
+    logger_module.set_level("INFO")
+    op_logger.info("kept")
+
+    assert calls == ["kept"]
+
+
+def test_log_performance_adds_process_info(logger_module, tmp_path):
+    """Decorated calls log their timing along with the cached pid and hostname"""
+    import os
+
+    @logger_module.log_performance("unit")
+    def work():
+        return 2
+
+    assert work() == 2
+
+    line = read_log_lines(logger_module, tmp_path)[-1]
+    assert line["event"] == "function_completed"
+    assert line["function"] == "work"
+    assert isinstance(line["execution_time_ms"], int)
+    assert line["pid"] == os.getpid()
+    assert line["hostname"]
+
+
+def test_log_file_writes_are_buffered_between_flushes(logger_module, tmp_path):
+    """Lines are coalesced in the file buffer and hit disk once a flush interval passes"""
+    import time
+
+    path = tmp_path / "buffered.log"
+    handler = logger_module.BytesRotatingFileHandler(str(path))
+    handler.write_line(b"first")
+    handler.write_line(b"second")
+    assert path.read_bytes() == b""
+
+    time.sleep(logger_module.LOG_FLUSH_SECONDS)
+    handler.write_line(b"third")
+    assert path.read_bytes() == b"first\nsecond\nthird\n"
+
+    handler.close()
+
+
+def test_log_file_rotates_at_max_bytes(logger_module, tmp_path):
+    """A line that would overflow max_bytes rolls the file over to a numbered backup first"""
+    path = tmp_path / "rotating.log"
+    handler = logger_module.BytesRotatingFileHandler(str(path), max_bytes=10, backup_count=1)
+    handler.write_line(b"12345678")
+    handler.write_line(b"abc")
+    handler.close()
+
+    assert (tmp_path / "rotating.log.1").read_bytes() == b"12345678\n"
+    assert path.read_bytes() == b"abc\n"
+
+
+def test_operation_logger_bind_layers_context(logger_module, tmp_path):
+    """bind() stacks context lazily; the event carries the merged context, child values winning"""
+    op_logger = logger_module.OperationLogger("unit", session_id="s1", step="load")
+    step_logger = op_logger.bind(step="normalize", batch=2)
+
+    assert op_logger.context == {"session_id": "s1", "step": "load"}
+    step_logger.info("step_done")
+
+    line = read_log_lines(logger_module, tmp_path)[-1]
+    assert (line["session_id"], line["step"], line["batch"]) == ("s1", "normalize", 2)
+
+
+def test_cached_timestamper_reuses_string_within_millisecond(logger_module, monkeypatch):
+    """Records in the same millisecond share one formatted timestamp"""
+    monkeypatch.setattr(logger_module, "time_ns", lambda: 1_700_000_000_123_456_789)
+    first = logger_module.cached_timestamper(None, "info", {})["timestamp"]
+    monkeypatch.setattr(logger_module, "time_ns", lambda: 1_700_000_000_123_999_999)
+    second = logger_module.cached_timestamper(None, "info", {})["timestamp"]
+
+    assert first == "2023-11-14T22:13:20.123Z"
+    assert second is first
+
+
+def test_log_helpers_emit_operation_fields(logger_module, tmp_path):
+    """Helpers emit their event along with the constant operation field"""
+    log = logger_module.get_logger("unit")
+    logger_module.log_import_progress(log, processed=250, total=1000, success=245, errors=5)
+    logger_module.log_address_match(log, "3909 HULEN ST", "3909 HULEN STREET", 0.9512, "fuzzy")
+
+    progress, match = read_log_lines(logger_module, tmp_path)[-2:]
+    assert (progress["event"], progress["operation"], progress["progress_percent"]) == \
+        ("import_progress", "data_import", 25.0)
+    assert (match["event"], match["operation"], match["confidence_score"]) == \
+        ("address_matched", "address_matching", 0.951)
+
+
+def test_log_import_progress_with_precomputed_scale(logger_module, tmp_path):
+    """A precomputed inv_total gives the same percent as the per-call division"""
+    log = logger_module.get_logger("unit")
+    inv_total = logger_module.progress_scale(3)
+    logger_module.log_import_progress(log, processed=1, total=3, success=1, errors=0, inv_total=inv_total)
+    logger_module.log_import_progress(log, processed=1, total=3, success=1, errors=0)
+    logger_module.log_import_progress(log, processed=0, total=0, success=0, errors=0)
+
+    percents = [line["progress_percent"] for line in read_log_lines(logger_module, tmp_path)[-3:]]
+    assert percents == [33.3, 33.3, 0.0]
+
+
+def test_import_has_no_logging_side_effects(tmp_path):
+    """Importing the module leaves the filesystem alone; the first get_logger sets up defaults"""
+    import subprocess
+    import sys
+    from pathlib import Path
+
+    repo_root = Path(__file__).resolve().parents[2]
+    script = (
+        "import os, src.utils.logger as lg\n"
+        "assert not os.path.exists('logs')\n"
+        "lg.get_logger('unit').info('first_event')\n"
+        "lg.shutdown_logging()\n"
+        "assert os.path.exists('logs/seek.log')\n"
+    )
+    # Fixed argv: this interpreter running the literal script above
+    subprocess.run(  # noqa: S603
+        [sys.executable, "-c", script], cwd=tmp_path, check=True, env={**os.environ, "PYTHONPATH": str(repo_root)}
+    )
+
+
+def test_loggers_follow_later_setup_logging_level(logger_module, tmp_path):
+    """Loggers obtained before setup_logging is called again use the new level"""
+    mod = logger_module.get_logger("mod")
+    op_logger = logger_module.OperationLogger("mod", session_id="s1")
+
+    @logger_module.log_performance("mod")
+    def work():
+        return 1
+
+    logger_module.setup_logging("test", level="DEBUG")
+    mod.debug("mod_debug")
+    op_logger.debug("op_debug")
+    logger_module.setup_logging("test", level="WARNING")
+    mod.info("mod_info")
+    work()
+
+    events = [line["event"] for line in read_log_lines(logger_module, tmp_path)]
+    assert events == ["mod_debug", "op_debug"]
+
+
+def test_set_level_can_lower_threshold(logger_module, tmp_path):
+    """set_level("DEBUG") after an INFO setup lets structlog and stdlib debug records through"""
+    mod = logger_module.get_logger("mod")
+    logger_module.set_level("DEBUG")
+    mod.debug("structlog_debug")
+    logging.getLogger("stdlib.unit").debug("stdlib_debug")
+
+    logger_module.shutdown_logging()
+    text = (tmp_path / "logs" / "test.log").read_text()
+    assert '"event":"structlog_debug"' in text
+    assert "stdlib_debug" in text
+
+
+def test_forked_child_writes_log_file_directly(logger_module, tmp_path):
+    """A forked worker's lines reach the file although the writer thread stays in the parent"""
+    log = logger_module.get_logger("unit")
+    log.info("parent_before_fork")
+
+    pid = os.fork()
+    if pid == 0:
+        log.info("child_event")
+        logging.getLogger("stdlib.unit").info("child_stdlib")
+        os._exit(0)
+    os.waitpid(pid, 0)
+
+    logger_module.shutdown_logging()
+    lines = (tmp_path / "logs" / "test.log").read_text().splitlines()
+    child = [json.loads(line) for line in lines if '"child_event"' in line]
+    assert [line["pid"] for line in child] == [pid]
+    assert sum("parent_before_fork" in line for line in lines) == 1
+    assert any("child_stdlib" in line for line in lines)
+
+
+def test_log_helpers_accept_operation_logger(logger_module, tmp_path):
+    """The dict-based helpers work with an OperationLogger as well as a structlog logger"""
+    op_logger = logger_module.OperationLogger("unit", session_id="s1")
+    logger_module.log_import_progress(op_logger, processed=1, total=2, success=1, errors=0)
+
+    line = read_log_lines(logger_module, tmp_path)[-1]
+    assert (line["event"], line["session_id"], line["progress_percent"]) == ("import_progress", "s1", 50.0)
+
+
+def test_lazy_default_keeps_host_root_handlers(logger_module, monkeypatch):
+    """The first get_logger leaves handlers the host application installed on the root logger"""
+    monkeypatch.setattr(logger_module, "_configured", False)
+    root = logging.getLogger()
+    host_handler = logging.NullHandler()
+    root.handlers[:] = [host_handler]
+
+    logger_module.get_logger("unit")
+
+    assert root.handlers == [host_handler]
+    assert logger_module._configured
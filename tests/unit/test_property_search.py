@@ -0,0 +1,386 @@
+# tests/unit/test_property_search.py
+import pytest
+from postgrest.exceptions import APIError
+
+
+class FakeResponse:
+    def __init__(self, data, count=None):
+        self.data = data
+        self.count = count
+
+
+class FakeQuery:
+    """Records every builder call so tests can assert on the generated query"""
+
+    def __init__(self, data=None, count=None):
+        self.calls = []
+        self._data = data if data is not None else []
+        self._count = count
+
+    def __getattr__(self, name):
+        def method(*args, **kwargs):
+            self.calls.append((name, args, kwargs))
+            return self
+
+        return method
+
+    @property
+    def not_(self):
+        self.calls.append(("not_", (), {}))
+        return self
+
+    def execute(self):
+        return FakeResponse(self._data, self._count)
+
+    def called(self, name):
+        return [call for call in self.calls if call[0] == name]
+
+
+class FakeClient:
+    def __init__(self, data=None, count=None):
+        self.query = FakeQuery(data, count)
+        self.tables = []
+        self.rpcs = []
+
+    def rpc(self, name, params=None, count=None):
+        self.rpcs.append((name, params))
+        return self.query
+
+    def table(self, name):
+        self.tables.append(name)
+        return self.query
+
+    def __getattr__(self, name):
+        if name == "from":
+            return self.table
+        raise AttributeError(name)
+
+
+class NoSearchRpcClient(FakeClient):
+    """Database without search_parcels(), forcing the chained PostgREST fallback"""
+
+    def rpc(self, name, params=None, count=None):
+        if name == "search_parcels":
+            raise APIError({"code": "PGRST202", "message": "Could not find the function"})
+        return super().rpc(name, params, count)
+
+
+@pytest.fixture
+def rows():
+    return [{"id": f"00000000-0000-0000-0000-00000000000{i}", "address": f"{i} Main St"} for i in range(3)]
+
+
+def test_first_page_uses_offset_and_returns_cursor(rows):
+    """A full first page is fetched with range() and hands back a cursor to its last id"""
+    from src.api.property_search import PropertySearchAPI, decode_cursor
+
+    client = NoSearchRpcClient(rows)
+    response = PropertySearchAPI(client).search_properties({"city_name": "Austin", "limit": 3})
+
+    assert response["success"]
+    assert client.query.called("range") == [("range", (0, 2), {})]
+    assert decode_cursor(response["next_cursor"]) == rows[-1]["id"]
+
+
+def test_cursor_switches_to_keyset_pagination(rows):
+    """Following next_cursor filters on id instead of using OFFSET"""
+    from src.api.property_search import PropertySearchAPI, encode_cursor
+
+    client = NoSearchRpcClient(rows[:1])
+    response = PropertySearchAPI(client).search_properties({"cursor": encode_cursor(rows[0]["id"]), "limit": 3})
+
+    assert response["success"]
+    assert client.query.called("gt") == [("gt", ("id", rows[0]["id"]), {})]
+    assert client.query.called("range") == []
+    assert response["next_cursor"] is None  # short page means no more rows
+
+
+def test_search_runs_as_single_rpc():
+    """Non-spatial searches send every filter to search_parcels in one call"""
+    from src.api.property_search import PropertySearchAPI
+
+    client = FakeClient()
+    response = PropertySearchAPI(client).search_properties({"city_name": "Austin", "fire_sprinklers": True})
+
+    assert response["success"]
+    assert client.tables == []
+    assert client.rpcs == [
+        ("search_parcels", {"filters": {"city_name": "Austin", "fire_sprinklers": True}, "lim": 50, "off": 0})
+    ]
+
+
+def test_deep_offset_page_still_works(caplog):
+    """Pages beyond DEEP_OFFSET_PAGES are served with a warning pointing at the cursor"""
+    from src.api.property_search import DEEP_OFFSET_PAGES, PropertySearchAPI
+
+    client = FakeClient()
+    response = PropertySearchAPI(client).search_properties({"page": DEEP_OFFSET_PAGES + 1, "limit": 10})
+
+    assert response["success"]
+    assert client.rpcs[0][1]["off"] == DEEP_OFFSET_PAGES * 10
+    assert "next_cursor" in caplog.text
+
+
+def test_malformed_cursor_is_rejected():
+    """Garbage cursors fail validation rather than reaching the database"""
+    from src.api.property_search import PropertySearchAPI
+
+    response = PropertySearchAPI(FakeClient()).search_properties({"cursor": "%%%not-base64"})
+
+    assert not response["success"]
+    assert "cursor" in response["error"]
+
+
+def test_radius_search_uses_spatial_rpc():
+    """Radius criteria go through the ST_DWithin RPC with the radius in metres"""
+    from src.api.property_search import PropertySearchAPI
+
+    client = FakeClient()
+    response = PropertySearchAPI(client).spatial_radius_search(29.42, -98.49, 2.5, fire_sprinklers=True)
+
+    assert response["success"]
+    assert client.tables == []
+    name, params = client.rpcs[0]
+    assert name == "search_parcels_radius"
+    assert params["radius_m"] == 2500
+    assert params["filters"] == {"fire_sprinklers": True}
+    assert params["off"] == 0
+
+
+def test_radius_search_passes_enclosing_bounding_box():
+    """The RPC receives a lat/lng box that encloses the whole search radius"""
+    from src.api.property_search import PropertySearchAPI
+
+    client = FakeClient()
+    PropertySearchAPI(client).spatial_radius_search(29.42, -98.49, 11.1)
+
+    params = client.rpcs[0][1]
+    assert params["min_lat"] == pytest.approx(29.32)
+    assert params["max_lat"] == pytest.approx(29.52)
+    # Longitude degrees shrink with latitude, so the box is wider east-west
+    assert params["max_lng"] - params["min_lng"] > params["max_lat"] - params["min_lat"]
+
+
+def test_api_reuses_process_wide_client(monkeypatch):
+    """Instances created without a client share one lazily built singleton"""
+    from src.api import property_search
+
+    created = []
+
+    def fake_create_client(url, key, options=None):
+        created.append(options)
+        return FakeClient()
+
+    monkeypatch.setattr(property_search, "_client", None)
+    monkeypatch.setattr(property_search, "create_client", fake_create_client)
+    monkeypatch.setenv("SUPABASE_URL", "https://example.supabase.co")
+    monkeypatch.setenv("SUPABASE_SERVICE_KEY", "test-key")
+
+    first = property_search.PropertySearchAPI()
+    second = property_search.PropertySearchAPI()
+
+    assert first.client is second.client
+    assert len(created) == 1
+    assert created[0].httpx_client is not None
+
+
+def test_total_count_is_opt_in(rows):
+    """No count is requested by default; include_total asks the fallback query for an exact count"""
+    from src.api.property_search import PropertySearchAPI
+
+    client = NoSearchRpcClient(rows, count=1234)
+    response = PropertySearchAPI(client).search_properties({"limit": 10})
+
+    assert response["total_count"] is None
+    assert client.query.called("select")[0][2]["count"] is None
+
+    client = NoSearchRpcClient(rows, count=1234)
+    response = PropertySearchAPI(client).search_properties({"limit": 10, "include_total": True})
+
+    assert response["total_count"] == 1234
+    assert client.query.called("select")[0][2]["count"] == "exact"
+
+
+def test_total_count_comes_from_count_rpc(rows):
+    """RPC searches get their total from the companion count function, not the paged result"""
+    from src.api.property_search import PropertySearchAPI
+
+    class CountingClient(FakeClient):
+        def rpc(self, name, params=None, count=None):
+            self.rpcs.append((name, params))
+            return FakeQuery(1234 if name.endswith("_count") else rows)
+
+    client = CountingClient()
+    response = PropertySearchAPI(client).search_properties({"city_name": "Austin", "include_total": True})
+
+    assert response["total_count"] == 1234
+    assert client.rpcs[1] == ("search_parcels_count", {"filters": {"city_name": "Austin"}})
+
+    client = CountingClient()
+    response = PropertySearchAPI(client).search_properties(
+        {"center_lat": 29.4, "center_lng": -98.5, "radius_km": 1, "include_total": True}
+    )
+
+    assert response["total_count"] == 1234
+    assert client.rpcs[1][0] == "search_parcels_radius_count"
+    assert "lim" not in client.rpcs[1][1]
+
+
+def test_foia_statistics_use_single_rpc(monkeypatch):
+    """Coverage counts come from one foia_coverage_stats call, not a query per column"""
+    from src.api.property_search import PropertySearchAPI
+
+    monkeypatch.setattr("src.utils.cache.get_redis", lambda: None)
+    counts = {"total": 200, "fire_sprinklers": 50, "zoned_by_right": 20, "occupancy_class": 0}
+    client = FakeClient(counts)
+
+    response = PropertySearchAPI(client).get_foia_statistics()
+
+    assert response["success"]
+    assert [name for name, _ in client.rpcs] == ["foia_coverage_stats"]
+    assert client.tables == []
+    stats = response["statistics"]
+    assert stats["total_parcels"] == 200
+    assert stats["fire_sprinklers_coverage"] == {"count": 50, "percentage": 25.0}
+    assert stats["occupancy_coverage"]["percentage"] == 0
+
+
+def test_occupancy_filter_escapes_like_wildcards():
+    """Wildcards typed by the user are matched literally inside the substring pattern"""
+    from src.api.property_search import PropertySearchAPI
+
+    client = NoSearchRpcClient()
+    PropertySearchAPI(client).search_properties({"occupancy_class": "100%_A"})
+
+    assert client.query.called("ilike")[0][1] == ("occupancy_class", "%100\\%\\_A%")
+
+
+def test_iter_properties_follows_cursor_until_short_page():
+    """Rows are yielded page by page, each page fetched after the previous last id"""
+    from src.api.property_search import PropertySearchAPI
+
+    pages = [[{"id": "a"}, {"id": "b"}], [{"id": "c"}, {"id": "d"}], [{"id": "e"}]]
+
+    class PagedClient(FakeClient):
+        def rpc(self, name, params=None, count=None):
+            if name.endswith("_count"):
+                return FakeQuery(3)
+            self.rpcs.append((name, params))
+            return FakeQuery(pages[len(self.rpcs) - 1])
+
+    client = PagedClient()
+    rows = PropertySearchAPI(client).iter_properties({"city_name": "Austin", "limit": 2, "page": 5})
+
+    assert [row["id"] for row in rows] == ["a", "b", "c", "d", "e"]
+    assert client.rpcs[0][1]["off"] == 0
+    assert [params["cur"] for _, params in client.rpcs[1:]] == ["b", "d"]
+
+
+def test_validate_criteria_trims_and_clamps():
+    """Strings are trimmed and capped, numbers clamped, and junk values dropped"""
+    from src.api.property_search import MAX_STRING_LENGTH, PropertySearchAPI
+
+    validated = PropertySearchAPI(FakeClient())._validate_search_criteria(
+        {"city_name": "  Austin ", "county_name": "x" * 500, "occupancy_class": "   ", "radius_km": 500, "min_value": "abc"}
+    )
+
+    assert validated["city_name"] == "Austin"
+    assert len(validated["county_name"]) == MAX_STRING_LENGTH
+    assert "occupancy_class" not in validated
+    assert validated["radius_km"] == 100.0
+    assert "min_value" not in validated
+
+
+def test_utc_timestamp_keeps_microseconds(monkeypatch):
+    """Response timestamps are formatted per call with sub-second precision"""
+    from datetime import UTC, datetime
+
+    from src.api import property_search
+
+    class FixedDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return datetime(2023, 11, 14, 22, 13, 20, 123456, tzinfo=tz)
+
+    monkeypatch.setattr(property_search, "datetime", FixedDatetime)
+
+    assert property_search.utc_timestamp() == "2023-11-14T22:13:20.123456+00:00"
+    assert datetime.fromisoformat(property_search.utc_timestamp()).tzinfo == UTC
+
+
+def test_validate_criteria_batch_clips_columns():
+    """Numeric criteria columns are clipped to their bounds and junk becomes NaN"""
+    import pandas as pd
+
+    from src.api.property_search import validate_criteria_batch
+
+    df = pd.DataFrame({"radius_km": [0.0, 5, 500], "min_value": [-1, "abc", 2e9], "city_name": ["a", "b", "c"]})
+    out = validate_criteria_batch(df)
+
+    assert out["radius_km"].tolist() == [0.1, 5.0, 100.0]
+    assert out["min_value"][0] == 0
+    assert pd.isna(out["min_value"][1])
+    assert out["min_value"][2] == 1e9
+    assert out["city_name"].tolist() == ["a", "b", "c"]
+    assert df["radius_km"].tolist() == [0.0, 5, 500]
+
+
+def test_next_page_is_prefetched():
+    """With prefetching on, the cursor request is served by the background query"""
+    from src.api.property_search import PropertySearchAPI
+
+    pages = [[{"id": "a"}, {"id": "b"}], [{"id": "c"}]]
+
+    class PagedClient(FakeClient):
+        def rpc(self, name, params=None, count=None):
+            if name.endswith("_count"):
+                return FakeQuery(3)
+            self.rpcs.append((name, params))
+            return FakeQuery(pages[len(self.rpcs) - 1])
+
+    client = PagedClient()
+    api = PropertySearchAPI(client, prefetch_next_page=True)
+    first = api.search_properties({"city_name": "Austin", "limit": 2, "include_total": True})
+    second = api.search_properties({"city_name": "Austin", "limit": 2, "cursor": first["next_cursor"]})
+
+    assert [row["id"] for row in second["properties"]] == ["c"]
+    assert second["next_cursor"] is None
+    assert len(client.rpcs) == 2
+
+
+def test_prefetch_executor_starts_on_first_prefetch(monkeypatch):
+    """Importing the API starts no threads; the prefetch pool is created once when first needed"""
+    from src.api import property_search
+
+    monkeypatch.setattr(property_search, "_prefetch_executor", None)
+    registered = []
+    monkeypatch.setattr(property_search.atexit, "register", lambda fn, **kw: registered.append(fn))
+
+    executor = property_search._get_prefetch_executor()
+    try:
+        assert property_search._get_prefetch_executor() is executor
+        assert registered == [executor.shutdown]
+    finally:
+        executor.shutdown()
+
+
+def test_foia_statistics_fall_back_to_narrow_counts(monkeypatch):
+    """Without the RPC deployed, coverage is counted with single-column head queries"""
+    from postgrest.exceptions import APIError
+
+    from src.api.property_search import PropertySearchAPI
+
+    monkeypatch.setattr("src.utils.cache.get_redis", lambda: None)
+
+    class NoRpcClient(FakeClient):
+        def rpc(self, name, params=None, count=None):
+            raise APIError({"code": "PGRST202", "message": "Could not find the function"})
+
+    client = NoRpcClient(count=40)
+    response = PropertySearchAPI(client).get_foia_statistics()
+
+    assert response["statistics"]["total_parcels"] == 40
+    assert response["statistics"]["zoning_coverage"] == {"count": 40, "percentage": 100.0}
+    selects = client.query.called("select")
+    assert sorted(args[0] for _, args, _ in selects) == ["fire_sprinklers", "id", "occupancy_class", "zoned_by_right"]
+    assert all(kwargs == {"count": "exact", "head": True} for _, _, kwargs in selects)
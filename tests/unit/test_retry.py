@@ -0,0 +1,110 @@
+# tests/unit/test_retry.py
+import httpx
+import pytest
+from postgrest.exceptions import APIError
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    """Skip real backoff delays"""
+    monkeypatch.setattr("src.utils.retry.time.sleep", lambda _: None)
+
+
+def test_retry_db_recovers_from_transient_error():
+    """Transient transport errors are retried until the call succeeds"""
+    from src.utils.retry import retry_db
+
+    calls = []
+
+    @retry_db
+    def flaky():
+        calls.append(1)
+        if len(calls) < 3:
+            raise httpx.ConnectError("connection reset")
+        return "ok"
+
+    assert flaky() == "ok"
+    assert len(calls) == 3
+
+
+def test_retry_db_gives_up_after_max_retries():
+    """The last transient error is re-raised once retries are exhausted"""
+    from src.utils.retry import retry_db
+
+    calls = []
+
+    @retry_db(max_retries=2)
+    def always_rate_limited():
+        calls.append(1)
+        raise APIError({"message": "Too many requests", "code": "429"})
+
+    with pytest.raises(APIError):
+        always_rate_limited()
+    assert len(calls) == 3
+
+
+def test_retry_db_does_not_retry_permanent_error():
+    """Non-transient errors such as bad queries fail immediately"""
+    from src.utils.retry import retry_db
+
+    calls = []
+
+    @retry_db
+    def bad_query():
+        calls.append(1)
+        raise APIError({"message": "column does not exist", "code": "42703"})
+
+    with pytest.raises(APIError):
+        bad_query()
+    assert len(calls) == 1
+
+
+def test_exec_with_retry_calls_execute():
+    """exec_with_retry runs the builder's execute() through the retry loop"""
+    from src.utils.retry import exec_with_retry
+
+    class FakeQuery:
+        attempts = 0
+
+        def execute(self):
+            self.attempts += 1
+            if self.attempts == 1:
+                raise httpx.ReadTimeout("timed out")
+            return {"data": [1]}
+
+    query = FakeQuery()
+    assert exec_with_retry(query) == {"data": [1]}
+    assert query.attempts == 2
+
+
+def test_backoff_delay_is_capped():
+    """Backoff grows exponentially but never exceeds cap plus jitter"""
+    from src.utils.retry import backoff_delay
+
+    assert backoff_delay(0, base=0.2, cap=5.0) < 0.2 + 0.05 + 1e-9
+    assert backoff_delay(10, base=0.2, cap=5.0) <= 5.0 + 0.05
+
+
+def test_aexec_with_retry_recovers_from_transient_error(monkeypatch):
+    """The async helper retries transient errors the same way"""
+    import asyncio
+
+    from src.utils.retry import aexec_with_retry
+
+    async def no_async_sleep(_):
+        return None
+
+    monkeypatch.setattr("src.utils.retry.asyncio.sleep", no_async_sleep)
+
+    class FakeAsyncQuery:
+        attempts = 0
+
+        async def execute(self):
+            self.attempts += 1
+            if self.attempts == 1:
+                raise APIError({"message": "Service unavailable", "code": "503"})
+            return "ok"
+
+    query = FakeAsyncQuery()
+    assert asyncio.run(aexec_with_retry(query)) == "ok"
+    assert query.attempts == 2
@@ -0,0 +1,88 @@
+# tests/unit/test_schemas.py
+import pytest
+from pydantic import ValidationError
+
+
+def test_parcel_normalizes_number_and_address():
+    """Parcel numbers are upper-cased and addresses trimmed"""
+    from src.models.schemas import Parcel
+
+    parcel = Parcel(parcel_number="ab-12_3", address="  123 Main St ", latitude=30.27, longitude=-97.74)
+
+    assert parcel.parcel_number == "AB-12_3"
+    assert parcel.address == "123 Main St"
+
+
+@pytest.mark.parametrize(
+    "fields",
+    [
+        {"parcel_number": "AB 123", "address": "123 Main St"},
+        {"parcel_number": "AB123", "address": "Main Street"},
+        {"parcel_number": "AB123", "address": "123 Main St", "latitude": 30.27},
+    ],
+)
+def test_parcel_rejects_invalid_fields(fields):
+    """Bad parcel numbers, addresses without a number and half coordinates are rejected"""
+    from src.models.schemas import Parcel
+
+    with pytest.raises(ValidationError):
+        Parcel(**fields)
+
+
+def test_status_patterns():
+    """Status strings must be one of the allowed values"""
+    from src.models.schemas import FOIAUpdate
+
+    assert FOIAUpdate(import_session_id="s1", source_address="1 Elm St", status="pending").status == "pending"
+    with pytest.raises(ValidationError):
+        FOIAUpdate(import_session_id="s1", source_address="1 Elm St", status="done")
+
+
+def test_search_criteria_swaps_value_range():
+    """A reversed min/max value range is swapped rather than rejected"""
+    from src.models.schemas import PropertySearchCriteria
+
+    criteria = PropertySearchCriteria(min_value=500000, max_value=100000)
+
+    assert (criteria.min_value, criteria.max_value) == (100000, 500000)
+
+
+def test_search_criteria_accepts_cursor_or_deep_page():
+    """A cursor can be passed instead of a page, and offset pages are not capped"""
+    from src.models.schemas import PropertySearchCriteria
+
+    assert PropertySearchCriteria(cursor="MTIz").cursor == "MTIz"
+    assert PropertySearchCriteria(page=50).page == 50
+
+
+def test_search_result_passes_rows_through():
+    """Search rows are attached as-is, including the nested city/county embeds"""
+    from src.models.schemas import PropertySearchCriteria, PropertySearchResult
+
+    row = {"id": "p1", "parcel_number": "X", "address": "no number", "cities": {"name": "Austin"}}
+    result = PropertySearchResult(
+        success=True,
+        properties=[row],
+        count=1,
+        limit=50,
+        next_cursor="cDE=",
+        criteria=PropertySearchCriteria(),
+        timestamp="2025-01-01T00:00:00",
+    )
+
+    assert result.properties[0] == row
+
+
+def test_validate_foia_updates_batch():
+    """A batch validates in one call and reports the index of each bad row"""
+    from src.models.schemas import FOIAUpdate, validate_foia_updates
+
+    rows = [{"import_session_id": "s1", "source_address": f"{i} Elm St", "status": "pending"} for i in range(3)]
+    updates = validate_foia_updates(rows)
+
+    assert all(isinstance(u, FOIAUpdate) for u in updates)
+
+    rows[1]["status"] = "bogus"
+    with pytest.raises(ValidationError) as excinfo:
+        validate_foia_updates(rows)
+    assert excinfo.value.errors()[0]["loc"][:2] == (1, "status")